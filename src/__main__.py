@@ -0,0 +1,7 @@
+"""Advent of Code 2023 - Entry point for running the day tasks with python -m src"""
+
+import sys
+
+from .runner import main
+
+sys.exit(main())
@@ -0,0 +1,178 @@
+"""Advent of Code 2023 - Batch mode solving one day across a directory of inputs
+
+The inputs are spread over a process pool whose workers import the day once and stay warm, so
+module level caches are reused from one input to the next. Results are streamed back as each
+input finishes, followed by the total throughput.
+
+Usage: python -m src.batch day directory [--part 1] [--workers 4]
+"""
+
+import argparse
+import concurrent.futures
+import os
+import time
+from typing import Iterator, TypedDict
+
+from . import registry, util
+
+FileResult = TypedDict(
+    "FileResult",
+    {
+        "file": str,
+        "results": dict[str, int],
+        "error": str | None,
+        "wall_time": float,
+    },
+)
+
+
+def list_inputs(directory: str) -> list[str]:
+    """
+    Find the input files of a directory.
+
+    Args:
+        directory (str): The directory holding one input per file.
+
+    Returns:
+        list[str]: The sorted paths of the regular files of the directory.
+    """
+    return sorted(entry.path for entry in os.scandir(directory) if entry.is_file())
+
+
+def warm_up(day: str) -> None:
+    """
+    Import a day in a worker before it receives its first input.
+
+    Args:
+        day (str): The module name of the day.
+    """
+    registry.load(day)
+
+
+def solve_file(day: str, file_path: str, parts: tuple[str, ...]) -> FileResult:
+    """
+    Solve the parts of a day for a single input file.
+
+    A day that exposes a solve step answers all of its parts in one pass over the streamed
+    input, and a day that exposes a parse step parses the input once for all of its parts.
+
+    Args:
+        day (str): The module name of the day.
+        file_path (str): The path of the input file.
+        parts (tuple[str, ...]): The part function names to run.
+
+    Returns:
+        FileResult: The result of every part that the day implements.
+    """
+    module = registry.load(day)
+    start = time.perf_counter()
+    results: dict[str, int] = {}
+    implemented = [part for part in parts if hasattr(module, part)]
+    if hasattr(module, "solve") and len(implemented) > 1:
+        results = dict(zip(registry.PARTS, module.solve(util.iter_lines(file_path))))
+    elif hasattr(module, "parse"):
+        parsed = util.parse_file(module, file_path)
+        for part in implemented:
+            results[part] = getattr(module, part + "_parsed")(parsed)
+    else:
+        lines = util.read_lines(file_path)
+        for part in implemented:
+            results[part] = getattr(module, part)(list(lines))
+    return {
+        "file": file_path,
+        "results": results,
+        "error": None,
+        "wall_time": time.perf_counter() - start,
+    }
+
+
+def run_batch(
+    day: str, file_paths: list[str], parts: tuple[str, ...], workers: int | None
+) -> Iterator[FileResult]:
+    """
+    Solve a day for many input files in a pool of warm workers and yield results as they finish.
+
+    An input that makes the day raise is reported with its error instead of stopping the batch.
+
+    Args:
+        day (str): The module name of the day.
+        file_paths (list[str]): The paths of the input files.
+        parts (tuple[str, ...]): The part function names to run.
+        workers (int | None): The number of worker processes, or None for one per core.
+
+    Yields:
+        FileResult: The result of each finished input.
+    """
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers, initializer=warm_up, initargs=(day,)
+    ) as executor:
+        futures = {
+            executor.submit(solve_file, day, file_path, parts): file_path
+            for file_path in file_paths
+        }
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                yield future.result()
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                yield {
+                    "file": futures[future],
+                    "results": {},
+                    "error": repr(error),
+                    "wall_time": 0.0,
+                }
+
+
+def format_file_result(result: FileResult) -> str:
+    """
+    Format the result of an input as a single report line.
+
+    Args:
+        result (FileResult): The result to format.
+
+    Returns:
+        str: The report line.
+    """
+    if result["error"] is not None:
+        outcome = "error " + result["error"]
+    else:
+        outcome = "  ".join(f"{part} {value}" for part, value in result["results"].items())
+    return f"{os.path.basename(result['file'])}  wall {result['wall_time']:9.3f}s  {outcome}"
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Solve a day for every input of a directory and print a report line per input.
+
+    Args:
+        argv (list[str] | None): The command line arguments, defaults to sys.argv.
+
+    Returns:
+        int: The exit code, non-zero if any input failed.
+    """
+    parser = argparse.ArgumentParser(prog="python -m src.batch", description=__doc__)
+    parser.add_argument("day", help="day to run, e.g. 5 or day05")
+    parser.add_argument("directory", help="directory holding one input per file")
+    parser.add_argument("--part", type=int, choices=(1, 2), help="run only the given part")
+    parser.add_argument("--workers", type=int, help="number of worker processes")
+    args = parser.parse_args(argv)
+
+    day = registry.resolve_day(args.day)
+    parts = registry.PARTS if args.part is None else (registry.PARTS[args.part - 1],)
+    file_paths = list_inputs(args.directory)
+
+    failed = False
+    wall_start = time.perf_counter()
+    for result in run_batch(day, file_paths, parts, args.workers):
+        failed = failed or result["error"] is not None
+        print(format_file_result(result), flush=True)
+    wall_time = time.perf_counter() - wall_start
+    size = sum(os.path.getsize(file_path) for file_path in file_paths)
+    print(
+        f"{len(file_paths)} files, {size / 1024 / 1024:.2f} MiB in {wall_time:.3f}s: "
+        f"{len(file_paths) / wall_time:.1f} files/s, {size / 1024 / 1024 / wall_time:.2f} MiB/s"
+    )
+    return int(failed)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,168 @@
+"""Advent of Code 2023 - Time budgets and progress reports for long running parts
+
+A part runs inside limit() with an optional budget in seconds. Long loops call checkpoint()
+with the iterations done so far: this records their progress, stops the part once its budget
+is spent and, when a report interval is configured, prints the progress with the current rate
+and the estimated time left. Parts without checkpoints are stopped by an alarm at the deadline.
+"""
+
+import contextlib
+import math
+import signal
+import sys
+import threading
+import time
+from types import FrameType
+from typing import Iterator, TypedDict
+
+Progress = TypedDict(
+    "Progress",
+    {"title": str, "label": str, "done": int, "total": int | None, "elapsed": float},
+)
+
+
+class BudgetExceeded(Exception):
+    """Raised in a part that has spent its time budget."""
+
+    def __init__(self, seconds: float, progress: Progress | None) -> None:
+        message = f"time budget of {seconds:g}s exceeded"
+        if progress is not None:
+            message += " at " + format_progress(progress)
+        super().__init__(message)
+        self.seconds = seconds
+        self.progress = progress
+
+
+class _State:  # pylint: disable=too-few-public-methods
+    """The budget of the part running in this process."""
+
+    def __init__(self) -> None:
+        self.active = False
+        self.title = ""
+        self.started = 0.0
+        self.deadline = math.inf
+        self.interval: float | None = None
+        self.next_report = math.inf
+        self.progress: Progress | None = None
+
+
+_state = _State()
+
+
+def configure(interval: float | None) -> None:
+    """
+    Set how often the progress of long loops is reported in this process.
+
+    Used as the initializer of the runner's worker processes.
+
+    Args:
+        interval (float | None): The seconds between progress reports, or None for no reports.
+    """
+    _state.interval = interval
+
+
+@contextlib.contextmanager
+def limit(seconds: float | None, title: str = "") -> Iterator[None]:
+    """
+    Run the body with a time budget, raising BudgetExceeded once it is spent.
+
+    Args:
+        seconds (float | None): The budget in seconds, or None for no budget.
+        title (str): The title used in progress reports, e.g. "day14 part_two".
+
+    Yields:
+        None
+    """
+    _state.active = seconds is not None or _state.interval is not None
+    _state.title = title
+    _state.started = time.monotonic()
+    _state.deadline = math.inf if seconds is None else _state.started + seconds
+    _state.next_report = math.inf if _state.interval is None else _state.started + _state.interval
+    _state.progress = None
+    # Parts without checkpoints are stopped by an alarm, which only the main thread receives.
+    alarm = False
+    previous = signal.getsignal(signal.SIGALRM)
+    if seconds is not None and threading.current_thread() is threading.main_thread():
+        alarm = True
+        signal.signal(signal.SIGALRM, _on_alarm)
+        signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        if alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous)
+        _state.active = False
+
+
+def checkpoint(label: str, done: int, total: int | None = None) -> None:
+    """
+    Record the progress of a long loop and stop it if its part has spent its budget.
+
+    This returns immediately when no budget or report interval is set.
+
+    Args:
+        label (str): What the loop counts, e.g. "cycles".
+        done (int): The number of iterations done so far.
+        total (int | None): The total number of iterations, if known.
+    """
+    if not _state.active:
+        return
+    now = time.monotonic()
+    _state.progress = {
+        "title": _state.title,
+        "label": label,
+        "done": done,
+        "total": total,
+        "elapsed": now - _state.started,
+    }
+    if now >= _state.deadline:
+        # The alarm due at the same deadline must not interrupt the unwinding of this one.
+        _state.active = False
+        raise BudgetExceeded(_state.deadline - _state.started, _state.progress)
+    if now >= _state.next_report:
+        _state.next_report = now + (_state.interval or 0.0)
+        print(format_progress(_state.progress), file=sys.stderr, flush=True)
+
+
+def format_progress(progress: Progress) -> str:
+    """
+    Format the progress of a loop with its rate and, if its total is known, the time left.
+
+    Args:
+        progress (Progress): The recorded progress.
+
+    Returns:
+        str: The progress line, e.g. "day14 part_two cycles 1200/1000000000 (400/s, eta 29d)".
+    """
+    rate = progress["done"] / progress["elapsed"] if progress["elapsed"] > 0 else 0.0
+    line = f"{progress['title']} {progress['label']} {progress['done']}".lstrip()
+    if progress["total"] is None:
+        return f"{line} ({rate:.0f}/s)"
+    eta = (progress["total"] - progress["done"]) / rate if rate > 0 else math.inf
+    return f"{line}/{progress['total']} ({rate:.0f}/s, eta {format_duration(eta)})"
+
+
+def format_duration(seconds: float) -> str:
+    """
+    Format a duration with its largest whole unit.
+
+    Args:
+        seconds (float): The duration in seconds.
+
+    Returns:
+        str: The duration, e.g. "45s", "12m", "3h" or "29d".
+    """
+    if math.isinf(seconds):
+        return "never"
+    for unit, size in (("d", 86400), ("h", 3600), ("m", 60)):
+        if seconds >= size:
+            return f"{seconds // size:.0f}{unit}"
+    return f"{seconds:.0f}s"
+
+
+def _on_alarm(_signum: int, _frame: FrameType | None) -> None:
+    if not _state.active:
+        return
+    _state.active = False
+    raise BudgetExceeded(_state.deadline - _state.started, _state.progress)
@@ -0,0 +1,261 @@
+"""Advent of Code 2023 - Content-addressed on-disk cache for day results
+
+Results are keyed on a hash of the input bytes, the source of the day module and of the
+utilities it parses with, the part and its extra arguments, so a result is reused exactly as long
+as none of them has changed. The parsed form of an input is pickled under a key of the input
+bytes and the sources alone, so that every part of a day that exposes a parse step shares a
+single parse of a large input.
+"""
+
+import contextlib
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import sys
+from types import ModuleType
+from typing import Any, Callable
+
+from . import util
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache")
+
+MAX_BYTES = 64 * 1024 * 1024
+
+
+def cache_key(file_path: str, func: Callable[..., int], args: tuple[Any, ...]) -> str:
+    """
+    Calculate the cache key of running a part of a day on an input file.
+
+    Args:
+        file_path (str): The path of the input file.
+        func (Callable[..., int]): The part function.
+        args (tuple[Any, ...]): The extra arguments passed to the part after the lines.
+
+    Returns:
+        str: The hex digest identifying the result.
+    """
+    digest = hashlib.sha256()
+    with util.map_file(file_path) as view:
+        digest.update(view)
+    digest.update(inspect.getsource(sys.modules[func.__module__]).encode("utf-8"))
+    digest.update(inspect.getsource(util).encode("utf-8"))
+    digest.update(repr((func.__name__, args)).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def parse_key(file_path: str, module: ModuleType) -> str:
+    """
+    Calculate the cache key of parsing an input file with the parse step of a day.
+
+    Args:
+        file_path (str): The path of the input file.
+        module (ModuleType): The day module.
+
+    Returns:
+        str: The hex digest identifying the parsed input.
+    """
+    digest = hashlib.sha256()
+    with util.map_file(file_path) as view:
+        digest.update(view)
+    digest.update(inspect.getsource(module).encode("utf-8"))
+    digest.update(inspect.getsource(util).encode("utf-8"))
+    digest.update(b"parse")
+    return digest.hexdigest()
+
+
+def result_path(key: str, cache_dir: str = CACHE_DIR) -> str:
+    """
+    Get the path of the file storing a cached result.
+
+    Args:
+        key (str): The cache key.
+        cache_dir (str): The cache directory.
+
+    Returns:
+        str: The path of the result file.
+    """
+    return os.path.join(cache_dir, "results", key + ".json")
+
+
+def parsed_path(key: str, cache_dir: str = CACHE_DIR) -> str:
+    """
+    Get the path of the file storing a cached parsed input.
+
+    Args:
+        key (str): The parse key.
+        cache_dir (str): The cache directory.
+
+    Returns:
+        str: The path of the pickle file.
+    """
+    return os.path.join(cache_dir, "parsed", key + ".pickle")
+
+
+def load(key: str, cache_dir: str = CACHE_DIR) -> int | None:
+    """
+    Load a cached result and mark it as recently used.
+
+    Args:
+        key (str): The cache key.
+        cache_dir (str): The cache directory.
+
+    Returns:
+        int | None: The cached result, or None on a miss.
+    """
+    path = result_path(key, cache_dir)
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            result: int = json.load(file)["result"]
+    except (OSError, ValueError, KeyError):
+        return None
+    with contextlib.suppress(FileNotFoundError):
+        os.utime(path)
+    return result
+
+
+def store(key: str, result: int, cache_dir: str = CACHE_DIR, max_bytes: int = MAX_BYTES) -> None:
+    """
+    Store a result in the cache and evict the least recently used results over the size limit.
+
+    Args:
+        key (str): The cache key.
+        result (int): The result to store.
+        cache_dir (str): The cache directory.
+        max_bytes (int): The maximum total size of the stored results.
+    """
+    path = result_path(key, cache_dir)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as file:
+        json.dump({"result": result}, file)
+    os.replace(tmp_path, path)
+    evict(os.path.dirname(path), max_bytes)
+
+
+def load_parsed(key: str, cache_dir: str = CACHE_DIR) -> Any:
+    """
+    Load a cached parsed input and mark it as recently used.
+
+    Args:
+        key (str): The parse key.
+        cache_dir (str): The cache directory.
+
+    Returns:
+        Any: The parsed input, or None on a miss.
+    """
+    path = parsed_path(key, cache_dir)
+    try:
+        with open(path, "rb") as file:
+            parsed = pickle.load(file)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        return None
+    with contextlib.suppress(FileNotFoundError):
+        os.utime(path)
+    return parsed
+
+
+def store_parsed(
+    key: str, parsed: Any, cache_dir: str = CACHE_DIR, max_bytes: int = MAX_BYTES
+) -> None:
+    """
+    Store a parsed input in the cache and evict the least recently used ones over the size limit.
+
+    Args:
+        key (str): The parse key.
+        parsed (Any): The parsed input, which must be picklable.
+        cache_dir (str): The cache directory.
+        max_bytes (int): The maximum total size of the stored parsed inputs.
+    """
+    path = parsed_path(key, cache_dir)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as file:
+        pickle.dump(parsed, file, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+    evict(os.path.dirname(path), max_bytes)
+
+
+def cached_parse(
+    module: ModuleType, file_path: str, cache_dir: str = CACHE_DIR, max_bytes: int = MAX_BYTES
+) -> Any:
+    """
+    Parse an input file with the parse step of a day, reusing a cached parse when there is one.
+
+    Args:
+        module (ModuleType): The day module, which must define parse.
+        file_path (str): The path of the input file.
+        cache_dir (str): The cache directory.
+        max_bytes (int): The maximum total size of the stored parsed inputs.
+
+    Returns:
+        Any: The parsed input.
+    """
+    key = parse_key(file_path, module)
+    parsed = load_parsed(key, cache_dir)
+    if parsed is None:
+        parsed = util.parse_file(module, file_path)
+        store_parsed(key, parsed, cache_dir, max_bytes)
+    return parsed
+
+
+def evict(directory: str, max_bytes: int) -> None:
+    """
+    Remove the least recently used files of a directory until it fits in the size limit.
+
+    Args:
+        directory (str): The directory to shrink.
+        max_bytes (int): The maximum total size of the files.
+    """
+    # Other workers may store and evict concurrently, so files can vanish at any point.
+    entries: list[tuple[float, int, str]] = []
+    for entry in os.scandir(directory):
+        with contextlib.suppress(FileNotFoundError):
+            stat = entry.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+    entries.sort()
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in entries:
+        if total <= max_bytes:
+            break
+        total -= size
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(path)
+
+
+def cached_call(
+    func: Callable[..., int],
+    file_path: str,
+    args: tuple[Any, ...] = (),
+    cache_dir: str = CACHE_DIR,
+    max_bytes: int = MAX_BYTES,
+) -> tuple[int, bool]:
+    """
+    Run a part on the lines of an input file, reusing a cached result when there is one.
+
+    On a miss, a day that exposes a parse step is answered from its cached parsed input, and a
+    part with a buffer function from the memory-mapped input.
+
+    Args:
+        func (Callable[..., int]): The part function.
+        file_path (str): The path of the input file.
+        args (tuple[Any, ...]): The extra arguments passed to the part after the lines.
+        cache_dir (str): The cache directory.
+        max_bytes (int): The maximum total size of the stored results.
+
+    Returns:
+        tuple[int, bool]: The result and whether it came from the cache.
+    """
+    key = cache_key(file_path, func, args)
+    result = load(key, cache_dir)
+    if result is not None:
+        return result, True
+    module = sys.modules[func.__module__]
+    parsed_func = getattr(module, func.__name__ + "_parsed", None)
+    if hasattr(module, "parse") and parsed_func is not None:
+        result = parsed_func(cached_parse(module, file_path, cache_dir, max_bytes), *args)
+    else:
+        result = util.call_on_file(func, file_path, args)
+    store(key, result, cache_dir, max_bytes)
+    return result, False
@@ -0,0 +1,206 @@
+"""Advent of Code 2023 - Warm solver daemon over a local Unix socket
+
+The daemon keeps the day modules imported and their functools caches and parsed inputs warm
+between requests. Clients send one JSON request per line, e.g.
+{"day": "day12", "part": "part_two", "path": "inputs/day12.txt"}, and read one JSON response per
+line back. The {"command": "status"} and {"command": "stop"} requests inspect and stop it.
+
+Usage: python -m src.daemon serve | python -m src.daemon solve 12 2 [path] | ... stop
+"""
+
+import argparse
+import collections
+import contextlib
+import json
+import os
+import socket
+import socketserver
+import sys
+import time
+from typing import Any, TypedDict
+
+from . import registry, util
+from .cache import CACHE_DIR
+
+SOCKET_PATH = os.path.join(CACHE_DIR, "daemon.sock")
+
+MAX_PARSED = 32
+
+Response = TypedDict(
+    "Response",
+    {"result": Any, "error": str | None, "wall_time": float},
+)
+
+
+class SolverServer(socketserver.UnixStreamServer):
+    """A Unix socket server answering requests with warm day modules and parsed inputs."""
+
+    def __init__(self, socket_path: str) -> None:
+        super().__init__(socket_path, SolverHandler)
+        self.running = True
+        # Parsed inputs keyed by day, path, size and modification time, least recently used first.
+        self.parsed: collections.OrderedDict[tuple[str, str, int, int], Any] = (
+            collections.OrderedDict()
+        )
+
+    def parse_input(self, day: str, path: str) -> Any:
+        """
+        Parse an input with the parse step of a day, reusing the parse of an unchanged input.
+
+        Args:
+            day (str): The module name of the day.
+            path (str): The path of the input file.
+
+        Returns:
+            Any: The parsed input.
+        """
+        stat = os.stat(path)
+        key = (day, os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+        if key in self.parsed:
+            self.parsed.move_to_end(key)
+        else:
+            self.parsed[key] = util.parse_file(registry.load(day), path)
+            if len(self.parsed) > MAX_PARSED:
+                self.parsed.popitem(last=False)
+        return self.parsed[key]
+
+    def solve(self, day: str, part: str, path: str) -> int:
+        """
+        Solve a part of a day for an input file.
+
+        Args:
+            day (str): The module name of the day.
+            part (str): The name of the part function.
+            path (str): The path of the input file.
+
+        Returns:
+            int: The result of the part.
+        """
+        module = registry.load(day)
+        if hasattr(module, "parse"):
+            result: int = getattr(module, part + "_parsed")(self.parse_input(day, path))
+        else:
+            result = getattr(module, part)(util.read_lines(path))
+        return result
+
+    def answer(self, message: dict[str, Any]) -> Any:
+        """
+        Answer a single request.
+
+        Args:
+            message (dict[str, Any]): The decoded request.
+
+        Returns:
+            Any: The result of the request.
+        """
+        command = message.get("command", "solve")
+        if command == "stop":
+            self.running = False
+            return "stopping"
+        if command == "status":
+            return {
+                "days": sorted(name.split(".")[-1] for name in sys.modules if ".day" in name),
+                "parsed": len(self.parsed),
+            }
+        day = registry.resolve_day(str(message["day"]))
+        path = message.get("path") or util.get_path(day)
+        return self.solve(day, message["part"], path)
+
+
+class SolverHandler(socketserver.StreamRequestHandler):
+    """Reads JSON requests from a connection, one per line, and writes back a response each."""
+
+    server: SolverServer
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            start = time.perf_counter()
+            response: Response = {"result": None, "error": None, "wall_time": 0.0}
+            try:
+                response["result"] = self.server.answer(json.loads(line))
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                response["error"] = repr(error)
+            response["wall_time"] = time.perf_counter() - start
+            self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+
+def serve(socket_path: str = SOCKET_PATH) -> None:
+    """
+    Run the daemon until it receives a stop request.
+
+    Args:
+        socket_path (str): The path of the Unix socket to listen on.
+    """
+    os.makedirs(os.path.dirname(socket_path), exist_ok=True)
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(socket_path)
+    try:
+        with SolverServer(socket_path) as server:
+            while server.running:
+                server.handle_request()
+    finally:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(socket_path)
+
+
+def request(message: dict[str, Any], socket_path: str = SOCKET_PATH) -> Response:
+    """
+    Send a request to the daemon and wait for its response.
+
+    Args:
+        message (dict[str, Any]): The request.
+        socket_path (str): The path of the daemon's Unix socket.
+
+    Returns:
+        Response: The response of the daemon.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(socket_path)
+        with client.makefile("rwb") as stream:
+            stream.write(json.dumps(message).encode("utf-8") + b"\n")
+            stream.flush()
+            response: Response = json.loads(stream.readline())
+    return response
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Run the daemon or send it a request and print the response.
+
+    Args:
+        argv (list[str] | None): The command line arguments, defaults to sys.argv.
+
+    Returns:
+        int: The exit code, non-zero if the request failed.
+    """
+    parser = argparse.ArgumentParser(prog="python -m src.daemon", description=__doc__)
+    parser.add_argument("--socket", default=SOCKET_PATH, help="path of the Unix socket")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("serve", help="run the daemon in the foreground")
+    solve = commands.add_parser("solve", help="solve a part of a day")
+    solve.add_argument("day", help="day to run, e.g. 5 or day05")
+    solve.add_argument("part", type=int, choices=(1, 2), help="part to run")
+    solve.add_argument("path", nargs="?", help="input file (default: the day's puzzle input)")
+    commands.add_parser("status", help="list the warm days and parsed inputs")
+    commands.add_parser("stop", help="stop the daemon")
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        serve(args.socket)
+        return 0
+    message: dict[str, Any] = {"command": args.command}
+    if args.command == "solve":
+        # The daemon resolves paths against its own working directory.
+        path = os.path.abspath(args.path) if args.path else None
+        message.update(day=args.day, part=registry.PARTS[args.part - 1], path=path)
+    response = request(message, args.socket)
+    if response["error"] is not None:
+        print("error " + response["error"])
+        return 1
+    print(f"{response['result']}  ({response['wall_time'] * 1000:.1f}ms)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,6 +1,9 @@
 """Advent of Code 2023 - Day 1 tasks"""
 
+import collections
+import mmap
 import re
+from typing import Iterable
 
 # pylint: disable=import-error
 if not __package__:
@@ -8,8 +11,34 @@ if not __package__:
 else:
     from . import util
 
+# Solver engines, by name with the input size in bytes from which each is auto-selected.
+ENGINES = {"reference": 0, "fast": 1024, "bytes": 1024 * 1024}
 
-def part_one(lines: list[str]) -> int:
+# The bytes that the bytes engine drops before counting, everything but digits and newlines.
+NON_DIGITS = bytes(byte for byte in range(256) if byte not in b"0123456789\n")
+
+# The bytes engine reads the input in chunks of this many bytes.
+CHUNK_SIZE = 64 * 1024 * 1024
+
+# The digits and the spelled-out digits, with their values.
+DIGIT_VALUES = {str(digit): digit for digit in range(10)} | {
+    "one": 1,
+    "two": 2,
+    "three": 3,
+    "four": 4,
+    "five": 5,
+    "six": 6,
+    "seven": 7,
+    "eight": 8,
+    "nine": 9,
+}
+
+# A multi-pattern automaton: the transitions of each state by character, and the value of the
+# pattern that ends in each state, or -1 if none does.
+Automaton = tuple[list[dict[str, int]], list[int]]
+
+
+def part_one(lines: Iterable[str]) -> int:
     """
     --- Day 1: Trebuchet?! ---
     Something is wrong with global snow production, and you've been selected to take a look.
@@ -49,14 +78,10 @@ def part_one(lines: list[str]) -> int:
 
     Consider your entire calibration document. What is the sum of all of the calibration values?
     """
-    total = 0
-    for line in lines:
-        numbers = get_first_and_last_number_digits_only(line)
-        total += int(numbers)
-    return total
+    return sum(map(part_one_line, lines))
 
 
-def part_two(lines: list[str]) -> int:
+def part_two(lines: Iterable[str]) -> int:
     """
     --- Part Two ---
     Your calculation isn't quite right. It looks like some of the digits are actually spelled out
@@ -78,13 +103,135 @@ def part_two(lines: list[str]) -> int:
 
     What is the sum of all of the calibration values?
     """
+    return sum(map(part_two_line, lines))
+
+
+def part_one_line(line: str) -> int:
+    """
+    Calculates the calibration value of a line from its digits.
+
+    Args:
+        line (str): The input line.
+
+    Returns:
+        int: The value of the line.
+    """
+    return int(get_first_and_last_number_digits_only(line))
+
+
+def part_two_line(line: str) -> int:
+    """
+    Calculates the calibration value of a line, with digits spelled out counted as well.
+
+    Args:
+        line (str): The input line.
+
+    Returns:
+        int: The value of the line.
+    """
+    return int(get_first_and_last_number_digits_or_written(line))
+
+
+def part_one_bytes(lines: Iterable[str]) -> int:
+    """
+    Calculates the result for part one with the bytes engine from lines, joining them into a
+    single buffer. Input files are handed to part_one_bytes_buffer memory-mapped instead.
+
+    Args:
+        lines (Iterable[str]): The calibration document.
+
+    Returns:
+        int: The sum of the calibration values.
+    """
+    return part_one_bytes_buffer("\n".join(lines).encode("utf-8"))
+
+
+def part_one_bytes_buffer(data: bytes | memoryview | mmap.mmap) -> int:
+    """
+    Sums the calibration values of a whole document straight from its bytes, such as a memory
+    mapped input, without splitting it into lines.
+
+    Each chunk is reduced to its digits and newlines with bytes.translate. The first digit of
+    a line then follows a newline and the last one precedes a newline, so the sum is counted
+    with one bytes.count scan per digit and position.
+
+    Args:
+        data (bytes | memoryview | mmap.mmap): The calibration document.
+
+    Returns:
+        int: The sum of the calibration values.
+    """
     total = 0
-    for line in lines:
-        numbers = get_first_and_last_number_digits_or_written(line)
-        total = total + int(numbers)
+    # The last digit or newline of the previous chunk, as lines may span two chunks.
+    previous = b"\n"
+    for start in range(0, len(data), CHUNK_SIZE):
+        digits = previous + bytes(data[start : start + CHUNK_SIZE]).translate(None, NON_DIGITS)
+        for value in range(1, 10):
+            digit = str(value).encode("ascii")
+            total += value * (10 * digits.count(b"\n" + digit) + digits.count(digit + b"\n"))
+        previous = digits[-1:]
+    if previous != b"\n":
+        total += int(previous)
     return total
 
 
+def solve(lines: Iterable[str]) -> tuple[int, int]:
+    """
+    Calculates the results of both parts from a single pass over each line, so that a streamed
+    document is only read once.
+
+    The digit automaton reports every digit and spelled-out digit of a line as it scans; part
+    one keeps the first and last numeric digits and part two the first and last of either.
+
+    Args:
+        lines (Iterable[str]): The calibration document.
+
+    Returns:
+        tuple[int, int]: The sums of the calibration values of part one and part two.
+    """
+    transitions, values = DIGITS_FORWARD
+    total_one = total_two = 0
+    for line in lines:
+        first_digit = last_digit = first_any = last_any = -1
+        state = 0
+        for char in line:
+            state = transitions[state].get(char, 0)
+            value = values[state]
+            if value == -1:
+                continue
+            if first_any == -1:
+                first_any = value
+            last_any = value
+            # A digit character can only complete the pattern of the digit itself.
+            if char.isdigit():
+                if first_digit == -1:
+                    first_digit = value
+                last_digit = value
+        # A line without any digit has no calibration value, as in the bytes engine.
+        if first_digit != -1:
+            total_one += first_digit * 10 + last_digit
+        if first_any != -1:
+            total_two += first_any * 10 + last_any
+    return total_one, total_two
+
+
+def part_two_fast(lines: Iterable[str]) -> int:
+    """
+    Calculates the result for part two with the fast engine, which finds the first and the
+    last digit of a line with one automaton pass from each end of the line.
+
+    Args:
+        lines (Iterable[str]): The calibration document.
+
+    Returns:
+        int: The sum of the calibration values.
+    """
+    return sum(
+        first_match(DIGITS_FORWARD, line) * 10 + first_match(DIGITS_BACKWARD, reversed(line))
+        for line in lines
+    )
+
+
 def get_first_and_last_number_digits_only(line: str) -> str:
     """
     Extracts the first and last digits from a given line.
@@ -149,7 +296,74 @@ def get_first_and_last_number_digits_or_written(line: str) -> str:
     return first_num + last_num
 
 
+def build_automaton(patterns: dict[str, int]) -> Automaton:
+    """
+    Build an Aho-Corasick automaton that recognises any of the patterns, overlapping ones
+    included, in a single pass over a text.
+
+    The transitions are completed with the failure links, so that every character of the text
+    costs one dictionary lookup; characters that appear in no pattern lead back to the root.
+
+    Args:
+        patterns (dict[str, int]): The patterns with their values.
+
+    Returns:
+        Automaton: The automaton, with the root as state 0.
+    """
+    transitions: list[dict[str, int]] = [{}]
+    values = [-1]
+    for pattern, value in patterns.items():
+        state = 0
+        for char in pattern:
+            if char not in transitions[state]:
+                transitions.append({})
+                values.append(-1)
+                transitions[state][char] = len(transitions) - 1
+            state = transitions[state][char]
+        values[state] = value
+
+    # Breadth first, so that the failure state of a state is always complete before it.
+    fail = [0] * len(transitions)
+    queue = collections.deque(transitions[0].values())
+    while queue:
+        state = queue.popleft()
+        if values[state] == -1:
+            values[state] = values[fail[state]]
+        for char, child in transitions[state].items():
+            fail[child] = transitions[fail[state]].get(char, 0)
+            queue.append(child)
+        for char, target in transitions[fail[state]].items():
+            transitions[state].setdefault(char, target)
+    return transitions, values
+
+
+def first_match(automaton: Automaton, text: Iterable[str]) -> int:
+    """
+    Run an automaton over a text up to the first pattern that ends in it.
+
+    Args:
+        automaton (Automaton): The automaton.
+        text (Iterable[str]): The characters of the text.
+
+    Returns:
+        int: The value of the first pattern found.
+    """
+    transitions, values = automaton
+    state = 0
+    for char in text:
+        state = transitions[state].get(char, 0)
+        if values[state] != -1:
+            return values[state]
+    raise ValueError("no digit found")
+
+
+DIGITS_FORWARD = build_automaton(DIGIT_VALUES)
+
+# Matches the digits of a reversed line, so the last digit of the line is found first.
+DIGITS_BACKWARD = build_automaton({word[::-1]: value for word, value in DIGIT_VALUES.items()})
+
+
 if __name__ == "__main__":
-    file_lines = util.get_lines("day01")
-    print("Part one: " + str(part_one(file_lines)))
-    print("Part two: " + str(part_two(file_lines)))
+    answer_one, answer_two = solve(util.iter_lines(util.get_path("day01")))
+    print("Part one: " + str(answer_one))
+    print("Part two: " + str(answer_two))
@@ -1,6 +1,9 @@
 """Advent of Code 2023 - Day 2 tasks"""
 
-import re
+import bisect
+import operator
+from array import array
+from typing import Iterable
 
 # pylint: disable=import-error
 if not __package__:
@@ -8,8 +11,21 @@ if not __package__:
 else:
     from . import util
 
+# A game as (id, max red, max green, max blue).
+Game = tuple[int, int, int, int]
 
-def part_one(lines: list[str]) -> int:
+# The games as columns of 64-bit integers: ids, max reds, max greens and max blues.
+GameTable = tuple["array[int]", "array[int]", "array[int]", "array[int]"]
+
+# A bag as its number of (red, green, blue) cubes.
+Bag = tuple[int, int, int]
+
+# The sorted distinct red, green and blue maxima and the 3-D prefix sums of the game ids over
+# them, flattened red-major with a leading zero row on every axis.
+BagIndex = tuple[list[int], list[int], list[int], "array[int]"]
+
+
+def part_one(lines: Iterable[str]) -> int:
     """
     --- Day 2: Cube Conundrum ---
     You're launched high into the atmosphere! The apex of your trajectory just barely reaches
@@ -55,19 +71,10 @@ def part_one(lines: list[str]) -> int:
     Determine which games would have been possible if the bag had been loaded with only 12 red
     cubes, 13 green cubes, and 14 blue cubes. What is the sum of the IDs of those games?
     """
-    total = 0
-    for line in lines:
-        if (
-            get_max("red", line) <= 12
-            and get_max("green", line) <= 13
-            and get_max("blue", line) <= 14
-        ):
-            game_id = re.findall(r"Game (\d+)", line)[0]
-            total += int(game_id)
-    return total
+    return part_one_parsed(parse(lines))
 
 
-def part_two(lines: list[str]) -> int:
+def part_two(lines: Iterable[str]) -> int:
     """
     --- Part Two ---
     The Elf says they've stopped producing snow because they aren't getting any water! He isn't
@@ -100,30 +107,170 @@ def part_two(lines: list[str]) -> int:
     For each game, find the minimum set of cubes that must have been present. What is the sum of the
     power of these sets?
     """
-    total = 0
+    return part_two_parsed(parse(lines))
+
+
+def parse(lines: Iterable[str]) -> GameTable:
+    """
+    Parses the games once, in a single pass, into a compact table that both parts are
+    answered from.
+
+    Args:
+        lines (Iterable[str]): The game records.
+
+    Returns:
+        GameTable: The id and colour maxima of every game, column by column.
+    """
+    games: GameTable = (array("q"), array("q"), array("q"), array("q"))
     for line in lines:
-        max_red = get_max("red", line)
-        max_green = get_max("green", line)
-        max_blue = get_max("blue", line)
-        total += max_red * max_green * max_blue
+        for column, value in zip(games, parse_game(line)):
+            column.append(value)
+    return games
+
+
+def parse_game(line: str) -> Game:
+    """
+    Parses a game record into its id and the maximum number of cubes seen per colour.
+
+    Args:
+        line (str): The game record.
+
+    Returns:
+        Game: A tuple of (id, max red, max green, max blue).
+    """
+    game, _, draws = line.partition(":")
+    counts_and_colours = draws.replace(",", " ").replace(";", " ").split()
+    max_cubes = {"red": 0, "green": 0, "blue": 0}
+    for count, colour in zip(counts_and_colours[::2], counts_and_colours[1::2]):
+        max_cubes[colour] = max(max_cubes[colour], int(count))
+    return util.ints(game)[0], max_cubes["red"], max_cubes["green"], max_cubes["blue"]
+
+
+def part_one_parsed(games: GameTable) -> int:
+    """
+    Sums the ids of the games possible with 12 red, 13 green and 14 blue cubes.
+
+    Args:
+        games (GameTable): The parsed games.
+
+    Returns:
+        int: The sum of the ids of the possible games.
+    """
+    total = 0
+    for game_id, max_red, max_green, max_blue in zip(*games):
+        if max_red <= 12 and max_green <= 13 and max_blue <= 14:
+            total += game_id
     return total
 
 
-def get_max(color: str, line: str) -> int:
+def part_two_parsed(games: GameTable) -> int:
+    """
+    Sums the powers of the minimum sets of cubes of the games.
+
+    Args:
+        games (GameTable): The parsed games.
+
+    Returns:
+        int: The sum of the powers.
+    """
+    _, max_reds, max_greens, max_blues = games
+    return sum(map(operator.mul, map(operator.mul, max_reds, max_greens), max_blues))
+
+
+def build_bag_index(games: GameTable) -> BagIndex:
+    """
+    Indexes the games for bag-feasibility queries.
+
+    A game is feasible for a bag if the bag holds at least its maximum of every colour, so the
+    feasible games of a bag are the ones dominated by it. The ids are summed into a grid over
+    the distinct maxima of each colour and the grid is turned into prefix sums along every axis,
+    after which the sum of the ids of the games dominated by any bag is a single lookup. The
+    grid holds one cell per combination of distinct maxima.
+
+    Args:
+        games (GameTable): The parsed games.
+
+    Returns:
+        BagIndex: The axes and prefix sums of the games.
+    """
+    axes = [sorted(set(column)) for column in games[1:]]
+    ranks = [{value: rank for rank, value in enumerate(axis, 1)} for axis in axes]
+    dimensions = [len(axis) + 1 for axis in axes]
+    sums = array("q", bytes(8 * dimensions[0] * dimensions[1] * dimensions[2]))
+    for game_id, *maxima in zip(*games):
+        cell = 0
+        for rank, dimension, value in zip(ranks, dimensions, maxima):
+            cell = cell * dimension + rank[value]
+        sums[cell] += game_id
+    stride = 1
+    for dimension in reversed(dimensions):
+        for cell, value in enumerate(sums):
+            if cell // stride % dimension:
+                sums[cell] = value + sums[cell - stride]
+        stride *= dimension
+    return axes[0], axes[1], axes[2], sums
+
+
+def feasible_id_sum(index: BagIndex, bag: Bag) -> int:
+    """
+    Sums the ids of the games possible with a bag, in logarithmic time.
+
+    Args:
+        index (BagIndex): The indexed games.
+        bag (Bag): The number of red, green and blue cubes in the bag.
+
+    Returns:
+        int: The sum of the ids of the possible games.
+    """
+    *axes, sums = index
+    cell = 0
+    for axis, cubes in zip(axes, bag):
+        cell = cell * (len(axis) + 1) + bisect.bisect_right(axis, cubes)
+    return sums[cell]
+
+
+def feasible_id_sums(games: GameTable, bags: Iterable[Bag]) -> list[int]:
+    """
+    Sums the ids of the games possible with each of a batch of bags, indexing the games once.
+
+    Args:
+        games (GameTable): The parsed games.
+        bags (Iterable[Bag]): The bags to query.
+
+    Returns:
+        list[int]: The sum of the ids of the possible games of every bag, in order.
+    """
+    index = build_bag_index(games)
+    return [feasible_id_sum(index, bag) for bag in bags]
+
+
+def part_one_line(line: str) -> int:
+    """
+    Calculates the id of a single game if it is possible, otherwise zero.
+
+    Args:
+        line (str): The input line.
+
+    Returns:
+        int: The value of the line.
+    """
+    return part_one_parsed(parse((line,)))
+
+
+def part_two_line(line: str) -> int:
     """
-    Returns the maximum value of a specific color in a line.
+    Calculates the power of the minimum set of cubes of a single game.
 
-    Parameters:
-    color (str): The color to search for.
-    line (str): The line to search in.
+    Args:
+        line (str): The input line.
 
     Returns:
-    int: The maximum value of the specified color in the line.
+        int: The value of the line.
     """
-    return max(map(int, re.findall(r"(\d+) " + color, line)))
+    return part_two_parsed(parse((line,)))
 
 
 if __name__ == "__main__":
-    file_lines = util.get_lines("day02")
-    print("Part one: " + str(part_one(file_lines)))
-    print("Part two: " + str(part_two(file_lines)))
+    file_games = parse(util.iter_lines(util.get_path("day02")))
+    print("Part one: " + str(part_one_parsed(file_games)))
+    print("Part two: " + str(part_two_parsed(file_games)))
@@ -1,7 +1,6 @@
 """Advent of Code 2023 - Day 3 tasks"""
 
 import re
-from curses.ascii import isdigit
 
 # pylint: disable=import-error
 if not __package__:
@@ -9,6 +8,8 @@ if not __package__:
 else:
     from . import util
 
+DIGITS = b"0123456789"
+
 
 def part_one(lines: list[str]) -> int:
     """
@@ -54,16 +55,24 @@ def part_one(lines: list[str]) -> int:
         Of course, the actual engine schematic is much larger. What is the sum of all of the part
         numbers in the engine schematic?
     """
+    return part_one_parsed(parse(lines))
+
+
+def part_one_parsed(grid: util.Grid) -> int:
+    """
+    Sums the numbers of the schematic that are adjacent to a symbol.
+
+    Args:
+        grid (util.Grid): The parsed engine schematic.
+
+    Returns:
+        int: The sum of the part numbers.
+    """
     total = 0
-    for i, line in enumerate(lines):
-        numbers = re.findall(r"\d+", line)
-        if not numbers:
-            continue
-        j = 0
-        for number in numbers:
-            j = line.find(number, j)
-            if check_if_number_is_adjacent_to_symbol(i, j, lines, number):
-                total += int(number)
+    for i in range(grid.height):
+        for number in re.finditer(rb"\d+", grid.row(i)):
+            if check_if_number_is_adjacent_to_symbol(i, number.start(), grid, len(number[0])):
+                total += int(number[0])
     return total
 
 
@@ -106,109 +115,110 @@ def part_two(lines: list[str]) -> int:
 
     What is the sum of all of the gear ratios in your engine schematic?
     """
+    return part_two_parsed(parse(lines))
+
+
+def part_two_parsed(grid: util.Grid) -> int:
+    """
+    Sums the gear ratios of the gears of the schematic.
+
+    Args:
+        grid (util.Grid): The parsed engine schematic.
+
+    Returns:
+        int: The sum of the gear ratios.
+    """
     total = 0
-    for i, row in enumerate(lines):
-        for j, cell in enumerate(row):
-            if cell == "*":
-                adjacent_nums: list[int] = get_adjacent_numbers(i, j, lines)
-                if len(adjacent_nums) == 2:
-                    total += int(adjacent_nums[0]) * int(adjacent_nums[1])
+    for i, j in grid.find_all("*"):
+        adjacent_nums: list[int] = get_adjacent_numbers(i, j, grid)
+        if len(adjacent_nums) == 2:
+            total += adjacent_nums[0] * adjacent_nums[1]
     return total
 
 
-def check_if_number_is_adjacent_to_symbol(i: int, j: int, lines: list[str], number: str) -> bool:
+def parse(lines: list[str]) -> util.Grid:
     """
-    Checks if a number is adjacent to a symbol in the given lines of text.
+    Parses the engine schematic once, so that both parts can be answered from the result.
+
+    Args:
+        lines (list[str]): The rows of the engine schematic.
+
+    Returns:
+        util.Grid: The engine schematic as a grid.
+    """
+    return util.Grid.from_lines(lines)
+
+
+def check_if_number_is_adjacent_to_symbol(i: int, j: int, grid: util.Grid, length: int) -> bool:
+    """
+    Checks if a number is adjacent to a symbol in the given grid.
 
     Args:
         i (int): The row index of the number.
         j (int): The column index of the number.
-        lines (list): The lines of text.
-        number (str): The number to check.
+        grid (util.Grid): The engine schematic.
+        length (int): The number of digits in the number.
 
     Returns:
         bool: True if the number is adjacent to a symbol, False otherwise.
     """
-    for ii in range(i - 1, i + 2):
-        if out_of_bounds(ii, lines):
-            continue
-        for jj in range(j - 1, j + len(number) + 1):
-            if out_of_bounds(jj, lines[ii]):
-                continue
-            if re.search(r"[^\d.]", lines[ii][jj]):
+    for ii in range(max(i - 1, 0), min(i + 2, grid.height)):
+        row = grid.row(ii)
+        for jj in range(max(j - 1, 0), min(j + length + 1, grid.width)):
+            if row[jj] not in DIGITS and row[jj] != ord("."):
                 return True
     return False
 
 
-def get_adjacent_numbers(i: int, j: int, lines: list[str]) -> list[int]:
+def get_adjacent_numbers(i: int, j: int, grid: util.Grid) -> list[int]:
     """
     Get the adjacent numbers around a given position in a 2D grid.
 
     Args:
         i (int): The row index of the position.
         j (int): The column index of the position.
-        lines (List[str]): The 2D grid represented as a list of strings.
+        grid (util.Grid): The engine schematic.
 
     Returns:
         List[int]: A list of adjacent numbers.
     """
     adjacent: list[int] = []
-    for ii in range(i - 1, i + 2):
-        if out_of_bounds(ii, lines):
-            continue
+    for ii in range(max(i - 1, 0), min(i + 2, grid.height)):
+        row = grid.row(ii)
         last_seen_col = -1
-        for jj in range(j - 1, j + 2):
-            if out_of_bounds(jj, lines[ii]):
-                continue
+        for jj in range(max(j - 1, 0), min(j + 2, grid.width)):
             if jj < last_seen_col:
                 continue
-            if isdigit(lines[ii][jj]):
-                num, last_seen_col = resolve_whole_num(jj, lines[ii])
+            if row[jj] in DIGITS:
+                num, last_seen_col = resolve_whole_num(jj, row)
                 adjacent.append(num)
     return adjacent
 
 
-def out_of_bounds(index: int, items: str | list[str]) -> bool:
-    """
-    Check if the given index is out of bounds for the given list of items.
-
-    Args:
-        index (int): The index to check.
-        items (list): The list of items.
-
-    Returns:
-        bool: True if the index is out of bounds, False otherwise.
-    """
-    return index < 0 or index >= len(items)
-
-
-def resolve_whole_num(i: int, line: str) -> tuple[int, int]:
+def resolve_whole_num(i: int, line: memoryview) -> tuple[int, int]:
     """
     Resolves a whole number from a given position in a line.
 
     Args:
         i (int): The index of the character in the line.
-        line (str): The line of characters.
+        line (memoryview): The cells of the line.
 
     Returns:
         tuple: A tuple containing the resolved whole number and the index of the last
                character in the number.
     """
-    num = line[i]
-    reverse = i - 1
-    while reverse >= 0 and isdigit(line[reverse]):
-        num = line[reverse] + num
-        reverse -= 1
+    start = i
+    while start > 0 and line[start - 1] in DIGITS:
+        start -= 1
 
     forward = i + 1
-    while forward < len(line) and isdigit(line[forward]):
-        num += line[forward]
+    while forward < len(line) and line[forward] in DIGITS:
         forward += 1
 
-    return int(num), forward
+    return int(line[start:forward].tobytes()), forward
 
 
 if __name__ == "__main__":
-    file_lines = util.get_lines("day03")
-    print("Part one: " + str(part_one(file_lines)))
-    print("Part two: " + str(part_two(file_lines)))
+    schematic = parse(util.get_lines("day03"))
+    print("Part one: " + str(part_one_parsed(schematic)))
+    print("Part two: " + str(part_two_parsed(schematic)))
@@ -1,6 +1,6 @@
 """Advent of Code 2023 - Day 4 tasks"""
 
-import re
+from typing import Iterable
 
 # pylint: disable=import-error
 if not __package__:
@@ -8,8 +8,14 @@ if not __package__:
 else:
     from . import util
 
+# A scratchcard as (card number, count of matching numbers).
+Card = tuple[int, int]
 
-def part_one(lines: list[str]) -> int:
+# Solver engines, by name with the input size in bytes from which each is auto-selected.
+ENGINES = {"reference": 0, "fast": 1024}
+
+
+def part_one(lines: Iterable[str]) -> int:
     """
     -- Day 4: Scratchcards ---
     The gondola takes you up. Strangely, though, the ground doesn't seem to be coming with you;
@@ -65,17 +71,40 @@ def part_one(lines: list[str]) -> int:
 
     Take a seat in the large pile of colorful cards. How many points are they worth in total?
     """
+    return part_one_parsed(map(parse_card, lines))
+
+
+def part_one_parsed(cards: Iterable[Card]) -> int:
+    """
+    Sums the points of the scratchcards.
+
+    Args:
+        cards (Iterable[Card]): The parsed scratchcards.
+
+    Returns:
+        int: The total points of the scratchcards.
+    """
     total = 0
-    for line in lines:
-        winners = re.findall(r"\d+", line.split("|")[0].split(":")[1].strip())
-        cards = re.findall(r"\d+", line.split("|")[1].strip())
-        matches = list(set(winners).intersection(cards))
+    for _, matches in cards:
         if matches:
-            total += 2 ** (len(matches) - 1)
+            total += 2 ** (matches - 1)
     return total
 
 
-def part_two(lines: list[str]) -> int:
+def part_one_line(line: str) -> int:
+    """
+    Calculates the points of a single scratchcard.
+
+    Args:
+        line (str): The input line.
+
+    Returns:
+        int: The value of the line.
+    """
+    return part_one_parsed((parse_card(line),))
+
+
+def part_two(lines: Iterable[str]) -> int:
     """
     --- Part Two ---
     Just as you're about to report your findings to the Elf, one of you realizes that the rules
@@ -121,21 +150,92 @@ def part_two(lines: list[str]) -> int:
     Process all of the original and copied scratchcards until no more scratchcards are won.
     Including the original set of scratchcards, how many total scratchcards do you end up with?
     """
-    all_cards: dict[int, int] = {}
-    for line in lines:
-        winners = re.findall(r"\d+", line.split("|")[0].split(":")[1].strip())
-        cards = re.findall(r"\d+", line.split("|")[1].strip())
-        matches = list(set(winners).intersection(cards))
-        card_nbr = int(re.findall(r"\d+", line.split(":")[0].strip())[0])
+    return part_two_parsed(map(parse_card, lines))
+
+
+def part_two_parsed(cards: Iterable[Card]) -> int:
+    """
+    Counts the scratchcards including all the copies won.
+
+    Args:
+        cards (Iterable[Card]): The parsed scratchcards.
 
+    Returns:
+        int: The total number of scratchcards.
+    """
+    all_cards: dict[int, int] = {}
+    for card_nbr, matches in cards:
         add_card(all_cards, card_nbr)
 
         copy_rounds = all_cards.get(card_nbr, 0)
         for _ in range(copy_rounds):
-            add_cards(all_cards, list(range(card_nbr + 1, card_nbr + len(matches) + 1)))
+            add_cards(all_cards, list(range(card_nbr + 1, card_nbr + matches + 1)))
     return sum(all_cards.values())
 
 
+def part_two_fast(lines: Iterable[str]) -> int:
+    """
+    Calculates the result for part two with the fast engine.
+
+    Args:
+        lines (Iterable[str]): The scratchcards.
+
+    Returns:
+        int: The total number of scratchcards.
+    """
+    return part_two_fast_parsed(map(parse_card, lines))
+
+
+def part_two_fast_parsed(cards: Iterable[Card]) -> int:
+    """
+    Counts the scratchcards including all the copies won, adding all the copies of a card to
+    the cards it wins at once instead of one copy at a time.
+
+    Args:
+        cards (Iterable[Card]): The parsed scratchcards.
+
+    Returns:
+        int: The total number of scratchcards.
+    """
+    total = 0
+    copies: dict[int, int] = {}
+    for card_nbr, matches in cards:
+        count = copies.pop(card_nbr, 0) + 1
+        total += count
+        for won in range(card_nbr + 1, card_nbr + matches + 1):
+            copies[won] = copies.get(won, 0) + count
+    return total
+
+
+def parse(lines: Iterable[str]) -> list[Card]:
+    """
+    Parses the scratchcards once, so that both parts can be answered from the result.
+
+    Args:
+        lines (Iterable[str]): The scratchcards.
+
+    Returns:
+        list[Card]: The number and the count of matching numbers of every card.
+    """
+    return list(map(parse_card, lines))
+
+
+def parse_card(line: str) -> Card:
+    """
+    Parses a scratchcard into its number and how many of its numbers are winning numbers.
+
+    Args:
+        line (str): The scratchcard.
+
+    Returns:
+        Card: A tuple of (card number, matches).
+    """
+    card, _, numbers = line.partition(":")
+    winners, _, cards = numbers.partition("|")
+    # The numbers are only compared, so they are matched as whitespace separated tokens.
+    return int(card.split()[-1]), len(set(winners.split()).intersection(cards.split()))
+
+
 def add_cards(cards: dict[int, int], subsequent_cards: list[int]) -> None:
     """
     Add subsequent cards to the list of cards.
@@ -172,6 +272,6 @@ def add_card(cards: dict[int, int], card_nbr: int) -> None:
 
 
 if __name__ == "__main__":
-    file_lines = util.get_lines("day04")
-    print("Part one: " + str(part_one(file_lines)))
-    print("Part two: " + str(part_two(file_lines)))
+    scratchcards = parse(util.iter_lines(util.get_path("day04")))
+    print("Part one: " + str(part_one_parsed(scratchcards)))
+    print("Part two: " + str(part_two_parsed(scratchcards)))
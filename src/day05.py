@@ -1,64 +1,116 @@
 """Advent of Code 2023 - Day 5 tasks"""
 
-import re
 from typing import NewType
 
 SingleMapping = NewType("SingleMapping", dict[int, dict[str, int]])
 Mapping = NewType("Mapping", dict[str, SingleMapping])
+# The seed numbers and the mapping of an almanac.
+Almanac = tuple[list[int], Mapping]
 
 # pylint: disable=import-error
 if not __package__:
+    import budget  # type: ignore
     import util  # type: ignore
 else:
-    from . import util
+    from . import budget, util
+
+CHECKPOINT_STEP = 10000
+
+# Functions whose calls are counted by the runner's --stats.
+HOT_FUNCTIONS = ("traverse_mapping", "get_destination")
 
 
 def part_one(lines: list[str]) -> int:
     """
     part one
     """
-    return runner(lines, False)
+    return part_one_parsed(parse(lines))
+
+
+def part_one_parsed(almanac: Almanac) -> int:
+    """
+    Finds the lowest location of the seeds listed in the almanac.
+
+    Args:
+        almanac (Almanac): The parsed seed numbers and mapping.
+
+    Returns:
+        int: The lowest location number.
+    """
+    return runner(almanac, False)
 
 
 def part_two(lines: list[str]) -> int:
     """
     part one
     """
-    return runner(lines, True)
+    return part_two_parsed(parse(lines))
+
+
+def part_two_parsed(almanac: Almanac) -> int:
+    """
+    Finds the lowest location of the seed ranges listed in the almanac.
+
+    Args:
+        almanac (Almanac): The parsed seed numbers and mapping.
+
+    Returns:
+        int: The lowest location number.
+    """
+    return runner(almanac, True)
 
 
-def runner(lines: list[str], seeds_as_range: bool) -> int:
+def runner(almanac: Almanac, seeds_as_range: bool) -> int:
     """
-    Runs the mapping algorithm based on the given lines and seeds.
+    Runs the mapping algorithm based on the given almanac and seeds.
 
     Args:
-        lines (list): List of lines containing mapping information.
+        almanac (Almanac): The parsed seed numbers and mapping.
         seeds_as_range (bool): Flag indicating whether seeds are given as ranges.
 
     Returns:
         int: The minimum location value obtained from the mapping algorithm.
     """
-    seeds: list[str] | list[range] = []  # type: ignore
+    seed_nums, mapping = almanac
+    seeds = get_seeds(seed_nums, seeds_as_range)
+    total = sum(len(seed) if isinstance(seed, range) else 1 for seed in seeds)
+    locations: list[int] = []
+    done = 0
+    for seed in seeds:
+        if isinstance(seed, range):
+            # Seed ranges are huge, so keep only the lowest location per chunk of seeds and
+            # report the progress once per chunk.
+            for start in range(seed.start, seed.stop, CHECKPOINT_STEP):
+                chunk = range(start, min(start + CHECKPOINT_STEP, seed.stop))
+                locations.append(min(traverse_mapping(mapping, x) for x in chunk))
+                done += len(chunk)
+                budget.checkpoint("seeds", done, total)
+        else:
+            locations.append(traverse_mapping(mapping, seed))
+    return min(locations)
+
+
+def parse(lines: list[str]) -> Almanac:
+    """
+    Parses the almanac once, so that both parts can be answered from the result.
+
+    Args:
+        lines (list[str]): List of lines containing the seeds and the mapping information.
+
+    Returns:
+        Almanac: The seed numbers and the mapping.
+    """
+    seed_nums: list[int] = []
     mapping: Mapping = Mapping({})
     current_map = ""
     for line in lines:
         if line.split(":")[0] == "seeds":
-            seeds = get_seeds(line, seeds_as_range)
+            seed_nums = util.ints(line.split(":")[1])
             continue
         current_map = resolve_current_map(current_map, line)
-        map_values = re.findall(r"\d+", line)
+        map_values = util.ints(line)
         update_mapping(mapping, current_map, map_values)
-
-    # Cast the dictionary to the Mapping type
-    mapping = Mapping(mapping)
-    locations: list[int] = []
-    for _, seed in enumerate(seeds):
-        if isinstance(seed, range):
-            # print(f"range: {_+1}/{len(seeds)}, {seed}")
-            locations.extend([traverse_mapping(mapping, x) for x in seed])
-        else:
-            locations.append(traverse_mapping(mapping, int(seed)))  # type: ignore
-    return min(locations)
+    return seed_nums, mapping
 
 
 def traverse_mapping(mapping: Mapping, seed: int) -> int:
@@ -112,7 +164,7 @@ def resolve_current_map(current_map: str, line: str) -> str:
     return current_map
 
 
-def update_mapping(mapping: Mapping, current_map: str, values: list[str]) -> None:
+def update_mapping(mapping: Mapping, current_map: str, values: list[int]) -> None:
     """
     Update the mapping dictionary with the given values for the current_map.
 
@@ -128,9 +180,9 @@ def update_mapping(mapping: Mapping, current_map: str, values: list[str]) -> Non
         return
     current_map_mapping: SingleMapping = mapping.get(current_map, SingleMapping({}))
     destination, source, length = values
-    current_map_mapping[int(source)] = {
-        "destination": int(destination),
-        "length": int(length),
+    current_map_mapping[source] = {
+        "destination": destination,
+        "length": length,
     }
     mapping[current_map] = current_map_mapping
 
@@ -154,29 +206,28 @@ def get_destination(mapping: SingleMapping, source: int) -> int:
     return source
 
 
-def get_seeds(seeds_line: str, ranges: bool) -> list[str] | list[range]:
+def get_seeds(nums: list[int], ranges: bool) -> list[int] | list[range]:
     """
-    Extracts seeds from a line and returns them as a list of integers.
+    Returns the seeds given by the seed numbers of the almanac.
 
     Parameters:
-    seeds_line (str): The line containing the seeds.
+    nums (list[int]): The seed numbers.
     ranges (bool): Flag indicating whether to return seed ranges or individual seeds.
 
     Returns:
-    list: A list of integers representing the seeds.
+    list: A list of integers or ranges representing the seeds.
     """
-    nums: list[str] = re.findall(r"\d+", seeds_line.split(":")[1])
     if not ranges:
         return nums
 
     seed_ranges: list[range] = []
     for i in range(0, len(nums), 2):
-        seed_range = range(int(nums[i]), int(nums[i]) + int(nums[i + 1]))
+        seed_range = range(nums[i], nums[i] + nums[i + 1])
         seed_ranges.append(seed_range)
     return seed_ranges
 
 
 if __name__ == "__main__":
-    file_lines = util.get_lines("day05")
-    print("Part one: " + str(part_one(file_lines)))
-    # print("Part two: " + str(part_two(file_lines))) # this takes ages :-/
+    parsed_almanac = parse(util.get_lines("day05"))
+    print("Part one: " + str(part_one_parsed(parsed_almanac)))
+    # print("Part two: " + str(part_two_parsed(parsed_almanac))) # this takes ages :-/
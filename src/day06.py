@@ -1,6 +1,8 @@
 """Advent of Code 2023 - Day 6 tasks"""
 
-import re
+import itertools
+import mmap
+from typing import Iterable
 
 # pylint: disable=import-error
 if not __package__:
@@ -8,39 +10,94 @@ if not __package__:
 else:
     from . import util
 
+# The race times and the record distances of the races.
+Races = tuple[list[int], list[int]]
 
-def part_one(lines: list[str]) -> int:
+
+def part_one(lines: Iterable[str]) -> int:
     """
     part one
     """
+    return part_one_parsed(parse(lines))
+
+
+def part_one_parsed(races: Races) -> int:
+    """
+    Multiplies together the number of ways to beat the record of each race.
+
+    Args:
+        races (Races): The parsed race times and record distances.
+
+    Returns:
+        int: The product of the number of ways to win.
+    """
     total = 1
-    times = re.findall(r"\d+", lines[0])
-    distances = re.findall(r"\d+", lines[1])
+    times, distances = races
     for i, time in enumerate(times):
-        min_time = calc_min_hold_time(int(time), int(distances[i]))
-        max_time = calc_max_hold_time(int(time), int(distances[i]))
+        min_time = calc_min_hold_time(time, distances[i])
+        max_time = calc_max_hold_time(time, distances[i])
         total = total * len(range(min_time, max_time + 1))
     return total
 
 
-def part_two(lines: list[str]) -> int:
+def part_two(lines: Iterable[str]) -> int:
     """
     part two
     """
+    return part_two_parsed(parse(lines))
+
+
+def part_two_parsed(races: Races) -> int:
+    """
+    Counts the ways to beat the record of the single race given by joining the numbers.
 
-    times = re.findall(r"\d+", lines[0])
-    distances = re.findall(r"\d+", lines[1])
+    Args:
+        races (Races): The parsed race times and record distances.
+
+    Returns:
+        int: The number of ways to win.
+    """
+    times, distances = races
     time = ""
     distance = ""
     for i, xx in enumerate(times):
-        time += xx
-        distance += distances[i]
+        time += str(xx)
+        distance += str(distances[i])
     min_time = calc_min_hold_time(int(time), int(distance))
     max_time = calc_max_hold_time(int(time), int(distance))
     total = len(range(min_time, max_time + 1))
     return total
 
 
+def parse(lines: Iterable[str]) -> Races:
+    """
+    Parses the race sheet once, so that both parts can be answered from the result.
+
+    Args:
+        lines (Iterable[str]): The race sheet, times first and distances second.
+
+    Returns:
+        Races: The race times and the record distances.
+    """
+    times_line, distances_line = itertools.islice(lines, 2)
+    return util.ints(times_line), util.ints(distances_line)
+
+
+def parse_buffer(data: bytes | memoryview | mmap.mmap) -> Races:
+    """
+    Parses the race sheet straight from its bytes, such as a memory-mapped input. The times
+    are the first half of its integers and the distances the second.
+
+    Args:
+        data (bytes | memoryview | mmap.mmap): The race sheet.
+
+    Returns:
+        Races: The race times and the record distances.
+    """
+    numbers = util.ints_array(data).tolist()
+    return numbers[: len(numbers) // 2], numbers[len(numbers) // 2 :]
+
+
 def calc_min_hold_time(time: int, distance: int) -> int:
     """
     Calculates the minimum hold time required to travel a given distance within a given time.
@@ -88,6 +145,6 @@ def calc_max_hold_time(time: int, distance: int) -> int:
 
 
 if __name__ == "__main__":
-    file_lines = util.get_lines("day06")
-    print("Part one: " + str(part_one(file_lines)))
-    print("Part two: " + str(part_two(file_lines)))
+    race_sheet = parse(util.iter_lines(util.get_path("day06")))
+    print("Part one: " + str(part_one_parsed(race_sheet)))
+    print("Part two: " + str(part_two_parsed(race_sheet)))
@@ -3,6 +3,8 @@
 from typing import TypedDict
 
 Hand = TypedDict("Hand", {"bids": int, "cards": list[int], "hand": dict[str, list[int] | None]})
+# A hand as it is played, (card labels, bid).
+Play = tuple[str, int]
 
 # pylint: disable=import-error
 if not __package__:
@@ -15,14 +17,57 @@ def part_one(lines: list[str]) -> int:
     """
     part one
     """
-    return calculate_bids(sort_hands(resolve_hands(lines, False)))
+    return part_one_parsed(parse(lines))
+
+
+def part_one_parsed(plays: list[Play]) -> int:
+    """
+    Calculates the total winnings of the hands.
+
+    Args:
+        plays (list[Play]): The parsed cards and bids.
+
+    Returns:
+        int: The total winnings.
+    """
+    return calculate_bids(sort_hands(resolve_hands(plays, False)))
 
 
 def part_two(lines: list[str]) -> int:
     """
     part two
     """
-    return calculate_bids(sort_hands(resolve_hands(lines, True)))
+    return part_two_parsed(parse(lines))
+
+
+def part_two_parsed(plays: list[Play]) -> int:
+    """
+    Calculates the total winnings of the hands when J cards are jokers.
+
+    Args:
+        plays (list[Play]): The parsed cards and bids.
+
+    Returns:
+        int: The total winnings.
+    """
+    return calculate_bids(sort_hands(resolve_hands(plays, True)))
+
+
+def parse(lines: list[str]) -> list[Play]:
+    """
+    Parses the hands once, so that both parts can be answered from the result.
+
+    Args:
+        lines (list[str]): The hands and their bids.
+
+    Returns:
+        list[Play]: The card labels and the bid of every hand.
+    """
+    plays: list[Play] = []
+    for line in lines:
+        labels, bids = line.split(" ")
+        plays.append((labels, int(bids)))
+    return plays
 
 
 # pylint: disable-next=too-many-return-statements
@@ -52,21 +97,20 @@ def map_to_number(char: str, joker: bool = False) -> int:
     return int(char)
 
 
-def resolve_hands(lines: list[str], joker: bool) -> list[Hand]:
+def resolve_hands(plays: list[Play], joker: bool) -> list[Hand]:
     """
-    Resolves the hands from the given lines and joker.
+    Resolves the hands from the given plays and joker.
 
     Args:
-        lines (list): List of strings representing the lines.
+        plays (list[Play]): The parsed cards and bids.
         joker (str): The joker character.
 
     Returns:
         list: List of dictionaries representing the resolved hands.
     """
     hands: list[Hand] = []
-    for line in lines:
-        cards = list(map(lambda char: map_to_number(char, joker), line.split(" ")[0]))
-        bids = int(line.split(" ")[1])
+    for labels, bids in plays:
+        cards = list(map(lambda char: map_to_number(char, joker), labels))
         hands.append(Hand({"hand": group_hand(cards), "cards": cards, "bids": bids}))
     return hands
 
@@ -205,6 +249,6 @@ def calculate_bids(hands_sorted: list[Hand]) -> int:
 
 
 if __name__ == "__main__":
-    file_lines = util.get_lines("day07")
-    print("Part one: " + str(part_one(file_lines)))
-    print("Part two: " + str(part_two(file_lines)))
+    file_plays = parse(util.get_lines("day07"))
+    print("Part one: " + str(part_one_parsed(file_plays)))
+    print("Part two: " + str(part_two_parsed(file_plays)))
@@ -9,6 +9,9 @@ if not __package__:
 else:
     from . import util
 
+# The left/right instructions and the mapping of each node to its left and right node.
+Network = tuple[str, dict[str, list[str]]]
+
 
 def part_one(lines: list[str]) -> int:
     """
@@ -20,7 +23,20 @@ def part_one(lines: list[str]) -> int:
     Returns:
         int: The result of part one.
     """
-    instructions, mapping = instructions_and_mapping(lines)
+    return part_one_parsed(parse(lines))
+
+
+def part_one_parsed(network: Network) -> int:
+    """
+    Calculate the number of steps from AAA to ZZZ.
+
+    Args:
+        network (Network): The parsed instructions and mapping.
+
+    Returns:
+        int: The result of part one.
+    """
+    instructions, mapping = network
     return runner(instructions, mapping, "AAA", "ZZZ")
 
 
@@ -35,7 +51,21 @@ def part_two(lines: list[str]) -> int:
     Returns:
         int: The least common multiple (LCM) of the execution times.
     """
-    instructions, mapping = instructions_and_mapping(lines)
+    return part_two_parsed(parse(lines))
+
+
+def part_two_parsed(network: Network) -> int:
+    """
+    Calculate the least common multiple (LCM) of the execution times of all nodes
+    ending with 'A' in the parsed network.
+
+    Args:
+        network (Network): The parsed instructions and mapping.
+
+    Returns:
+        int: The least common multiple (LCM) of the execution times.
+    """
+    instructions, mapping = network
     filtered_mapping: dict[str, list[str]] = {}
     for key, value in mapping.items():
         if key.endswith("A"):
@@ -47,20 +77,22 @@ def part_two(lines: list[str]) -> int:
     return lcm(*lcms)
 
 
-def instructions_and_mapping(lines: list[str]) -> tuple[str, dict[str, list[str]]]:
+def parse(lines: list[str]) -> Network:
     """
     Extracts instructions and creates a mapping from the given lines.
 
+    The lines are left untouched, so that both parts can be answered from the result.
+
     Args:
-        lines (list[str]): A list of values in the format AAA (BBB,CCC).
+        lines (list[str]): The instructions followed by values in the format AAA (BBB,CCC).
 
     Returns:
-        dict: A mapping of instructions.
+        Network: The instructions and a mapping of the nodes.
 
     """
-    instructions = lines.pop(0).strip()
+    instructions = lines[0].strip()
     mapping: dict[str, list[str]] = {}
-    for line in lines:
+    for line in lines[1:]:
         if not line:
             continue
         chunks: list[str] = re.findall(r"[\dA-Z]+", line)
@@ -99,5 +131,6 @@ def runner(instructions: str, mapping: dict[str, list[str]], current: str, endin
 
 
 if __name__ == "__main__":
-    print("Part one: " + str(part_one(util.get_lines("day08"))))
-    print("Part two: " + str(part_two(util.get_lines("day08"))))
+    file_network = parse(util.get_lines("day08"))
+    print("Part one: " + str(part_one_parsed(file_network)))
+    print("Part two: " + str(part_two_parsed(file_network)))
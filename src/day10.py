@@ -8,6 +8,9 @@ if not __package__:
 else:
     from . import util
 
+# Functions whose calls are counted by the runner's --stats.
+HOT_FUNCTIONS = ("next_direction", "move")
+
 
 def part_one(lines: list[str]) -> int:
     """
@@ -19,13 +22,26 @@ def part_one(lines: list[str]) -> int:
     Returns:
         int: The number of moves required.
     """
-    s_coords = resolve_start_pos(lines)
-    next_pos = resolve_start_direction(s_coords, lines)
+    return part_one_parsed(parse(lines))
+
+
+def part_one_parsed(grid: util.Grid) -> int:
+    """
+    Calculate the number of moves to the farthest point of the loop in the parsed grid.
+
+    Args:
+        grid (util.Grid): The parsed grid of pipes.
+
+    Returns:
+        int: The number of moves required.
+    """
+    s_coords = grid.find("S")
+    next_pos = resolve_start_direction(s_coords, grid)
 
     moves = 0
     while next_pos is not None and next_pos[:2] != s_coords:
         moves += 1
-        next_pos = move(next_pos, lines)
+        next_pos = move(next_pos, grid)
 
     return int(math.ceil(moves / 2))
 
@@ -41,30 +57,40 @@ def part_two(lines: list[str]) -> int:
         int: The count of inside characters.
 
     """
-    s_coords = resolve_start_pos(lines)
-    next_pos = resolve_start_direction(s_coords, lines)
+    return part_two_parsed(parse(lines))
 
-    seen: dict[int, dict[int, bool]] = {}
 
-    a = seen.get(s_coords[0], {})
-    a[s_coords[1]] = True
-    seen[s_coords[0]] = a
+def part_two_parsed(grid: util.Grid) -> int:
+    """
+    Counts the number of tiles enclosed by the loop in the parsed grid.
+
+    Args:
+        grid (util.Grid): The parsed grid of pipes.
+
+    Returns:
+        int: The count of inside characters.
+    """
+    s_coords = grid.find("S")
+    next_pos = resolve_start_direction(s_coords, grid)
+
+    # One flag per cell, flat-indexed like the grid itself.
+    seen = bytearray(len(grid.cells))
+    seen[s_coords[0] * grid.width + s_coords[1]] = True
 
     moves = 0
     while next_pos is not None and next_pos[:2] != s_coords:
-        a = seen.get(next_pos[0], {})
-        a[next_pos[1]] = True
-        seen[next_pos[0]] = a
+        seen[next_pos[0] * grid.width + next_pos[1]] = True
 
         moves += 1
-        next_pos = move(next_pos, lines)
+        next_pos = move(next_pos, grid)
 
     inside_chars = 0
-    for i, line in enumerate(lines):
+    for i in range(grid.height):
         inside = False
         angle = ""
-        for j, char in enumerate(line):
-            seen_char = is_seen(i, j, seen)
+        for j in range(grid.width):
+            char = grid[i, j]
+            seen_char = bool(seen[i * grid.width + j])
             angle, inside = handle_angle(seen_char, char, angle, inside)
 
             if seen_char and char == "|":
@@ -75,6 +101,19 @@ def part_two(lines: list[str]) -> int:
     return inside_chars
 
 
+def parse(lines: list[str]) -> util.Grid:
+    """
+    Parses the grid of pipes once, so that both parts can be answered from the result.
+
+    Args:
+        lines (list[str]): The lines representing the grid.
+
+    Returns:
+        util.Grid: The grid of pipes.
+    """
+    return util.Grid.from_lines(lines)
+
+
 def handle_angle(
     seen_char: bool, char: str, angle: str, inside: bool
 ) -> tuple[str, bool]:
@@ -108,70 +147,37 @@ def handle_angle(
     return angle, inside
 
 
-def is_seen(i: int, j: int, seen: dict[int, dict[int, bool]]) -> bool:
-    """
-    Check if a specific element is seen in the 'seen' dictionary.
-
-    Args:
-        i (int): The first key of the 'seen' dictionary.
-        j (int): The second key of the nested dictionary inside 'seen'.
-        seen (dict[int, dict[int, bool]]): The dictionary to check.
-
-    Returns:
-        bool: True if the element is seen, False otherwise.
-    """
-    return seen.get(i, {}).get(j, False)
-
-
-def resolve_start_pos(lines: list[str]) -> tuple[int, int]:
-    """
-    Finds the position of the character 'S' in the given lines.
-
-    Args:
-        lines (list[str]): The lines to search for the character 'S'.
-
-    Returns:
-        tuple[int, int]: The row and column indices of the character 'S' if found,
-                         otherwise (-1, -1).
-    """
-    for i, line in enumerate(lines):
-        for j, char in enumerate(line):
-            if char == "S":
-                return i, j
-    return -1, -1  # Return -1, -1 if 'S' is not found in the lines
-
-
 def resolve_start_direction(
     s_coords: tuple[int, int],
-    lines: list[str],
+    grid: util.Grid,
 ) -> tuple[int, int, str] | None:
     """
-    Resolves the starting direction based on the given coordinates and lines.
+    Resolves the starting direction based on the given coordinates and grid.
 
     Args:
         s_coords (tuple[int, int]): The starting coordinates.
-        lines (list[str]): The lines containing the directions.
+        grid (util.Grid): The grid containing the pipes.
 
     Returns:
         tuple[int, int, str] | None: A tuple containing the updated coordinates and the
         next direction, or None if no valid direction is found.
     """
     i, j = s_coords
-    if "-J7".find(lines[i][j + 1]) != -1:
-        return (i, j + 1, next_direction(s_coords, (i, j + 1), lines))
-    if "-LF".find(lines[i][j - 1]) != -1:
-        return (i, j - 1, next_direction(s_coords, (i, j - 1), lines))
-    if "|LJ".find(lines[i + 1][j]) != -1:
-        return (i + 1, j, next_direction(s_coords, (i + 1, j), lines))
-    if "|7F".find(lines[i - 1][j]) != -1:
-        return (i - 1, j, next_direction(s_coords, (i - 1, j), lines))
+    if grid.in_bounds(i, j + 1) and grid[i, j + 1] in "-J7":
+        return (i, j + 1, next_direction(s_coords, (i, j + 1), grid))
+    if grid.in_bounds(i, j - 1) and grid[i, j - 1] in "-LF":
+        return (i, j - 1, next_direction(s_coords, (i, j - 1), grid))
+    if grid.in_bounds(i + 1, j) and grid[i + 1, j] in "|LJ":
+        return (i + 1, j, next_direction(s_coords, (i + 1, j), grid))
+    if grid.in_bounds(i - 1, j) and grid[i - 1, j] in "|7F":
+        return (i - 1, j, next_direction(s_coords, (i - 1, j), grid))
     return None
 
 
 def next_direction(
     current: tuple[int, int],
     next_pos: tuple[int, int],
-    lines: list[str],
+    grid: util.Grid,
 ) -> str:
     """
     Determines the next direction based on the current position and the next position.
@@ -179,7 +185,7 @@ def next_direction(
     Args:
         current (tuple[int, int]): The current position as a tuple of (row, column).
         next_pos (tuple[int, int]): The next position as a tuple of (row, column).
-        lines (list[str]): The lines representing the grid.
+        grid (util.Grid): The grid of pipes.
 
     Returns:
         str: The next direction as a string ("up", "down", "left", or "right").
@@ -188,7 +194,7 @@ def next_direction(
     ii, jj = next_pos
 
     direction: str = ""
-    char = lines[ii][jj]
+    char = grid[ii, jj]
     if char == "|" and i + 1 == ii and j == jj:
         direction = "down"
     elif char == "|" and i - 1 == ii and j == jj:
@@ -218,14 +224,14 @@ def next_direction(
 
 def move(
     coords: tuple[int, int, str],
-    lines: list[str],
+    grid: util.Grid,
 ) -> tuple[int, int, str] | None:
     """
     Move the coordinates in the specified direction and return the updated coordinates.
 
     Args:
         coords (tuple[int, int, str]): The current coordinates (i, j, direction).
-        lines (list[str]): The lines representing the grid.
+        grid (util.Grid): The grid of pipes.
 
     Returns:
         tuple[int, int, str] | None: The updated coordinates (i, j, direction) if the move is valid,
@@ -233,16 +239,17 @@ def move(
     """
     i, j, direction = coords
     if direction == "right":
-        return i, j + 1, next_direction((i, j), (i, j + 1), lines)
+        return i, j + 1, next_direction((i, j), (i, j + 1), grid)
     if direction == "left":
-        return i, j - 1, next_direction((i, j), (i, j - 1), lines)
+        return i, j - 1, next_direction((i, j), (i, j - 1), grid)
     if direction == "up":
-        return i - 1, j, next_direction((i, j), (i - 1, j), lines)
+        return i - 1, j, next_direction((i, j), (i - 1, j), grid)
     if direction == "down":
-        return i + 1, j, next_direction((i, j), (i + 1, j), lines)
+        return i + 1, j, next_direction((i, j), (i + 1, j), grid)
     return None
 
 
 if __name__ == "__main__":
-    print("Part one: " + str(part_one(util.get_lines("day10"))))
-    print("Part two: " + str(part_two(util.get_lines("day10"))))
+    pipes = parse(util.get_lines("day10"))
+    print("Part one: " + str(part_one_parsed(pipes)))
+    print("Part two: " + str(part_two_parsed(pipes)))
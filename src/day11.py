@@ -1,6 +1,5 @@
 """Advent of Code 2023 - Day 11 tasks"""
 
-
 # pylint: disable=import-error
 if not __package__:
     import util  # type: ignore
@@ -18,24 +17,53 @@ def part_one(lines: list[str]) -> int:
     Returns:
         int: The total number of paths between points.
     """
-    return part_two(lines, 2)
+    return part_one_parsed(parse(lines))
 
 
-# pylint: disable-next=too-many-locals
-def part_two(lines: list[str], dot_row_or_col_multiplier: int) -> int:
+def part_one_parsed(grid: util.Grid) -> int:
+    """
+    Calculates the total number of paths between points in a parsed galaxy map.
+
+    Args:
+        grid (util.Grid): The parsed galaxy map.
+
+    Returns:
+        int: The total number of paths between points.
+    """
+    return part_two_parsed(grid, 2)
+
+
+def part_two(lines: list[str], dot_row_or_col_multiplier: int = 1000000) -> int:
     """
     Calculates the number of paths between dots in a galaxy map.
 
     Args:
         lines (list[str]): The lines representing the galaxy map.
+        dot_row_or_col_multiplier (int): The multiplier for paths between
+                                         dots in the same row or column. Defaults to the
+                                         puzzle's expansion factor of one million.
+
+    Returns:
+        int: The total number of paths between dots in the galaxy map.
+    """
+    return part_two_parsed(parse(lines), dot_row_or_col_multiplier)
+
+
+# pylint: disable-next=too-many-locals
+def part_two_parsed(grid: util.Grid, dot_row_or_col_multiplier: int = 1000000) -> int:
+    """
+    Calculates the number of paths between dots in a parsed galaxy map.
+
+    Args:
+        grid (util.Grid): The parsed galaxy map.
         dot_row_or_col_multiplier (int): The multiplier for paths between
                                          dots in the same row or column.
 
     Returns:
         int: The total number of paths between dots in the galaxy map.
     """
-    dot_rows, dot_cols = get_dot_rows_and_cols(lines)
-    galaxy_map = build_galaxy_map(lines)
+    dot_rows, dot_cols = get_dot_rows_and_cols(grid)
+    galaxy_map = build_galaxy_map(grid)
 
     paths = 0
     for g, (x1, y1) in galaxy_map.items():
@@ -60,50 +88,56 @@ def part_two(lines: list[str], dot_row_or_col_multiplier: int) -> int:
     return paths
 
 
-def get_dot_rows_and_cols(lines: list[str]) -> tuple[list[int], list[int]]:
+def parse(lines: list[str]) -> util.Grid:
+    """
+    Parses the galaxy map once, so that both parts can be answered from the result.
+
+    Args:
+        lines (list[str]): The lines representing the galaxy map.
+
+    Returns:
+        util.Grid: The galaxy map as a grid.
+    """
+    return util.Grid.from_lines(lines)
+
+
+def get_dot_rows_and_cols(grid: util.Grid) -> tuple[list[int], list[int]]:
     """
     Gets the rows and columns that contain only dots.
 
     Args:
-        lines (list[str]): The lines to check.
+        grid (util.Grid): The galaxy map to check.
 
     Returns:
         tuple[list[int], list[int]]: A tuple containing the rows and columns that contain
                                      only dots.
     """
     dot_rows = []
-    for i, line in enumerate(lines):
-        if all(char == "." for char in line):
+    for i in range(grid.height):
+        if not grid.row(i).tobytes().strip(b"."):
             dot_rows.append(i)
 
     dot_cols = []
-    cols_length = len(lines[0])
-    for i in range(cols_length):
-        if all(line[i] == "." for line in lines):
+    for i in range(grid.width):
+        if not grid.column(i).strip(b"."):
             dot_cols.append(i)
     return dot_rows, dot_cols
 
 
-def build_galaxy_map(lines: list[str]) -> dict[int, tuple[int, int]]:
+def build_galaxy_map(grid: util.Grid) -> dict[int, tuple[int, int]]:
     """
-    Builds a galaxy map based on the given lines.
+    Builds a galaxy map based on the given grid.
 
     Args:
-        lines (list[str]): The lines representing the galaxy map.
+        grid (util.Grid): The grid representing the galaxy map.
 
     Returns:
         dict[int, tuple[int, int]]: A dictionary mapping galaxy numbers to their coordinates.
     """
-    galaxy_nbr = 0
-    galaxy_map = {}
-    for i, line in enumerate(lines):
-        for j, char in enumerate(line):
-            if char == "#":
-                galaxy_nbr += 1
-                galaxy_map[galaxy_nbr] = (i, j)
-    return galaxy_map
+    return dict(enumerate(grid.find_all("#"), start=1))
 
 
 if __name__ == "__main__":
-    print("Part one: " + str(part_one(util.get_lines("day11"))))
-    print("Part two: " + str(part_two(util.get_lines("day11"), 1000000)))
+    galaxy_grid = parse(util.get_lines("day11"))
+    print("Part one: " + str(part_one_parsed(galaxy_grid)))
+    print("Part two: " + str(part_two_parsed(galaxy_grid, 1000000)))
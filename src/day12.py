@@ -2,6 +2,7 @@
 
 
 import functools
+from typing import Iterable
 
 # pylint:disable=import-error
 if not __package__:
@@ -9,46 +10,122 @@ if not __package__:
 else:
     from . import util
 
+# A condition record as (row of springs, damaged group sizes).
+Record = tuple[str, tuple[int, ...]]
 
-def part_one(lines: list[str]) -> int:
+
+def part_one(lines: Iterable[str]) -> int:
     """
     Calculates the total number of possibilities for each line in the given list of strings.
 
     Args:
-        lines (list[str]): A list of strings representing each line.
+        lines (Iterable[str]): An iterable of strings representing each line.
 
     Returns:
         int: The total number of possibilities.
 
     """
+    return part_one_parsed(map(parse_record, lines))
+
+
+def part_one_parsed(records: Iterable[Record]) -> int:
+    """
+    Sums the possible arrangements of the parsed condition records.
+
+    Args:
+        records (Iterable[Record]): The parsed condition records.
+
+    Returns:
+        int: The sum of the possible arrangements.
+    """
     total = 0
-    for line in lines:
-        row_and_sizes = line.split()
-        row = row_and_sizes[0]
-        sizes = tuple(map(int, row_and_sizes[1].split(",")))
+    for row, sizes in records:
         total += count_possibilities(row + ".", sizes)
     return total
 
 
-def part_two(lines: list[str]) -> int:
+def part_two(lines: Iterable[str]) -> int:
     """
     Calculates the total number of possibilities based on the given lines.
 
     Args:
-        lines (list[str]): The input lines.
+        lines (Iterable[str]): The input lines.
 
     Returns:
         int: The total number of possibilities.
     """
+    return part_two_parsed(map(parse_record, lines))
+
+
+def part_two_parsed(records: Iterable[Record]) -> int:
+    """
+    Sums the possible arrangements of the parsed condition records unfolded five times.
+
+    Args:
+        records (Iterable[Record]): The parsed condition records.
+
+    Returns:
+        int: The sum of the possible arrangements.
+    """
     total = 0
-    for line in lines:
-        row_and_sizes = line.split()
-        row = row_and_sizes[0]
-        sizes = tuple(map(int, row_and_sizes[1].split(",")))
+    for row, sizes in records:
         total += count_possibilities("?".join([row] * 5) + ".", sizes * 5)
     return total
 
 
+def part_one_line(line: str) -> int:
+    """
+    Calculates the possible arrangements of a single condition record.
+
+    Args:
+        line (str): The input line.
+
+    Returns:
+        int: The value of the line.
+    """
+    return part_one_parsed((parse_record(line),))
+
+
+def part_two_line(line: str) -> int:
+    """
+    Calculates the possible arrangements of a single condition record unfolded five times.
+
+    Args:
+        line (str): The input line.
+
+    Returns:
+        int: The value of the line.
+    """
+    return part_two_parsed((parse_record(line),))
+
+
+def parse(lines: Iterable[str]) -> list[Record]:
+    """
+    Parses the condition records once, so that both parts can be answered from the result.
+
+    Args:
+        lines (Iterable[str]): The condition records.
+
+    Returns:
+        list[Record]: The row and the damaged group sizes of every record.
+    """
+    return list(map(parse_record, lines))
+
+
+def parse_record(line: str) -> Record:
+    """
+    Parses a condition record into its row of springs and its damaged group sizes.
+
+    Args:
+        line (str): The condition record.
+
+    Returns:
+        Record: A tuple of (row, group sizes).
+    """
+    row_and_sizes = line.split()
+    return row_and_sizes[0], tuple(map(int, row_and_sizes[1].split(",")))
+
+
 @functools.cache
 def count_possibilities(
     row_str: str,
@@ -78,9 +155,7 @@ def count_possibilities(
     for char in char_options:
         if char == "#":
             # Extend ongoing group
-            count += count_possibilities(
-                row_str[1:], group_sizes, handled_chars_in_group + 1
-            )
+            count += count_possibilities(row_str[1:], group_sizes, handled_chars_in_group + 1)
         else:
             if handled_chars_in_group:
                 if group_sizes and group_sizes[0] == handled_chars_in_group:
@@ -93,5 +168,6 @@ def count_possibilities(
 
 
 if __name__ == "__main__":
-    print("Part one: " + str(part_one(util.get_lines("day12"))))
-    print("Part two: " + str(part_two(util.get_lines("day12"))))
+    file_records = parse(util.iter_lines(util.get_path("day12")))
+    print("Part one: " + str(part_one_parsed(file_records)))
+    print("Part two: " + str(part_two_parsed(file_records)))
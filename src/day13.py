@@ -15,11 +15,23 @@ def part_one(lines: list[str]) -> int:
     Args:
         lines (list[str]): The list of patterns.
 
+    Returns:
+        int: The total score.
+    """
+    return part_one_parsed(parse(lines))
+
+
+def part_one_parsed(patterns: list[util.Grid]) -> int:
+    """
+    Calculate the total score of the parsed patterns.
+
+    Args:
+        patterns (list[util.Grid]): The parsed patterns.
+
     Returns:
         int: The total score.
     """
     total = 0
-    patterns = lines_to_patterns(lines)
     for pattern in patterns:
         h_score = calc_horizontal_score(pattern)
         if h_score:
@@ -39,146 +51,97 @@ def part_two(lines: list[str]) -> int:
     Args:
         lines (list[str]): The list of patterns.
 
+    Returns:
+        int: The total score.
+    """
+    return part_two_parsed(parse(lines))
+
+
+def part_two_parsed(patterns: list[util.Grid]) -> int:
+    """
+    Calculates the total score of the parsed patterns, fixing one smudge in each.
+
+    Args:
+        patterns (list[util.Grid]): The parsed patterns.
+
     Returns:
         int: The total score.
     """
     total = 0
-    patterns = lines_to_patterns(lines)
     for pattern in patterns:
-        for i in range(len(pattern) - 1):
+        for i in range(pattern.height - 1):
             h_score = check_horizontal_match2(pattern, i)
             if h_score:
                 total += 100 * h_score
 
-        for col in range(len(pattern[0]) - 1):
-            v_col = check_vertical_match2(pattern, col)
+        transposed = pattern.transpose()
+        for col in range(transposed.height - 1):
+            v_col = check_horizontal_match2(transposed, col)
             if v_col:
                 total += v_col
 
     return total
 
 
-def lines_to_patterns(lines: list[str]) -> list[list[str]]:
+def parse(lines: list[str]) -> list[util.Grid]:
     """
-    Converts a list of lines into a list of patterns.
+    Converts a list of lines into a list of patterns, so that both parts can be answered from
+    the result.
 
     Args:
         lines (list[str]): The input lines to be converted into patterns.
 
     Returns:
-        list[list[str]]: A list of patterns, where each pattern is a list of strings.
+        list[util.Grid]: A list of patterns, one grid per block of lines.
     """
-    patterns: list[list[str]] = []
+    patterns: list[util.Grid] = []
     pattern: list[str] = []
     for line in lines:
         if not line:
-            patterns.append(pattern)
+            patterns.append(util.Grid.from_lines(pattern))
             pattern = []
             continue
         pattern.append(line)
-    patterns.append(pattern)
+    patterns.append(util.Grid.from_lines(pattern))
     return patterns
 
 
-def calc_vertical_score(pattern: list[str]) -> int:
+def calc_vertical_score(pattern: util.Grid) -> int:
     """
-    Calculate the vertical score of a pattern.
+    Calculates the vertical score of a pattern, which is the horizontal score of its
+    transpose.
 
     Args:
-        pattern (list[str]): The pattern to calculate the vertical score for.
+        pattern (util.Grid): The pattern to calculate the vertical score for.
 
     Returns:
         int: The vertical score of the pattern.
     """
-    row_len = len(pattern[0])
-    for i in range(row_len - 1):
-        all_match = True
-        for line in pattern:
-            if line[i] != line[i + 1]:
-                all_match = False
-                break
-        if all_match and check_vertical_match(pattern, i):
-            return i + 1
-    return 0
+    return calc_horizontal_score(pattern.transpose())
 
 
-def check_vertical_match(pattern: list[str], col_nbr: int) -> bool:
-    """
-    Check if there is a vertical match in the given pattern at the specified column number.
-
-    Args:
-        pattern (list[str]): The pattern to check for a vertical match.
-        col_nbr (int): The column number to check.
-
-    Returns:
-        bool: True if there is a vertical match, False otherwise.
-    """
-    for line in pattern:
-        a = col_nbr
-        b = col_nbr + 1
-        while True:
-            if line[a] != line[b]:
-                return False
-            a -= 1
-            b += 1
-            if a < 0 or b >= len(pattern[0]):
-                break
-    return True
-
-
-def check_vertical_match2(pattern: list[str], col_nbr: int) -> int:
-    """
-    Check if there is a vertical match in the given pattern at the specified column number.
-
-    Args:
-        pattern (list[str]): The pattern to check for vertical match.
-        col_nbr (int): The column number to check.
-
-    Returns:
-        int: The column number if there is a vertical match, otherwise 0.
-    """
-    smudges = 0
-    for line in pattern:
-        a = col_nbr
-        b = col_nbr + 1
-        while True:
-            if line[a] != line[b]:
-                smudges += 1
-                if smudges > 1:
-                    return 0
-            a -= 1
-            b += 1
-            if a < 0 or b >= len(pattern[0]):
-                break
-    if not smudges:
-        return 0
-    return col_nbr + 1
-
-
-def calc_horizontal_score(pattern: list[str]) -> int:
+def calc_horizontal_score(pattern: util.Grid) -> int:
     """
     Calculates the horizontal score of a pattern.
 
     Args:
-        pattern (list[str]): The pattern to calculate the score for.
+        pattern (util.Grid): The pattern to calculate the score for.
 
     Returns:
         int: The horizontal score of the pattern.
     """
-    for i, line in enumerate(pattern):
-        if i + 1 == len(pattern):
-            break
-        if line == pattern[i + 1] and check_horizontal_match(pattern, i):
+    for i in range(pattern.height - 1):
+        if pattern.row(i) == pattern.row(i + 1) and check_horizontal_match(pattern, i):
             return i + 1
     return 0
 
 
-def check_horizontal_match(pattern: list[str], row_nbr: int) -> bool:
+def check_horizontal_match(pattern: util.Grid, row_nbr: int) -> bool:
     """
     Check if there is a horizontal match in the pattern starting from the given row number.
 
     Args:
-        pattern (list[str]): The pattern to check for a horizontal match.
+        pattern (util.Grid): The pattern to check for a horizontal match.
         row_nbr (int): The starting row number.
 
     Returns:
@@ -187,21 +150,21 @@ def check_horizontal_match(pattern: list[str], row_nbr: int) -> bool:
     a = row_nbr
     b = row_nbr + 1
     while True:
-        if pattern[a] != pattern[b]:
+        if pattern.row(a) != pattern.row(b):
             return False
         a -= 1
         b += 1
-        if a < 0 or b >= len(pattern):
+        if a < 0 or b >= pattern.height:
             break
     return True
 
 
-def check_horizontal_match2(pattern: list[str], row_nbr: int) -> int:
+def check_horizontal_match2(pattern: util.Grid, row_nbr: int) -> int:
     """
     Check for a horizontal match between two rows in a pattern.
 
     Args:
-        pattern (list[str]): The pattern to check.
+        pattern (util.Grid): The pattern to check.
         row_nbr (int): The row number to start the check from.
 
     Returns:
@@ -211,10 +174,10 @@ def check_horizontal_match2(pattern: list[str], row_nbr: int) -> int:
     a = row_nbr
     b = row_nbr + 1
     while True:
-        if a < 0 or b >= len(pattern):
+        if a < 0 or b >= pattern.height:
             break
-        for i in range(len(pattern[a])):
-            if pattern[a][i] != pattern[b][i]:
+        for cell_a, cell_b in zip(pattern.row(a), pattern.row(b)):
+            if cell_a != cell_b:
                 smudges += 1
                 if smudges > 1:
                     return 0
@@ -226,5 +189,6 @@ def check_horizontal_match2(pattern: list[str], row_nbr: int) -> int:
 
 
 if __name__ == "__main__":
-    print("Part one: " + str(part_one(util.get_lines("day13"))))
-    print("Part two: " + str(part_two(util.get_lines("day13"))))
+    file_patterns = parse(util.get_lines("day13"))
+    print("Part one: " + str(part_one_parsed(file_patterns)))
+    print("Part two: " + str(part_two_parsed(file_patterns)))
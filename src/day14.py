@@ -5,269 +5,203 @@ from functools import cache
 
 # pylint:disable=import-error
 if not __package__:
+    import budget  # type: ignore
     import util  # type: ignore
 else:
-    from . import util
+    from . import budget, util
 
 
-def part_one(lines: list[str]) -> int:
-    """
-    Calculates the result for part one of the problem.
+ROUND = ord("O")
+CUBE = ord("#")
+EMPTY = ord(".")
 
-    Args:
-        lines (list[str]): The input lines.
+CYCLES = 1000000000
+CHECKPOINT_STEP = 10000
 
-    Returns:
-        int: The result for part one.
-    """
+# Functions whose calls are counted by the runner's --stats.
+HOT_FUNCTIONS = ("roll",)
 
-    tilted = tilt_north("^".join(lines))
-    return calculate_total(tilted.split("^"))
 
-
-def part_two(lines: list[str]) -> int:
+def part_one(lines: list[str]) -> int:
     """
-    Calculates the result for part two of the problem.
+    Calculates the result for part one of the problem.
 
     Args:
         lines (list[str]): The input lines.
 
     Returns:
-        int: The result for part two.
+        int: The result for part one.
     """
-    for _ in range(1000000000):
-        lines = cycle(lines)
+    return part_one_parsed(parse(lines))
 
-    return calculate_total(lines)
 
-
-def calculate_total(lines: list[str]) -> int:
+def part_one_parsed(platform: util.Grid) -> int:
     """
-    Calculates the total based on the lines provided.
+    Calculates the total load after tilting a copy of the parsed platform north.
 
     Args:
-        lines (list[str]): The list of lines to calculate the total from.
+        platform (util.Grid): The parsed platform, left untouched.
 
     Returns:
-        int: The calculated total.
-
+        int: The result for part one.
     """
-    total = 0
-    for i, line in enumerate(lines):
-        for char in line:
-            if char == "O":
-                total += len(line) - i
-
-    return total
+    grid = platform.copy()
+    tilt_north(grid)
+    return calculate_total(grid)
 
 
-def cycle(lines: list[str]) -> list[str]:
+def part_two(lines: list[str]) -> int:
     """
-    Cycles the tiles in the grid.
+    Calculates the result for part two of the problem.
 
     Args:
         lines (list[str]): The input lines.
 
     Returns:
-        list[str]: The updated lines.
+        int: The result for part two.
     """
-    line_str = "^".join(lines)
-
-    line_str = tilt_north(line_str)
-    line_str = tilt_west(line_str)
-    line_str = tilt_south(line_str)
-    line_str = tilt_east(line_str)
-
-    lines = line_str.split("^")
-    return lines
+    return part_two_parsed(parse(lines))
 
 
-@cache
-def tilt_north(line_str: str) -> str:
+def part_two_parsed(grid: util.Grid) -> int:
     """
-    Tilt the 'O's in given line string towards the north.
+    Calculates the total load after spinning the parsed platform a billion cycles.
 
     Args:
-        line_str (str): The input line string.
+        grid (util.Grid): The parsed platform, left untouched.
 
     Returns:
-        str: The tilted line string.
-
+        int: The result for part two.
     """
-    lines = line_str.split("^")
+    cells = bytes(grid.cells)
+    for i in range(CYCLES):
+        if not i % CHECKPOINT_STEP:
+            budget.checkpoint("cycles", i, CYCLES)
+        cells = cycle(cells, grid.width)
 
-    ret = []
-    for line in lines:
-        ret.append(line.replace("O", "."))
+    return calculate_total(util.Grid(bytearray(cells), grid.width))
 
-    next_avail = {}
-    for j in range(len(lines[0])):
-        next_avail[j] = 0
 
-    for i, line in enumerate(lines):
-        for j, char in enumerate(line):
-            if char == "O":
-                if next_avail[j] < len(lines):
-                    ret[next_avail[j]] = replace_char_at_index(
-                        ret[next_avail[j]], j, "O"
-                    )
-                next_avail[j] += 1
-            elif char == "#":
-                next_avail[j] = i + 1
-    return "^".join(ret)
-
-
-@cache
-def tilt_south(line_str: str) -> str:
+def parse(lines: list[str]) -> util.Grid:
     """
-    Tilt the 'O's in given line string towards the south.
+    Parses the platform once, so that both parts can be answered from the result.
 
     Args:
-        line_str (str): The input line string.
+        lines (list[str]): The input lines.
 
     Returns:
-        str: The tilted line string.
-
+        util.Grid: The platform.
     """
-    lines = line_str.split("^")
-
-    ret = []
-    for line in lines:
-        ret.append(line.replace("O", "."))
-
-    next_avail = {}
-    for j in range(len(lines[0])):
-        next_avail[j] = len(lines) - 1
-
-    for i, line in enumerate(reversed(lines)):
-        original_index = len(lines) - 1 - i
-        for j, char in enumerate(line):
-            if char == "O":
-                if next_avail[j] < len(lines):
-                    ret[next_avail[j]] = replace_char_at_index(
-                        ret[next_avail[j]], j, "O"
-                    )
-                next_avail[j] -= 1
-            elif char == "#":
-                next_avail[j] = original_index - 1
-    return "^".join(ret)
+    return util.Grid.from_lines(lines)
 
 
-@cache
-def tilt_west(line_str: str) -> str:
+def calculate_total(grid: util.Grid) -> int:
     """
-    Tilt the 'O's in given line string towards the west.
+    Calculates the total load of the round rocks on the north support beams.
 
     Args:
-        line_str (str): The input line string.
+        grid (util.Grid): The platform.
 
     Returns:
-        str: The tilted line string.
-    """
-    lines = line_str.split("^")
-    return "^".join(list(map(line_to_west, lines)))
-
+        int: The calculated total.
 
-@cache
-def tilt_east(line_str: str) -> str:
     """
-    Tilt the 'O's in given line string towards the east.
-
-    Args:
-        line_str (str): The line string to be tilted.
+    total = 0
+    for i in range(grid.height):
+        total += grid.row(i).tobytes().count(ROUND) * (grid.height - i)
 
-    Returns:
-        str: The tilted line string.
-    """
-    lines = line_str.split("^")
-    return "^".join(list(map(line_to_east, lines)))
+    return total
 
 
-def line_to_west(line: str) -> str:
+@cache
+def cycle(cells: bytes, width: int) -> bytes:
     """
-    Converts a line of strings to a single string by joining them with '#'
-    and sorting them in westward direction.
+    Runs one spin cycle, tilting the platform north, west, south and east.
+
+    The cycle is memoized on the platform state, which repeats after a while.
 
     Args:
-        line (str): The line of strings to be converted.
+        cells (bytes): The cells of the platform, row by row.
+        width (int): The width of the platform.
 
     Returns:
-        str: The converted string.
+        bytes: The cells after the cycle.
     """
-    return "#".join(list(map(sort_string_west, line.split("#"))))
+    grid = util.Grid(bytearray(cells), width)
+    tilt_north(grid)
+    tilt_west(grid)
+    tilt_south(grid)
+    tilt_east(grid)
+    return bytes(grid.cells)
 
 
-def sort_string_west(s: str) -> str:
+def tilt_north(grid: util.Grid) -> None:
     """
-    Sorts the characters in a string in descending order.
+    Tilt the round rocks of the grid towards the north, in place.
 
     Args:
-        s (str): The input string to be sorted.
-
-    Returns:
-        str: The sorted string in descending order.
+        grid (util.Grid): The platform.
     """
-    return "".join(sorted(s, reverse=True))
+    for j in range(grid.width):
+        roll(grid.cells, j, grid.width, grid.height)
 
 
-def line_to_east(line: str) -> str:
+def tilt_south(grid: util.Grid) -> None:
     """
-    Converts a line of strings to a single string by joining them with '#'
-    and sorting them in ascending order.
+    Tilt the round rocks of the grid towards the south, in place.
 
     Args:
-        line (str): The input line of strings.
-
-    Returns:
-        str: The converted string.
+        grid (util.Grid): The platform.
     """
-    return "#".join(list(map(sort_string_east, line.split("#"))))
+    for j in range(grid.width):
+        roll(grid.cells, (grid.height - 1) * grid.width + j, -grid.width, grid.height)
 
 
-def sort_string_east(s: str) -> str:
+def tilt_west(grid: util.Grid) -> None:
     """
-    Sorts the characters in a string in ascending order.
+    Tilt the round rocks of the grid towards the west, in place.
 
     Args:
-        s (str): The input string to be sorted.
-
-    Returns:
-        str: The sorted string.
-
+        grid (util.Grid): The platform.
     """
-    return "".join(sorted(s, reverse=False))
+    for i in range(grid.height):
+        roll(grid.cells, i * grid.width, 1, grid.width)
 
 
-def replace_char_at_index(string: str, index: int, new_char: str) -> str:
+def tilt_east(grid: util.Grid) -> None:
     """
-    Replaces a character at a specific index in a string with a new character.
+    Tilt the round rocks of the grid towards the east, in place.
 
     Args:
-        string (str): The input string.
-        index (int): The index of the character to be replaced.
-        new_char (str): The new character to replace the existing character.
-
-    Returns:
-        str: The modified string with the character replaced.
+        grid (util.Grid): The platform.
     """
-    string_list = list(string)
-    string_list[index] = new_char
-    return "".join(string_list)
+    for i in range(grid.height):
+        roll(grid.cells, i * grid.width + grid.width - 1, -1, grid.width)
 
 
-def create_string_with_dots(x: int) -> str:
+def roll(cells: util.Cells, start: int, step: int, count: int) -> None:
     """
-    Creates a string with dots.
+    Roll the round rocks of one row or column towards its start until they hit a cube rock
+    or another round rock.
 
     Args:
-        x (int): The number of dots to include in the string.
-
-    Returns:
-        str: A string consisting of 'x' number of dots.
-    """
-    return "." * x
+        cells (util.Cells): The flat cells of the platform.
+        start (int): The index of the cell the rocks roll towards.
+        step (int): The index distance between consecutive cells of the row or column.
+        count (int): The number of cells in the row or column.
+    """
+    target = start
+    index = start
+    for _ in range(count):
+        cell = cells[index]
+        if cell == ROUND:
+            cells[index] = EMPTY
+            cells[target] = ROUND
+            target += step
+        elif cell == CUBE:
+            target = index + step
+        index += step
 
 
 if __name__ == "__main__":
-    print("Part one: " + str(part_one(util.get_lines("day14"))))
-    # print("Part two: " + str(part_two(util.get_lines("day14")))) # too slow, took 3 hours :-/
+    print("Part one: " + str(part_one_parsed(parse(util.get_lines("day14")))))
@@ -25,10 +25,20 @@ def part_one(lines: list[str]) -> int:
     Returns:
         int: The result for part one.
     """
-    total = 0
-    for line in lines:
-        total += calculate_total(line.split(","))
-    return total
+    return part_one_parsed(parse(lines))
+
+
+def part_one_parsed(steps: list[str]) -> int:
+    """
+    Sums the HASH values of the parsed initialization steps.
+
+    Args:
+        steps (list[str]): The parsed initialization steps.
+
+    Returns:
+        int: The sum of the HASH values.
+    """
+    return calculate_total(steps)
 
 
 def part_two(lines: list[str]) -> int:
@@ -41,22 +51,33 @@ def part_two(lines: list[str]) -> int:
     Returns:
         int: The result for part two.
     """
+    return part_two_parsed(parse(lines))
+
+
+def part_two_parsed(steps: list[str]) -> int:
+    """
+    Calculates the focusing power of the lenses after running the parsed steps.
+
+    Args:
+        steps (list[str]): The parsed initialization steps.
+
+    Returns:
+        int: The focusing power.
+    """
     boxes: dict[int, list[Box]] = {}
     for i in range(256):
         boxes[i] = []
 
-    for line in lines:
-        chunks = line.split(",")
-        for chunk in chunks:
-            splitter = "=" if chunk.find("=") != -1 else "-"
-            label = chunk[: chunk.find(splitter)]
-            box_nbr = get_chunk_val(label)
-
-            if splitter == "=":
-                focal_len = int(chunk[chunk.find(splitter) + 1 :])
-                handle_add_to_box(boxes, box_nbr, label, focal_len)
-            elif splitter == "-":
-                handle_remove_from_box(boxes, box_nbr, label)
+    for chunk in steps:
+        splitter = "=" if chunk.find("=") != -1 else "-"
+        label = chunk[: chunk.find(splitter)]
+        box_nbr = get_chunk_val(label)
+
+        if splitter == "=":
+            focal_len = int(chunk[chunk.find(splitter) + 1 :])
+            handle_add_to_box(boxes, box_nbr, label, focal_len)
+        elif splitter == "-":
+            handle_remove_from_box(boxes, box_nbr, label)
 
     total = 0
     for box_nbr, lenses in boxes.items():
@@ -67,6 +88,23 @@ def part_two(lines: list[str]) -> int:
     return total
 
 
+def parse(lines: list[str]) -> list[str]:
+    """
+    Splits the initialization sequence into its steps once, so that both parts can be answered
+    from the result.
+
+    Args:
+        lines (list[str]): The initialization sequence.
+
+    Returns:
+        list[str]: The steps of the sequence.
+    """
+    steps: list[str] = []
+    for line in lines:
+        steps.extend(line.split(","))
+    return steps
+
+
 def handle_add_to_box(
     boxes: dict[int, list[Box]], box: int, label: str, focal_len: int
 ) -> None:
@@ -146,5 +184,6 @@ def get_chunk_val(chunk: str) -> int:
 
 
 if __name__ == "__main__":
-    print("Part one: " + str(part_one(util.get_lines("day15"))))
-    print("Part two: " + str(part_two(util.get_lines("day15"))))
+    sequence = parse(util.get_lines("day15"))
+    print("Part one: " + str(part_one_parsed(sequence)))
+    print("Part two: " + str(part_two_parsed(sequence)))
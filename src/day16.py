@@ -1,15 +1,38 @@
 """Advent of Code 2023 - Day 16 tasks"""
 
-
 # pylint:disable=import-error
+import itertools
 import sys
-
+from typing import Iterator
 
 if not __package__:
     import util  # type: ignore
 else:
     from . import util
 
+# Functions whose calls are counted by the runner's --stats.
+HOT_FUNCTIONS = ("move", "get_next_pos")
+
+# Solver engines, by name with the input size in bytes from which each is auto-selected.
+ENGINES = {"reference": 0, "fast": 1024}
+
+# The directions a beam leaves a tile in, by the tile and the direction it travels in. Empty
+# tiles and splitters met edge on let the beam pass straight through.
+BEAM_TURNS = {
+    ("/", "right"): ("up",),
+    ("/", "left"): ("down",),
+    ("/", "up"): ("right",),
+    ("/", "down"): ("left",),
+    ("\\", "right"): ("down",),
+    ("\\", "left"): ("up",),
+    ("\\", "up"): ("left",),
+    ("\\", "down"): ("right",),
+    ("|", "right"): ("up", "down"),
+    ("|", "left"): ("up", "down"),
+    ("-", "up"): ("left", "right"),
+    ("-", "down"): ("left", "right"),
+}
+
 
 def part_one(lines: list[str]) -> int:
     """
@@ -18,6 +41,19 @@ def part_one(lines: list[str]) -> int:
     Args:
         lines (list[str]): The input lines.
 
+    Returns:
+        int: The result for part one.
+    """
+    return part_one_parsed(parse(lines))
+
+
+def part_one_parsed(grid: util.Grid) -> int:
+    """
+    Calculates the energized tiles of a beam entering the parsed contraption top left.
+
+    Args:
+        grid (util.Grid): The parsed contraption.
+
     Returns:
         int: The result for part one.
     """
@@ -25,14 +61,13 @@ def part_one(lines: list[str]) -> int:
     sys.setrecursionlimit(5000)
 
     init_direction = ""
-    if lines[0][0] in (".", "-"):
+    if grid[0, 0] in (".", "-"):
         init_direction = "right"
-    if lines[0][0] in ("\\", "|"):
+    if grid[0, 0] in ("\\", "|"):
         init_direction = "down"
-    return calculate_path_length(lines, 0, 0, init_direction)
+    return calculate_path_length(grid, 0, 0, init_direction)
 
 
-# pylint:disable-next=too-many-branches
 def part_two(lines: list[str]) -> int:
     """
     Calculates the result for part two of the problem.
@@ -43,71 +78,211 @@ def part_two(lines: list[str]) -> int:
     Returns:
         int: The result for part two.
     """
+    return part_two_parsed(parse(lines))
 
-    sys.setrecursionlimit(5000)
 
-    values = []
+def part_two_parsed(grid: util.Grid, workers: int = 1) -> int:
+    """
+    Calculates the most energized tiles of any beam entering the parsed contraption.
+
+    The entries are traced in-process unless more workers are asked for, in which case they
+    are spread over worker processes that read the contraption from shared memory instead of
+    receiving a copy with every entry.
+
+    Args:
+        grid (util.Grid): The parsed contraption.
+        workers (int): The number of worker processes, 1 to trace the entries in-process.
+
+    Returns:
+        int: The result for part two.
+    """
+    entries = get_entries(grid)
+    if workers <= 1:
+        sys.setrecursionlimit(5000)
+        return max(calculate_path_length(grid, *entry) for entry in entries)
+
+    with util.share_grid(grid) as handle:
+        with util.process_pool(workers) as executor:
+            chunksize = max(1, len(entries) // (workers * 4))
+            handles = itertools.repeat(handle, len(entries))
+            lengths: Iterator[int] = executor.map(
+                calculate_shared_path_length, handles, entries, chunksize=chunksize
+            )
+            return max(lengths)
+
+
+# pylint:disable-next=too-many-branches
+def get_entries(grid: util.Grid) -> list[tuple[int, int, str]]:
+    """
+    Lists the positions and directions of every beam entering the contraption from its edges.
+
+    Args:
+        grid (util.Grid): The contraption.
+
+    Returns:
+        list[tuple[int, int, str]]: The row, column and direction of each entering beam.
+    """
+    entries = []
     # top row
-    for i, char in enumerate(lines[0]):
+    for i in range(grid.width):
+        char = grid[0, i]
         if char in (".", "|"):
-            values.append(calculate_path_length(lines, 0, i, "down"))
+            entries.append((0, i, "down"))
         if char in ("/"):
-            values.append(calculate_path_length(lines, 0, i, "left"))
+            entries.append((0, i, "left"))
         if char in ("\\"):
-            values.append(calculate_path_length(lines, 0, i, "right"))
+            entries.append((0, i, "right"))
         if char in ("-"):
-            values.append(calculate_path_length(lines, 0, i, "left"))
-            values.append(calculate_path_length(lines, 0, i, "right"))
+            entries.append((0, i, "left"))
+            entries.append((0, i, "right"))
 
     # bottom row
-    bottom_row = len(lines) - 1
-    for i, char in enumerate(lines[len(lines) - 1]):
+    bottom_row = grid.height - 1
+    for i in range(grid.width):
+        char = grid[bottom_row, i]
         if char in (".", "|"):
-            values.append(calculate_path_length(lines, bottom_row, i, "up"))
+            entries.append((bottom_row, i, "up"))
         if char in ("/"):
-            values.append(calculate_path_length(lines, bottom_row, i, "right"))
+            entries.append((bottom_row, i, "right"))
         if char in ("\\"):
-            values.append(calculate_path_length(lines, bottom_row, i, "left"))
+            entries.append((bottom_row, i, "left"))
         if char in ("-"):
-            values.append(calculate_path_length(lines, bottom_row, i, "left"))
-            values.append(calculate_path_length(lines, bottom_row, i, "right"))
+            entries.append((bottom_row, i, "left"))
+            entries.append((bottom_row, i, "right"))
 
     # first col
-    for i, line in enumerate(lines):
-        char = line[0]
+    for i in range(grid.height):
+        char = grid[i, 0]
         if char in (".", "-"):
-            values.append(calculate_path_length(lines, i, 0, "right"))
+            entries.append((i, 0, "right"))
         if char in ("/"):
-            values.append(calculate_path_length(lines, i, 0, "up"))
+            entries.append((i, 0, "up"))
         if char in ("\\"):
-            values.append(calculate_path_length(lines, i, 0, "down"))
+            entries.append((i, 0, "down"))
         if char in ("|"):
-            values.append(calculate_path_length(lines, i, 0, "up"))
-            values.append(calculate_path_length(lines, i, 0, "down"))
+            entries.append((i, 0, "up"))
+            entries.append((i, 0, "down"))
 
     # last col
-    last_col = len(lines[0]) - 1
-    for i, line in enumerate(lines):
-        char = line[last_col]
+    last_col = grid.width - 1
+    for i in range(grid.height):
+        char = grid[i, last_col]
         if char in (".", "-"):
-            values.append(calculate_path_length(lines, i, last_col, "left"))
+            entries.append((i, last_col, "left"))
         if char in ("/"):
-            values.append(calculate_path_length(lines, i, last_col, "down"))
+            entries.append((i, last_col, "down"))
         if char in ("\\"):
-            values.append(calculate_path_length(lines, i, last_col, "up"))
+            entries.append((i, last_col, "up"))
         if char in ("|"):
-            values.append(calculate_path_length(lines, i, last_col, "up"))
-            values.append(calculate_path_length(lines, i, last_col, "down"))
+            entries.append((i, last_col, "up"))
+            entries.append((i, last_col, "down"))
+
+    return entries
+
+
+def part_one_fast(lines: list[str]) -> int:
+    """
+    Calculates the result for part one with the fast engine.
+
+    Args:
+        lines (list[str]): The input lines.
+
+    Returns:
+        int: The result for part one.
+    """
+    return part_one_fast_parsed(parse(lines))
+
+
+def part_one_fast_parsed(grid: util.Grid) -> int:
+    """
+    Counts the energized tiles of a beam entering the contraption top left, walking the beam
+    without recursion and remembering the visited tiles in a set.
+
+    Args:
+        grid (util.Grid): The parsed contraption.
 
-    return max(values)
+    Returns:
+        int: The result for part one.
+    """
+    return count_energized(grid, (0, -1, "right"))
+
+
+def part_two_fast(lines: list[str]) -> int:
+    """
+    Calculates the result for part two with the fast engine.
+
+    Args:
+        lines (list[str]): The input lines.
+
+    Returns:
+        int: The result for part two.
+    """
+    return part_two_fast_parsed(parse(lines))
+
+
+def part_two_fast_parsed(grid: util.Grid) -> int:
+    """
+    Counts the most energized tiles of any beam entering the contraption from its edges.
+
+    Args:
+        grid (util.Grid): The parsed contraption.
+
+    Returns:
+        int: The result for part two.
+    """
+    starts = [(row, -1, "right") for row in range(grid.height)]
+    starts += [(row, grid.width, "left") for row in range(grid.height)]
+    starts += [(-1, col, "down") for col in range(grid.width)]
+    starts += [(grid.height, col, "up") for col in range(grid.width)]
+    return max(count_energized(grid, start) for start in starts)
+
+
+def count_energized(grid: util.Grid, start: tuple[int, int, str]) -> int:
+    """
+    Counts the tiles a beam energizes, following each of its branches until it leaves the
+    contraption or repeats a tile and direction it has already travelled.
+
+    Args:
+        grid (util.Grid): The contraption.
+        start (tuple[int, int, str]): The row, column and direction of the beam just outside
+            the tile it enters first.
+
+    Returns:
+        int: The number of energized tiles.
+    """
+    seen = {start}
+    beams = [start]
+    while beams:
+        row, col, direction = beams.pop()
+        row, col = get_next_pos((row, col), direction)
+        if not grid.in_bounds(row, col):
+            continue
+        for turned in BEAM_TURNS.get((grid[row, col], direction), (direction,)):
+            if (row, col, turned) not in seen:
+                seen.add((row, col, turned))
+                beams.append((row, col, turned))
+    return len({(row, col) for row, col, _ in seen if grid.in_bounds(row, col)})
+
+
+def parse(lines: list[str]) -> util.Grid:
+    """
+    Parses the contraption once, so that both parts can be answered from the result.
+
+    Args:
+        lines (list[str]): The input lines.
+
+    Returns:
+        util.Grid: The contraption.
+    """
+    return util.Grid.from_lines(lines)
 
 
-def calculate_path_length(lines: list[str], i: int, j: int, direction: str) -> int:
+def calculate_path_length(grid: util.Grid, i: int, j: int, direction: str) -> int:
     """
     Calculates the length of the path starting from the given position and direction.
 
     Args:
-        lines (list[str]): The lines representing the path.
+        grid (util.Grid): The contraption the beam travels through.
         i (int): The starting row index.
         j (int): The starting column index.
         direction (str): The starting direction.
@@ -116,12 +291,28 @@ def calculate_path_length(lines: list[str], i: int, j: int, direction: str) -> i
         int: The length of the path.
     """
     seen: list[tuple[int, int, str]] = [(i, j, direction)]
-    move(lines, seen, (i, j), direction)
+    move(grid, seen, (i, j), direction)
     path_len = len(calc_seen(seen))
     print(f"{i}/{j} -> {direction}: {path_len}")
     return path_len
 
 
+def calculate_shared_path_length(handle: util.SharedGrid, entry: tuple[int, int, str]) -> int:
+    """
+    Calculates the length of the path of a beam in a worker process, on a shared contraption.
+
+    Args:
+        handle (util.SharedGrid): The handle of the shared contraption.
+        entry (tuple[int, int, str]): The starting row, column and direction.
+
+    Returns:
+        int: The length of the path.
+    """
+    sys.setrecursionlimit(5000)
+    with util.attach_grid(handle) as grid:
+        return calculate_path_length(grid, *entry)
+
+
 def calc_seen(seen: list[tuple[int, int, str]]) -> list[tuple[int, int]]:
     """
     Calculate the unique coordinates from the given list of tuples.
@@ -143,7 +334,7 @@ def calc_seen(seen: list[tuple[int, int, str]]) -> list[tuple[int, int]]:
 
 # pylint:disable-next=too-many-branches
 def move(
-    lines: list[str],
+    grid: util.Grid,
     seen: list[tuple[int, int, str]],
     pos: tuple[int, int],
     direction: str,
@@ -152,7 +343,7 @@ def move(
     Move function that recursively explores the grid based on the given position and direction.
 
     Args:
-        lines (list[str]): The grid of characters.
+        grid (util.Grid): The grid of characters.
         seen (list[tuple[int, int, str]]): List of previously visited positions.
         pos (tuple[int, int]): Current position in the grid.
         direction (str): Current direction of movement.
@@ -162,12 +353,10 @@ def move(
     """
     next_pos = get_next_pos(pos, direction)
 
-    if next_pos[0] < 0 or next_pos[1] < 0:
-        return
-    if next_pos[1] >= len(lines) or next_pos[0] >= len(lines[next_pos[1]]):
+    if not grid.in_bounds(*next_pos):
         return
 
-    next_char = lines[next_pos[0]][next_pos[1]]
+    next_char = grid[next_pos]
     next_seen = (next_pos[0], next_pos[1], direction)
     if next_char == "." and next_seen in seen:
         return
@@ -176,39 +365,39 @@ def move(
         seen.append(next_seen)
 
     if next_char == ".":
-        move(lines, seen, next_pos, direction)
+        move(grid, seen, next_pos, direction)
 
     if next_char == "-" and direction in ("right", "left"):
-        move(lines, seen, next_pos, direction)
+        move(grid, seen, next_pos, direction)
     if next_char == "|" and direction in ("right", "left"):
-        move(lines, seen, next_pos, "up")
-        move(lines, seen, next_pos, "down")
+        move(grid, seen, next_pos, "up")
+        move(grid, seen, next_pos, "down")
 
     if next_char == "|" and direction in ("up", "down"):
-        move(lines, seen, next_pos, direction)
+        move(grid, seen, next_pos, direction)
     if next_char == "-" and direction in ("up", "down"):
-        move(lines, seen, next_pos, "left")
-        move(lines, seen, next_pos, "right")
+        move(grid, seen, next_pos, "left")
+        move(grid, seen, next_pos, "right")
 
     if next_char == "/" and direction == "right":
-        move(lines, seen, next_pos, "up")
+        move(grid, seen, next_pos, "up")
     if next_char == "\\" and direction == "right":
-        move(lines, seen, next_pos, "down")
+        move(grid, seen, next_pos, "down")
 
     if next_char == "/" and direction == "left":
-        move(lines, seen, next_pos, "down")
+        move(grid, seen, next_pos, "down")
     if next_char == "\\" and direction == "left":
-        move(lines, seen, next_pos, "up")
+        move(grid, seen, next_pos, "up")
 
     if next_char == "/" and direction == "up":
-        move(lines, seen, next_pos, "right")
+        move(grid, seen, next_pos, "right")
     if next_char == "\\" and direction == "up":
-        move(lines, seen, next_pos, "left")
+        move(grid, seen, next_pos, "left")
 
     if next_char == "/" and direction == "down":
-        move(lines, seen, next_pos, "left")
+        move(grid, seen, next_pos, "left")
     if next_char == "\\" and direction == "down":
-        move(lines, seen, next_pos, "right")
+        move(grid, seen, next_pos, "right")
 
 
 def get_next_pos(pos: tuple[int, int], direction: str) -> tuple[int, int]:
@@ -235,5 +424,6 @@ def get_next_pos(pos: tuple[int, int], direction: str) -> tuple[int, int]:
 
 
 if __name__ == "__main__":
-    print("Part one: " + str(part_one(util.get_lines("day16"))))
-    print("Part two: " + str(part_two(util.get_lines("day16"))))
+    contraption = parse(util.get_lines("day16"))
+    print("Part one: " + str(part_one_parsed(contraption)))
+    print("Part two: " + str(part_two_parsed(contraption)))
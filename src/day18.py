@@ -7,6 +7,9 @@ if not __package__:
 else:
     from . import util
 
+# A dig plan step as (direction, meters, colour encoded direction, colour encoded meters).
+DigStep = tuple[str, int, str, int]
+
 
 def part_one(lines: list[str]) -> int:
     """
@@ -18,13 +21,23 @@ def part_one(lines: list[str]) -> int:
     Returns:
         int: The result for part one.
     """
+    return part_one_parsed(parse(lines))
+
+
+def part_one_parsed(plan: list[DigStep]) -> int:
+    """
+    Calculates the lagoon size of the parsed dig plan.
+
+    Args:
+        plan (list[DigStep]): The parsed dig plan.
+
+    Returns:
+        int: The number of cubic meters of lava the lagoon holds.
+    """
     trench_map: dict[int, dict[int, bool]] = {}
     trench_map[0] = {0: True}
     current_position = (0, 0)
-    for line in lines:
-        instructions = line.split()
-        direction = instructions[0]
-        meters = int(instructions[1])
+    for direction, meters, _, _ in plan:
         current_position = add_to_trench_map(
             trench_map, current_position, direction, meters
         )
@@ -41,14 +54,23 @@ def part_two(lines: list[str]) -> int:
     Returns:
         int: The result for part one.
     """
+    return part_two_parsed(parse(lines))
+
+
+def part_two_parsed(plan: list[DigStep]) -> int:
+    """
+    Calculates the lagoon size of the parsed dig plan, using the instructions hidden in the colours.
+
+    Args:
+        plan (list[DigStep]): The parsed dig plan.
+
+    Returns:
+        int: The number of cubic meters of lava the lagoon holds.
+    """
     trench_map: dict[int, dict[int, bool]] = {}
     trench_map[0] = {0: True}
     current_position = (0, 0)
-    for line in lines:
-        instructions = line.split("(")[1].split(")")[0]
-        meters = int(instructions[1:-1], 16)
-        direction_int = int(instructions[-1])
-        direction = int_to_direction(direction_int)
+    for _, _, direction, meters in plan:
         current_position = add_to_trench_map(
             trench_map, current_position, direction, meters
         )
@@ -56,6 +78,31 @@ def part_two(lines: list[str]) -> int:
     # return render_trench(trench_map) # this will take too long :-/
 
 
+def parse(lines: list[str]) -> list[DigStep]:
+    """
+    Parses the dig plan once, so that both parts can be answered from the result.
+
+    Args:
+        lines (list[str]): The dig plan.
+
+    Returns:
+        list[DigStep]: The plain and the colour encoded instruction of every step.
+    """
+    plan: list[DigStep] = []
+    for line in lines:
+        instructions = line.split()
+        colour = line.split("(")[1].split(")")[0]
+        plan.append(
+            (
+                instructions[0],
+                int(instructions[1]),
+                int_to_direction(int(colour[-1])),
+                int(colour[1:-1], 16),
+            )
+        )
+    return plan
+
+
 def int_to_direction(direction_int: int) -> str:
     """
     Converts an integer representation of a direction to a string representation.
@@ -198,5 +245,6 @@ def exists(trench_map: dict[int, dict[int, bool]], row: int, col: int) -> bool:
 
 
 if __name__ == "__main__":
-    print("Part one: " + str(part_one(util.get_lines("day18"))))
-    print("Part two: " + str(part_two(util.get_lines("day18"))))
+    dig_plan = parse(util.get_lines("day18"))
+    print("Part one: " + str(part_one_parsed(dig_plan)))
+    print("Part two: " + str(part_two_parsed(dig_plan)))
@@ -2,7 +2,6 @@
 
 
 # pylint:disable=import-error
-import re
 
 
 if not __package__:
@@ -10,6 +9,9 @@ if not __package__:
 else:
     from . import util
 
+# The workflows by name and the x, m, a and s ratings of every part.
+System = tuple[dict[str, list[list[str]]], list[list[int]]]
+
 
 def part_one(lines: list[str]) -> int:
     """
@@ -22,10 +24,20 @@ def part_one(lines: list[str]) -> int:
         int: The total calculated based on the ratings.
 
     """
-    workflow_strs, rating_strs = lines_to_workflows_and_ratings_strings(lines)
-    workflows = parse_workflows(workflow_strs)
-    ratings = parse_ratings(rating_strs)
+    return part_one_parsed(parse(lines))
+
+
+def part_one_parsed(system: System) -> int:
+    """
+    Sums the ratings of the parsed parts that the parsed workflows accept.
 
+    Args:
+        system (System): The parsed workflows and part ratings.
+
+    Returns:
+        int: The sum of the ratings of the accepted parts.
+    """
+    workflows, ratings = system
     total = 0
     for rating in ratings:
         if (run_workflow(rating, workflows, "in", 0)) == "A":
@@ -33,6 +45,20 @@ def part_one(lines: list[str]) -> int:
     return total
 
 
+def parse(lines: list[str]) -> System:
+    """
+    Parses the workflows and the part ratings once, so that they can be reused.
+
+    Args:
+        lines (list[str]): The workflows, an empty line and the part ratings.
+
+    Returns:
+        System: The workflows by name and the ratings of every part.
+    """
+    workflow_strs, rating_strs = lines_to_workflows_and_ratings_strings(lines)
+    return parse_workflows(workflow_strs), parse_ratings(rating_strs)
+
+
 def run_workflow(
     ratings: list[int],
     workflows: dict[str, list[list[str]]],
@@ -140,10 +166,10 @@ def parse_ratings(rating_strs: list[str]) -> list[list[int]]:
     """
     ratings = []
     for rating in rating_strs:
-        ratings.append(list(map(int, re.findall(r"\d+", rating))))
+        ratings.append(util.ints(rating))
     return ratings
 
 
 if __name__ == "__main__":
-    print("Part one: " + str(part_one(util.get_lines("day19"))))
+    print("Part one: " + str(part_one_parsed(parse(util.get_lines("day19")))))
     # print("Part two: " + str(part_two(util.get_lines("day18"))))
@@ -0,0 +1,42 @@
+"""Advent of Code 2023 - Synthetic input generators
+
+Every dayNN module in this package provides generate(seed, size), which returns a valid puzzle
+input for that day as a list of lines, and SIZES, the sizes used for benchmarking. A module may
+also list generators of inputs with a different shape in VARIANTS, by name.
+"""
+
+import importlib
+
+
+def generate(day: str, seed: int, size: int, variant: str | None = None) -> list[str]:
+    """
+    Generate an input for a day.
+
+    Args:
+        day (str): The module name of the day, e.g. "day05".
+        seed (int): The random seed.
+        size (int): The day-specific size of the input.
+        variant (str | None): The name of a generator variant of the day, or None for the
+            default generator.
+
+    Returns:
+        list[str]: The input lines.
+    """
+    module = importlib.import_module("." + day, __package__)
+    generator = module.generate if variant is None else module.VARIANTS[variant]
+    lines: list[str] = generator(seed, size)
+    return lines
+
+
+def sizes(day: str) -> dict[str, int]:
+    """
+    Get the benchmark sizes of a day's generator.
+
+    Args:
+        day (str): The module name of the day, e.g. "day05".
+
+    Returns:
+        dict[str, int]: The sizes keyed by scale name.
+    """
+    day_sizes: dict[str, int] = importlib.import_module("." + day, __package__).SIZES
+    return day_sizes
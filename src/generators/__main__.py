@@ -0,0 +1,37 @@
+"""Advent of Code 2023 - Write a synthetic input with python -m src.generators"""
+
+import argparse
+
+from ..registry import resolve_day
+from . import generate
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Generate an input for a day and write it to a file or stdout.
+
+    Args:
+        argv (list[str] | None): The command line arguments, defaults to sys.argv.
+
+    Returns:
+        int: The exit code.
+    """
+    parser = argparse.ArgumentParser(prog="python -m src.generators", description=__doc__)
+    parser.add_argument("day", help="day to generate an input for, e.g. 5 or day05")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument("--size", type=int, required=True, help="day-specific input size")
+    parser.add_argument("--variant", help="generator variant of the day, e.g. chain for day 4")
+    parser.add_argument("--output", help="file to write to (default: stdout)")
+    args = parser.parse_args(argv)
+
+    text = "\n".join(generate(resolve_day(args.day), args.seed, args.size, args.variant)) + "\n"
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(text)
+    else:
+        print(text, end="")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,38 @@
+"""Advent of Code 2023 - Input generator for day 1"""
+
+import random
+import string
+
+SIZES = {"small": 1000, "medium": 10000, "large": 100000}
+
+WORDS = ("one", "two", "three", "four", "five", "six", "seven", "eight", "nine")
+
+
+def generate(seed: int, size: int) -> list[str]:
+    """
+    Generate a calibration document.
+
+    Every line mixes letters, digits and spelled-out digits and contains at least one digit.
+
+    Args:
+        seed (int): The random seed.
+        size (int): The number of lines.
+
+    Returns:
+        list[str]: The input lines.
+    """
+    rng = random.Random(seed)
+    lines: list[str] = []
+    for _ in range(size):
+        chunks = [rng.choice(string.digits)]
+        for _ in range(rng.randint(1, 8)):
+            kind = rng.random()
+            if kind < 0.3:
+                chunks.append(rng.choice(string.digits))
+            elif kind < 0.6:
+                chunks.append(rng.choice(WORDS))
+            else:
+                chunks.append("".join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 5))))
+        rng.shuffle(chunks)
+        lines.append("".join(chunks))
+    return lines
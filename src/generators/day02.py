@@ -0,0 +1,32 @@
+"""Advent of Code 2023 - Input generator for day 2"""
+
+import random
+
+SIZES = {"small": 1000, "medium": 10000, "large": 100000}
+
+COLORS = ("red", "green", "blue")
+
+
+def generate(seed: int, size: int) -> list[str]:
+    """
+    Generate a record of games.
+
+    Every colour is revealed at least once per game, in the first set.
+
+    Args:
+        seed (int): The random seed.
+        size (int): The number of games.
+
+    Returns:
+        list[str]: The input lines.
+    """
+    rng = random.Random(seed)
+    lines: list[str] = []
+    for game_id in range(1, size + 1):
+        sets: list[str] = []
+        for set_nbr in range(rng.randint(1, 6)):
+            colors = list(COLORS) if not set_nbr else rng.sample(COLORS, rng.randint(1, 3))
+            rng.shuffle(colors)
+            sets.append(", ".join(f"{rng.randint(1, 20)} {color}" for color in colors))
+        lines.append(f"Game {game_id}: " + "; ".join(sets))
+    return lines
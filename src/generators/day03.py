@@ -0,0 +1,37 @@
+"""Advent of Code 2023 - Input generator for day 3"""
+
+import random
+
+SIZES = {"small": 40, "medium": 140, "large": 500}
+
+SYMBOLS = "*#+$/@%=&"
+
+
+def generate(seed: int, size: int) -> list[str]:
+    """
+    Generate a square engine schematic of numbers, symbols and dots.
+
+    Args:
+        seed (int): The random seed.
+        size (int): The width and height of the schematic.
+
+    Returns:
+        list[str]: The input lines.
+    """
+    rng = random.Random(seed)
+    lines: list[str] = []
+    for _ in range(size):
+        row = ["."] * size
+        j = rng.randint(0, 3)
+        while j < size:
+            if rng.random() < 0.15:
+                row[j] = "*" if rng.random() < 0.5 else rng.choice(SYMBOLS)
+                j += rng.randint(2, 6)
+                continue
+            number = str(rng.randint(1, 999))
+            if j + len(number) > size:
+                break
+            row[j : j + len(number)] = number
+            j += len(number) + rng.randint(1, 6)
+        lines.append("".join(row))
+    return lines
@@ -0,0 +1,84 @@
+"""Advent of Code 2023 - Input generator for day 4"""
+
+import random
+from typing import Callable
+
+SIZES = {"small": 200, "medium": 2000, "large": 20000}
+
+WINNING_COUNT = 10
+NUMBER_COUNT = 25
+BLOCK_SIZE = 10
+
+
+def generate(seed: int, size: int) -> list[str]:
+    """
+    Generate a pile of scratchcards.
+
+    Cards only win within blocks of ten, followed by a run of losing cards, so the number
+    of card copies in part two grows linearly instead of exponentially with the size.
+
+    Args:
+        seed (int): The random seed.
+        size (int): The number of cards.
+
+    Returns:
+        list[str]: The input lines.
+    """
+    rng = random.Random(seed)
+    lines: list[str] = []
+    for card_nbr in range(1, size + 1):
+        position = (card_nbr - 1) % BLOCK_SIZE
+        max_matches = max(0, BLOCK_SIZE // 2 - 1 - position)
+        matches = rng.randint(0, min(max_matches, size - card_nbr))
+        lines.append(card(rng, card_nbr, matches))
+    return lines
+
+
+def generate_chain(seed: int, size: int) -> list[str]:
+    """
+    Generate a pile of scratchcards in which every card but the last wins the next one.
+
+    Card n then ends up with n instances, so the number of card copies in part two grows with
+    the square of the size, and work done per copy shows in the running time.
+
+    Args:
+        seed (int): The random seed.
+        size (int): The number of cards.
+
+    Returns:
+        list[str]: The input lines.
+    """
+    rng = random.Random(seed)
+    lines: list[str] = []
+    for card_nbr in range(1, size + 1):
+        matches = 1 if card_nbr < size else 0
+        lines.append(card(rng, card_nbr, matches))
+    return lines
+
+
+def card(rng: random.Random, card_nbr: int, matches: int) -> str:
+    """
+    Generate a scratchcard with a given number of matches.
+
+    Args:
+        rng (random.Random): The random number generator.
+        card_nbr (int): The number of the card.
+        matches (int): The number of the card's numbers that are winning numbers.
+
+    Returns:
+        str: The input line of the card.
+    """
+    numbers = rng.sample(range(1, 100), WINNING_COUNT + NUMBER_COUNT - matches)
+    winning = numbers[:WINNING_COUNT]
+    have = numbers[WINNING_COUNT:] + rng.sample(winning, matches)
+    rng.shuffle(have)
+    return (
+        f"Card {card_nbr:3}: "
+        + " ".join(f"{number:2}" for number in winning)
+        + " | "
+        + " ".join(f"{number:2}" for number in have)
+    )
+
+
+# Generators of inputs with a different shape, by name.
+VARIANTS: dict[str, Callable[[int, int], list[str]]] = {"chain": generate_chain}
@@ -0,0 +1,45 @@
+"""Advent of Code 2023 - Input generator for day 5"""
+
+import random
+
+SIZES = {"small": 10, "medium": 100, "large": 1000}
+
+MAPS = (
+    "seed-to-soil",
+    "soil-to-fertilizer",
+    "fertilizer-to-water",
+    "water-to-light",
+    "light-to-temperature",
+    "temperature-to-humidity",
+    "humidity-to-location",
+)
+MAX_VALUE = 2**32
+
+
+def generate(seed: int, size: int) -> list[str]:
+    """
+    Generate an almanac.
+
+    Seed ranges are up to a million values per size unit long, so large sizes cover billions
+    of seeds. Every map has size non-overlapping source ranges.
+
+    Args:
+        seed (int): The random seed.
+        size (int): The number of seed ranges and of ranges per map.
+
+    Returns:
+        list[str]: The input lines.
+    """
+    rng = random.Random(seed)
+    seeds: list[int] = []
+    for _ in range(size):
+        seeds += [rng.randrange(MAX_VALUE // 2), rng.randint(1, size * 1000000)]
+    lines = ["seeds: " + " ".join(map(str, seeds))]
+    for name in MAPS:
+        lines += ["", name + " map:"]
+        bounds = sorted(rng.sample(range(MAX_VALUE), 2 * size))
+        for i in range(0, len(bounds), 2):
+            length = bounds[i + 1] - bounds[i]
+            destination = rng.randrange(MAX_VALUE - length)
+            lines.append(f"{destination} {bounds[i]} {length}")
+    return lines
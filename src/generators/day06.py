@@ -0,0 +1,29 @@
+"""Advent of Code 2023 - Input generator for day 6"""
+
+import random
+
+SIZES = {"small": 4, "medium": 40, "large": 400}
+
+
+def generate(seed: int, size: int) -> list[str]:
+    """
+    Generate a sheet of race times and record distances that can all be beaten.
+
+    Args:
+        seed (int): The random seed.
+        size (int): The number of races.
+
+    Returns:
+        list[str]: The input lines.
+    """
+    rng = random.Random(seed)
+    times: list[int] = []
+    distances: list[int] = []
+    for _ in range(size):
+        time = rng.randint(7, 99)
+        times.append(time)
+        distances.append(rng.randrange((time // 2) * (time - time // 2)))
+    return [
+        "Time:     " + " ".join(f"{time:4}" for time in times),
+        "Distance: " + " ".join(f"{distance:4}" for distance in distances),
+    ]
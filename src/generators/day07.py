@@ -0,0 +1,22 @@
+"""Advent of Code 2023 - Input generator for day 7"""
+
+import random
+
+SIZES = {"small": 1000, "medium": 10000, "large": 100000}
+
+CARDS = "23456789TJQKA"
+
+
+def generate(seed: int, size: int) -> list[str]:
+    """
+    Generate a list of Camel Cards hands and their bids.
+
+    Args:
+        seed (int): The random seed.
+        size (int): The number of hands.
+
+    Returns:
+        list[str]: The input lines.
+    """
+    rng = random.Random(seed)
+    return ["".join(rng.choices(CARDS, k=5)) + f" {rng.randint(1, 1000)}" for _ in range(size)]
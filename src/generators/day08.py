@@ -0,0 +1,46 @@
+"""Advent of Code 2023 - Input generator for day 8"""
+
+import itertools
+import random
+import string
+
+SIZES = {"small": 100, "medium": 1000, "large": 5000}
+
+GHOSTS = 5
+
+
+def generate(seed: int, size: int) -> list[str]:
+    """
+    Generate a map of left/right instructions and a network of nodes.
+
+    The network consists of cycles, one from AAA to ZZZ and one per ghost, where the walk from
+    a start node to its end node is as long as the walk around the cycle afterwards.
+
+    Args:
+        seed (int): The random seed.
+        size (int): The approximate number of nodes per cycle.
+
+    Returns:
+        list[str]: The input lines.
+    """
+    rng = random.Random(seed)
+    # Intermediate nodes never end in A or Z, so only the chosen nodes start or end a walk.
+    names = [
+        "".join(name)
+        for name in itertools.product(string.ascii_uppercase[1:-1] + string.digits, repeat=3)
+    ]
+    rng.shuffle(names)
+    free_names = iter(names)
+    prefixes = rng.sample(sorted({name[:2] for name in names}), GHOSTS)
+
+    instructions = "".join(rng.choices("LR", k=max(1, size // 10)))
+    lines = [instructions, ""]
+    starts = ["AAA"] + [prefix + "A" for prefix in prefixes]
+    ends = ["ZZZ"] + [prefix + "Z" for prefix in prefixes]
+    for start, end in zip(starts, ends):
+        cycle = [next(free_names) for _ in range(rng.randint(size // 2 + 1, size + 1))]
+        lines.append(f"{start} = ({cycle[0]}, {cycle[0]})")
+        for node, next_node in zip(cycle, cycle[1:] + [end]):
+            lines.append(f"{node} = ({next_node}, {next_node})")
+        lines.append(f"{end} = ({cycle[0]}, {cycle[0]})")
+    return lines
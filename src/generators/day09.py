@@ -0,0 +1,30 @@
+"""Advent of Code 2023 - Input generator for day 9"""
+
+import random
+
+SIZES = {"small": 200, "medium": 2000, "large": 20000}
+
+VALUES_PER_LINE = 21
+
+
+def generate(seed: int, size: int) -> list[str]:
+    """
+    Generate an OASIS report of sequences sampled from random polynomials.
+
+    Args:
+        seed (int): The random seed.
+        size (int): The number of sequences.
+
+    Returns:
+        list[str]: The input lines.
+    """
+    rng = random.Random(seed)
+    lines: list[str] = []
+    for _ in range(size):
+        coefficients = [rng.randint(-9, 9) for _ in range(rng.randint(1, 7))]
+        values = [
+            sum(coefficient * x**power for power, coefficient in enumerate(coefficients))
+            for x in range(VALUES_PER_LINE)
+        ]
+        lines.append(" ".join(map(str, values)))
+    return lines
@@ -0,0 +1,34 @@
+"""Advent of Code 2023 - Input generator for day 10"""
+
+import random
+
+SIZES = {"small": 20, "medium": 140, "large": 500}
+
+PIPES = "|-LJ7F."
+
+
+def generate(seed: int, size: int) -> list[str]:
+    """
+    Generate a square field of pipes containing one loop.
+
+    The loop runs along a rectangle one tile inside the border, starting from S in its top
+    left corner. All other tiles are random pipe junk.
+
+    Args:
+        seed (int): The random seed.
+        size (int): The width and height of the field, at least 4.
+
+    Returns:
+        list[str]: The input lines.
+    """
+    rng = random.Random(seed)
+    grid = [[rng.choice(PIPES) for _ in range(size)] for _ in range(size)]
+    last = size - 2
+    for k in range(2, last):
+        grid[1][k] = grid[last][k] = "-"
+        grid[k][1] = grid[k][last] = "|"
+    grid[1][1] = "S"
+    grid[1][last] = "7"
+    grid[last][1] = "L"
+    grid[last][last] = "J"
+    return ["".join(row) for row in grid]
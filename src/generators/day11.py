@@ -0,0 +1,28 @@
+"""Advent of Code 2023 - Input generator for day 11"""
+
+import random
+
+SIZES = {"small": 20, "medium": 40, "large": 80}
+
+
+def generate(seed: int, size: int) -> list[str]:
+    """
+    Generate a square image of galaxies with some empty rows and columns.
+
+    Args:
+        seed (int): The random seed.
+        size (int): The width and height of the image.
+
+    Returns:
+        list[str]: The input lines.
+    """
+    rng = random.Random(seed)
+    empty_rows = set(rng.sample(range(size), size // 10))
+    empty_cols = set(rng.sample(range(size), size // 10))
+    return [
+        "".join(
+            "#" if i not in empty_rows and j not in empty_cols and rng.random() < 0.05 else "."
+            for j in range(size)
+        )
+        for i in range(size)
+    ]
@@ -0,0 +1,34 @@
+"""Advent of Code 2023 - Input generator for day 12"""
+
+import random
+
+SIZES = {"small": 20, "medium": 40, "large": 80}
+
+ROWS = 100
+
+
+def generate(seed: int, size: int) -> list[str]:
+    """
+    Generate condition records with at least one valid arrangement each.
+
+    Every row is built from real groups of damaged springs and then has about half of its
+    springs replaced with unknowns.
+
+    Args:
+        seed (int): The random seed.
+        size (int): The approximate number of springs per row.
+
+    Returns:
+        list[str]: The input lines.
+    """
+    rng = random.Random(seed)
+    lines: list[str] = []
+    for _ in range(ROWS):
+        row = "." * rng.randint(0, 2)
+        groups: list[int] = []
+        while len(row) < size:
+            groups.append(rng.randint(1, 5))
+            row += "#" * groups[-1] + "." * rng.randint(1, 3)
+        masked = "".join("?" if rng.random() < 0.5 else char for char in row)
+        lines.append(masked + " " + ",".join(map(str, groups)))
+    return lines
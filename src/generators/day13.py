@@ -0,0 +1,31 @@
+"""Advent of Code 2023 - Input generator for day 13"""
+
+import random
+
+SIZES = {"small": 100, "medium": 1000, "large": 10000}
+
+
+def generate(seed: int, size: int) -> list[str]:
+    """
+    Generate patterns of ash and rocks that each have a horizontal or vertical reflection.
+
+    Args:
+        seed (int): The random seed.
+        size (int): The number of patterns.
+
+    Returns:
+        list[str]: The input lines, with patterns separated by empty lines.
+    """
+    rng = random.Random(seed)
+    lines: list[str] = []
+    for nbr in range(size):
+        height = rng.randint(5, 17)
+        width = rng.randint(5, 17)
+        rows = ["".join(rng.choices(".#", k=width)) for _ in range(height)]
+        mirror = rng.randint(1, height - 1)
+        for i in range(mirror, min(height, 2 * mirror)):
+            rows[i] = rows[2 * mirror - 1 - i]
+        if rng.random() < 0.5:
+            rows = ["".join(column) for column in zip(*rows)]
+        lines += ([""] if nbr else []) + rows
+    return lines
@@ -0,0 +1,20 @@
+"""Advent of Code 2023 - Input generator for day 14"""
+
+import random
+
+SIZES = {"small": 20, "medium": 100, "large": 500}
+
+
+def generate(seed: int, size: int) -> list[str]:
+    """
+    Generate a square platform of round rocks, cube rocks and empty space.
+
+    Args:
+        seed (int): The random seed.
+        size (int): The width and height of the platform.
+
+    Returns:
+        list[str]: The input lines.
+    """
+    rng = random.Random(seed)
+    return ["".join(rng.choices("O#.", weights=(2, 1, 7), k=size)) for _ in range(size)]
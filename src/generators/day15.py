@@ -0,0 +1,31 @@
+"""Advent of Code 2023 - Input generator for day 15"""
+
+import random
+import string
+
+SIZES = {"small": 4000, "medium": 40000, "large": 400000}
+
+
+def generate(seed: int, size: int) -> list[str]:
+    """
+    Generate an initialization sequence of lens insertions and removals.
+
+    Labels are drawn from a shared pool so that steps replace and remove earlier lenses.
+
+    Args:
+        seed (int): The random seed.
+        size (int): The number of steps.
+
+    Returns:
+        list[str]: The input line.
+    """
+    rng = random.Random(seed)
+    labels = [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 6)))
+        for _ in range(size // 4 + 1)
+    ]
+    steps = [
+        rng.choice(labels) + (f"={rng.randint(1, 9)}" if rng.random() < 0.7 else "-")
+        for _ in range(size)
+    ]
+    return [",".join(steps)]
@@ -0,0 +1,24 @@
+"""Advent of Code 2023 - Input generator for day 16"""
+
+import random
+
+SIZES = {"small": 10, "medium": 20, "large": 40}
+
+
+def generate(seed: int, size: int) -> list[str]:
+    """
+    Generate a square contraption of empty space, mirrors and splitters.
+
+    The top left tile is always empty space, where the beam enters.
+
+    Args:
+        seed (int): The random seed.
+        size (int): The width and height of the contraption.
+
+    Returns:
+        list[str]: The input lines.
+    """
+    rng = random.Random(seed)
+    lines = ["".join(rng.choices(".|-/\\", weights=(16, 1, 1, 1, 1), k=size)) for _ in range(size)]
+    lines[0] = "." + lines[0][1:]
+    return lines
@@ -0,0 +1,36 @@
+"""Advent of Code 2023 - Input generator for day 18"""
+
+import random
+
+SIZES = {"small": 20, "medium": 100, "large": 500}
+
+DIRECTION_CODES = {"R": 0, "D": 1, "L": 2, "U": 3}
+
+
+def generate(seed: int, size: int) -> list[str]:
+    """
+    Generate a dig plan for a closed staircase-shaped lagoon.
+
+    The plan steps right and down size times, then returns left along the bottom and up
+    along the left edge. The colour codes describe the same moves, so both parts dig the
+    same lagoon.
+
+    Args:
+        seed (int): The random seed.
+        size (int): The number of stairs.
+
+    Returns:
+        list[str]: The input lines.
+    """
+    rng = random.Random(seed)
+    moves: list[tuple[str, int]] = []
+    for _ in range(size):
+        moves += [("R", rng.randint(1, 10)), ("D", rng.randint(1, 10))]
+    moves += [
+        ("L", sum(meters for direction, meters in moves if direction == "R")),
+        ("U", sum(meters for direction, meters in moves if direction == "D")),
+    ]
+    return [
+        f"{direction} {meters} (#{meters:05x}{DIRECTION_CODES[direction]})"
+        for direction, meters in moves
+    ]
@@ -0,0 +1,39 @@
+"""Advent of Code 2023 - Input generator for day 19"""
+
+import itertools
+import random
+import string
+
+SIZES = {"small": 200, "medium": 2000, "large": 20000}
+
+
+def generate(seed: int, size: int) -> list[str]:
+    """
+    Generate workflows and part ratings.
+
+    The workflows form an acyclic graph starting at "in", in which every workflow only sends
+    parts on to later workflows or to A/R.
+
+    Args:
+        seed (int): The random seed.
+        size (int): The number of part ratings, a tenth of which is the number of workflows.
+
+    Returns:
+        list[str]: The input lines.
+    """
+    rng = random.Random(seed)
+    names = ["".join(name) for name in itertools.product(string.ascii_lowercase, repeat=3)]
+    names = ["in"] + rng.sample(names, size // 10 + 1)
+    lines: list[str] = []
+    for i, name in enumerate(names):
+        targets = names[i + 1 :] + ["A", "R"]
+        rules = [
+            f"{rng.choice('xmas')}{rng.choice('<>')}{rng.randint(1, 4000)}:{rng.choice(targets)}"
+            for _ in range(rng.randint(1, 3))
+        ]
+        lines.append(name + "{" + ",".join(rules + [rng.choice(targets)]) + "}")
+    lines.append("")
+    for _ in range(size):
+        x, m, a, s = (rng.randint(1, 4000) for _ in range(4))
+        lines.append(f"{{x={x},m={m},a={a},s={s}}}")
+    return lines
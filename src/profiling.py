@@ -0,0 +1,193 @@
+"""Advent of Code 2023 - Opt-in profiling of day parts
+
+Profiling is enabled with the runner's --profile flag or by setting AOC_PROFILE=1. Each profiled
+part writes a report with its peak traced memory and its hottest functions. The runner's --memory
+flag records the peak RSS, the peak traced memory and the top allocation sites of every part.
+"""
+
+import cProfile
+import io
+import os
+import pstats
+import resource
+import sys
+import threading
+import tracemalloc
+from typing import Callable, TypedDict, TypeVar
+
+from .cache import CACHE_DIR
+
+PROFILE_DIR = os.path.join(CACHE_DIR, "profiles")
+
+REPORT_LINES = 30
+
+TOP_ALLOCATIONS = 5
+
+# The seconds between samples of the traced memory of a part under trace_memory().
+SAMPLE_INTERVAL = 0.005
+
+T = TypeVar("T")
+
+MemoryUsage = TypedDict(
+    "MemoryUsage", {"peak_rss": int, "peak_traced": int, "top_allocations": list[str]}
+)
+
+
+class _PeakSampler(threading.Thread):
+    """Samples the traced memory and keeps the top allocation sites of the highest sample."""
+
+    def __init__(self, interval: float) -> None:
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.stopped = threading.Event()
+        self.highest = -1
+        self.peak = 0
+        self.top_allocations: list[str] = []
+
+    def run(self) -> None:
+        while not self.stopped.wait(self.interval):
+            self.sample()
+
+    def sample(self) -> None:
+        """Take the top allocation sites if the traced memory is higher than at any sample."""
+        current, peak = tracemalloc.get_traced_memory()
+        if current <= self.highest:
+            return
+        self.highest = current
+        self.peak = max(self.peak, peak)
+        self.top_allocations = top_allocations(tracemalloc.take_snapshot())
+        # Forget the memory the snapshot itself took, after keeping the peak before it.
+        tracemalloc.reset_peak()
+
+
+def enabled() -> bool:
+    """
+    Check whether profiling was requested through the environment.
+
+    Returns:
+        bool: True if AOC_PROFILE is set to a non-empty value other than "0".
+    """
+    return os.environ.get("AOC_PROFILE", "0") not in ("", "0")
+
+
+def profile_call(func: Callable[[], T], title: str, report_dir: str = PROFILE_DIR) -> T:
+    """
+    Run a function under cProfile and tracemalloc and write a report of the run.
+
+    The report starts with the peak traced memory, followed by the functions sorted by the
+    time spent in the function itself.
+
+    Args:
+        func (Callable[[], T]): The function to run.
+        title (str): The title of the report, also used as its file name.
+        report_dir (str): The directory to write the report to.
+
+    Returns:
+        T: The return value of the function.
+    """
+    profiler = cProfile.Profile()
+    # Leave an enclosing trace_memory() tracing, it reads the same peak afterwards.
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    try:
+        result = profiler.runcall(func)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+
+    stream = io.StringIO()
+    stats = pstats.Stats(profiler, stream=stream)
+    stats.sort_stats(pstats.SortKey.TIME).print_stats(REPORT_LINES)
+
+    os.makedirs(report_dir, exist_ok=True)
+    with open(report_path(title, report_dir), "w", encoding="utf-8") as file:
+        file.write(f"{title}\npeak memory: {peak / 1024 / 1024:.2f} MiB\n")
+        file.write(stream.getvalue())
+    return result
+
+
+def report_path(title: str, report_dir: str = PROFILE_DIR) -> str:
+    """
+    Get the path of the report written for a title.
+
+    Args:
+        title (str): The title of the report.
+        report_dir (str): The directory reports are written to.
+
+    Returns:
+        str: The path of the report.
+    """
+    return os.path.join(report_dir, title.replace(" ", "-") + ".txt")
+
+
+def trace_memory(func: Callable[[], T]) -> tuple[T, MemoryUsage]:
+    """
+    Run a function under tracemalloc and measure its memory usage.
+
+    The traced memory is sampled while the function runs, and the top allocation sites are
+    those of the highest sample, so that they show the structures behind the peak rather than
+    only the memory still allocated when the function returns.
+
+    Args:
+        func (Callable[[], T]): The function to run.
+
+    Returns:
+        tuple[T, MemoryUsage]: The return value of the function and its memory usage.
+    """
+    sampler = _PeakSampler(SAMPLE_INTERVAL)
+    tracemalloc.start()
+    try:
+        sampler.start()
+        try:
+            result = func()
+        finally:
+            sampler.stopped.set()
+            sampler.join()
+        sampler.sample()
+        peak = max(sampler.peak, tracemalloc.get_traced_memory()[1])
+    finally:
+        tracemalloc.stop()
+    return result, {
+        "peak_rss": peak_rss(),
+        "peak_traced": peak,
+        "top_allocations": sampler.top_allocations,
+    }
+
+
+def top_allocations(snapshot: tracemalloc.Snapshot) -> list[str]:
+    """
+    List the top allocation sites of a snapshot, leaving out tracemalloc and the profiler.
+
+    Args:
+        snapshot (tracemalloc.Snapshot): The snapshot of the traced memory.
+
+    Returns:
+        list[str]: The sites with the most memory allocated, with their size and count.
+    """
+    snapshot = snapshot.filter_traces(
+        (
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, threading.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        )
+    )
+    return [str(statistic) for statistic in snapshot.statistics("lineno")[:TOP_ALLOCATIONS]]
+
+
+def peak_rss() -> int:
+    """
+    Get the peak resident set size of this process.
+
+    The peak covers the whole life of the process, so the runner starts a fresh worker per
+    part when it measures memory.
+
+    Returns:
+        int: The peak resident set size in bytes.
+    """
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
@@ -0,0 +1,196 @@
+"""Advent of Code 2023 - Lazy registry of the day modules
+
+Days and their parts are listed from the package directory and the module sources without
+importing anything, and a day is only imported when one of its parts is first used. The import
+time of each day can be measured in a fresh interpreter to keep single day invocations fast.
+"""
+
+import functools
+import importlib
+import os
+import pkgutil
+import re
+import subprocess
+import sys
+from types import ModuleType
+from typing import Callable
+
+PARTS = ("part_one", "part_two")
+
+REFERENCE_ENGINE = "reference"
+
+IMPORT_BUDGET = 0.05
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def discover_days() -> list[str]:
+    """
+    Find the names of all day modules in the package.
+
+    Returns:
+        list[str]: The sorted module names, e.g. "day01".
+    """
+    return sorted(
+        module.name
+        for module in pkgutil.iter_modules([PACKAGE_DIR])
+        if re.fullmatch(r"day\d\d", module.name)
+    )
+
+
+def resolve_day(day: str) -> str:
+    """
+    Normalise a day given on the command line ("5", "05" or "day05") to a module name.
+
+    Args:
+        day (str): The day as given by the user.
+
+    Returns:
+        str: The module name of the day.
+    """
+    return "day" + day.removeprefix("day").zfill(2)
+
+
+@functools.cache
+def parts(day: str) -> tuple[str, ...]:
+    """
+    List the parts that a day implements by reading its source, without importing it.
+
+    Args:
+        day (str): The module name of the day.
+
+    Returns:
+        tuple[str, ...]: The part function names, in the order of PARTS.
+    """
+    defined = set(re.findall(r"^def (\w+)\(", read_source(day), re.MULTILINE))
+    return tuple(part for part in PARTS if part in defined)
+
+
+def read_source(day: str) -> str:
+    """
+    Read the source of a day without importing it.
+
+    Args:
+        day (str): The module name of the day.
+
+    Returns:
+        str: The source of the day module.
+    """
+    with open(os.path.join(PACKAGE_DIR, day + ".py"), "r", encoding="utf-8") as file:
+        return file.read()
+
+
+def load(day: str) -> ModuleType:
+    """
+    Import a day on its first use.
+
+    Args:
+        day (str): The module name of the day.
+
+    Returns:
+        ModuleType: The day module.
+    """
+    return importlib.import_module("." + day, __package__)
+
+
+@functools.cache
+def declared_engines(day: str) -> frozenset[str]:
+    """
+    List the solver engines that a day declares in ENGINES for any of its parts, by reading its
+    source without importing it.
+
+    Args:
+        day (str): The module name of the day.
+
+    Returns:
+        frozenset[str]: The engine names, including the reference engine.
+    """
+    declaration = re.search(r"^ENGINES = \{(.*?)\}", read_source(day), re.MULTILINE | re.DOTALL)
+    names = re.findall(r"\"(\w+)\":", declaration.group(1)) if declaration else []
+    return frozenset((REFERENCE_ENGINE, *names))
+
+
+def engines(day: str, part: str) -> dict[str, int]:
+    """
+    List the solver engines that implement a part of a day.
+
+    A day declares its engines in ENGINES, by name with the input size in bytes from which each
+    is auto-selected, and implements the engine of a part as <part>_<engine>. The reference
+    engine is the part function itself and is always available.
+
+    Args:
+        day (str): The module name of the day.
+        part (str): The name of the part function.
+
+    Returns:
+        dict[str, int]: The minimum input size of each engine, by engine name.
+    """
+    module = load(day)
+    declared: dict[str, int] = getattr(module, "ENGINES", {})
+    available = {REFERENCE_ENGINE: declared.get(REFERENCE_ENGINE, 0)}
+    for engine, min_size in declared.items():
+        if hasattr(module, f"{part}_{engine}"):
+            available[engine] = min_size
+    return available
+
+
+def select_engine(day: str, part: str, size: int) -> str:
+    """
+    Pick the engine of a part for an input size: the one with the largest minimum size that
+    the input reaches.
+
+    Args:
+        day (str): The module name of the day.
+        part (str): The name of the part function.
+        size (int): The size of the input in bytes.
+
+    Returns:
+        str: The name of the engine.
+    """
+    candidates = [(min_size, engine) for engine, min_size in engines(day, part).items()]
+    return max((min_size, engine) for min_size, engine in candidates if min_size <= size)[1]
+
+
+def get_part(day: str, part: str, engine: str = REFERENCE_ENGINE) -> Callable[..., int]:
+    """
+    Get a part function of a day, importing the day if needed.
+
+    Args:
+        day (str): The module name of the day.
+        part (str): The name of the part function.
+        engine (str): The solver engine of the part.
+
+    Returns:
+        Callable[..., int]: The part function.
+    """
+    if engine not in engines(day, part):
+        raise ValueError(f"{day} {part} has no engine {engine!r}")
+    name = part if engine == REFERENCE_ENGINE else f"{part}_{engine}"
+    func: Callable[..., int] = getattr(load(day), name)
+    return func
+
+
+def import_time(day: str) -> float:
+    """
+    Measure the time of importing a day, including its dependencies, in a fresh interpreter.
+
+    Args:
+        day (str): The module name of the day.
+
+    Returns:
+        float: The cumulative import time in seconds.
+    """
+    module = f"{__package__}.{day}"
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=os.path.dirname(PACKAGE_DIR),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Lines read "import time: <self us> | <cumulative us> | <indented module name>".
+    for line in completed.stderr.splitlines():
+        fields = line.split("|")
+        if len(fields) == 3 and fields[2].strip() == module:
+            return int(fields[1]) / 1e6
+    raise ValueError(f"no import time reported for {module}")
@@ -0,0 +1,462 @@
+"""Advent of Code 2023 - Runner for all day tasks"""
+
+import argparse
+import concurrent.futures
+import os
+import time
+from typing import Generator, Iterator, TypedDict
+
+from . import budget, cache, profiling, registry, schedule, stats, util
+
+AUTO_ENGINE = "auto"
+
+# The time budget of each part in seconds from the command line, so that a sweep always ends.
+DEFAULT_TIMEOUT = 60.0
+
+PartResult = TypedDict(
+    "PartResult",
+    {
+        "day": str,
+        "part": str,
+        "engine": str,
+        "result": int | None,
+        "cached": bool,
+        "report": str | None,
+        "error": str | None,
+        "wall_time": float,
+        "cpu_time": float,
+        "memory": profiling.MemoryUsage | None,
+        "stats": list[stats.FunctionStats] | None,
+    },
+)
+
+
+# pylint: disable-next=too-many-locals,too-many-arguments,too-many-positional-arguments
+def run_part(
+    day: str,
+    part: str,
+    use_cache: bool = False,
+    profile: bool = False,
+    timeout: float | None = None,
+    memory: bool = False,
+    count_calls: bool = False,
+    parallel: int | None = None,
+    engine: str = AUTO_ENGINE,
+    cross_check: str | None = None,
+) -> PartResult:
+    """
+    Run a single part of a day against its puzzle input and time it.
+
+    A part that spends its time budget is stopped and reported with its last progress, and a
+    part whose answer differs from the one of its cross-check engine is reported as an error.
+
+    Args:
+        day (str): The module name of the day.
+        part (str): The name of the part function, "part_one" or "part_two".
+        use_cache (bool): Whether to reuse and store results in the on-disk cache.
+        profile (bool): Whether to profile the part and write a report.
+        timeout (float | None): The time budget of the part in seconds, or None for no budget.
+        memory (bool): Whether to measure the memory usage of the part.
+        count_calls (bool): Whether to count the calls of the hot functions of the day.
+        parallel (int | None): The number of processes to split the input over if the part
+            has a per-line function, or None to run it on the whole input.
+        engine (str): The solver engine, or "auto" to select it from the input size. Parts
+            without the engine run with the reference one.
+        cross_check (str | None): An engine to run after the part and compare its answer with,
+            if the part has it.
+
+    Returns:
+        PartResult: The result together with the wall and CPU time spent in the part.
+    """
+    if engine == AUTO_ENGINE:
+        engine = registry.select_engine(day, part, os.path.getsize(util.get_path(day)))
+    # Days whose lines are independent sum a <part>_line function over them.
+    line_func = getattr(registry.load(day), part + "_line", None) if parallel else None
+    # Parts without the requested engines, and per-line parts, run with the reference one.
+    available = registry.engines(day, part)
+    if engine not in available or line_func is not None:
+        engine = registry.REFERENCE_ENGINE
+    if cross_check not in available or cross_check == engine:
+        cross_check = None
+    func = registry.get_part(day, part, engine)
+
+    # Reading the input is timed in every mode, as the cache hashes and reads it itself.
+    def execute() -> tuple[int, bool]:
+        if line_func is not None:
+            return util.map_reduce(util.get_path(day), line_func, parallel), False
+        if use_cache:
+            return cache.cached_call(func, util.get_path(day))
+        return util.call_on_file(func, util.get_path(day)), False
+
+    def measure() -> tuple[int, bool]:
+        return profiling.profile_call(execute, title) if profile else execute()
+
+    title = f"{day} {part}"
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    result: int | None = None
+    cached, error = False, None
+    usage: profiling.MemoryUsage | None = None
+    function_stats: list[stats.FunctionStats] | None = None
+    if count_calls:
+        stats.enable(registry.load(day))
+    try:
+        with budget.limit(timeout, title):
+            if memory:
+                (result, cached), usage = profiling.trace_memory(measure)
+            else:
+                result, cached = measure()
+    except budget.BudgetExceeded as exceeded:
+        error = str(exceeded)
+    finally:
+        if count_calls:
+            function_stats = stats.collect(registry.load(day))
+            stats.disable(registry.load(day))
+    wall_time = time.perf_counter() - wall_start
+    cpu_time = time.process_time() - cpu_start
+    if cross_check is not None and error is None:
+        expected = util.call_on_file(registry.get_part(day, part, cross_check), util.get_path(day))
+        if expected != result:
+            error = f"cross-check failed: {engine} gave {result}, {cross_check} gave {expected}"
+    return {
+        "day": day,
+        "part": part,
+        "engine": engine,
+        "result": result,
+        "cached": cached,
+        "report": profiling.report_path(title) if profile and error is None else None,
+        "error": error,
+        "wall_time": wall_time,
+        "cpu_time": cpu_time,
+        "memory": usage,
+        "stats": function_stats,
+    }
+
+
+def collect_tasks(days: list[str], parts: tuple[str, ...]) -> list[tuple[str, str]]:
+    """
+    Build the list of (day, part) tasks, skipping parts that a day does not implement.
+
+    The days are not imported here, only by the workers that run them.
+
+    Args:
+        days (list[str]): The module names of the days to run.
+        parts (tuple[str, ...]): The part function names to run.
+
+    Returns:
+        list[tuple[str, str]]: The tasks to run.
+    """
+    return [(day, part) for day in days for part in parts if part in registry.parts(day)]
+
+
+# pylint: disable-next=too-many-locals,too-many-arguments,too-many-positional-arguments
+def run_tasks(
+    tasks: list[tuple[str, str]],
+    workers: int | None,
+    use_cache: bool = False,
+    profile: bool = False,
+    timeout: float | None = None,
+    progress: float | None = None,
+    memory: bool = False,
+    count_calls: bool = False,
+    parallel: int | None = None,
+    engine: str = AUTO_ENGINE,
+    cross_check: str | None = None,
+) -> Iterator[PartResult]:
+    """
+    Run the tasks in a process pool and yield their results as they finish.
+
+    A part that raises or spends its time budget is reported with its error instead of
+    stopping the sweep. A part whose worker crashes, e.g. when it is killed for running out of
+    memory, breaks the pool it runs in; only that part is reported as crashed, and the parts
+    that the crash interrupted are run again in a new pool.
+
+    Args:
+        tasks (list[tuple[str, str]]): The (day, part) tasks to run.
+        workers (int | None): The number of worker processes, or None for one per core.
+        use_cache (bool): Whether to reuse and store results in the on-disk cache.
+        profile (bool): Whether to profile the parts and write reports.
+        timeout (float | None): The time budget of each part in seconds, or None for no budget.
+        progress (float | None): The seconds between progress reports of long loops.
+        memory (bool): Whether to measure the memory usage of the parts, each in a fresh worker.
+        count_calls (bool): Whether to count the calls of the hot functions of the days.
+        parallel (int | None): The number of processes to split the input of each part with a
+            per-line function over, or None to run the parts on the whole input.
+        engine (str): The solver engine, or "auto" to select it from the input size of each part.
+        cross_check (str | None): An engine to run after each part and compare its answer with.
+
+    Yields:
+        PartResult: The result of each finished task.
+    """
+    options = (use_cache, profile, timeout, memory, count_calls, parallel, engine, cross_check)
+    pending = list(tasks)
+    while pending:
+        running, queued = yield from run_pool(pending, workers, progress, memory, options)
+        # The crashed part was running, so those are run again one by one to find it.
+        for day, part in running or queued:
+            crashed, _ = yield from run_pool([(day, part)], 1, progress, memory, options)
+            if crashed:
+                yield error_result(day, part, engine, "worker process crashed")
+        pending = queued if running else []
+
+
+# pylint: disable-next=too-many-locals
+def run_pool(
+    tasks: list[tuple[str, str]],
+    workers: int | None,
+    progress: float | None,
+    memory: bool,
+    options: tuple[bool, bool, float | None, bool, bool, int | None, str, str | None],
+) -> Generator[PartResult, None, tuple[list[tuple[str, str]], list[tuple[str, str]]]]:
+    """
+    Run the tasks in a single process pool and yield their results as they finish.
+
+    Args:
+        tasks (list[tuple[str, str]]): The (day, part) tasks to run.
+        workers (int | None): The number of worker processes, or None for one per core.
+        progress (float | None): The seconds between progress reports of long loops.
+        memory (bool): Whether each part gets a fresh worker, to measure its memory usage.
+        options (tuple[bool, bool, float | None, bool, bool, int | None, str, str | None]): The
+            arguments of run_part after the day and the part.
+
+    Yields:
+        PartResult: The result of each finished task.
+
+    Returns:
+        tuple[list[tuple[str, str]], list[tuple[str, str]]]: The tasks that a crashed worker
+            broke the pool of, split into the ones that were already running and the rest.
+    """
+    engine = options[-2]
+    running: list[tuple[str, str]] = []
+    queued: list[tuple[str, str]] = []
+    # The peak RSS covers the life of a worker, so each part gets its own when measuring memory.
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=budget.configure,
+        initargs=(progress,),
+        max_tasks_per_child=1 if memory else None,
+    ) as executor:
+        futures = {
+            executor.submit(run_part, day, part, *options): (day, part) for day, part in tasks
+        }
+        not_done = set(futures)
+        while not_done:
+            started = {future for future in not_done if future.running()}
+            done, not_done = concurrent.futures.wait(
+                not_done, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                day, part = futures[future]
+                try:
+                    yield future.result()
+                except concurrent.futures.process.BrokenProcessPool:
+                    (running if future in started else queued).append((day, part))
+                except Exception as error:  # pylint: disable=broad-exception-caught
+                    yield error_result(day, part, engine, repr(error))
+    return running, queued
+
+
+def error_result(day: str, part: str, engine: str, error: str) -> PartResult:
+    """
+    Build the result of a part that failed without reporting a result of its own.
+
+    Args:
+        day (str): The module name of the day.
+        part (str): The name of the part function.
+        engine (str): The solver engine requested for the part.
+        error (str): The error.
+
+    Returns:
+        PartResult: The failed result.
+    """
+    return {
+        "day": day,
+        "part": part,
+        "engine": engine,
+        "result": None,
+        "cached": False,
+        "report": None,
+        "error": error,
+        "wall_time": 0.0,
+        "cpu_time": 0.0,
+        "memory": None,
+        "stats": None,
+    }
+
+
+def format_result(result: PartResult) -> str:
+    """
+    Format a part result as a report line, followed by its memory usage and the statistics of
+    its hot functions if they were measured.
+
+    Args:
+        result (PartResult): The result to format.
+
+    Returns:
+        str: The report.
+    """
+    outcome = str(result["result"]) if result["error"] is None else "error " + result["error"]
+    if result["cached"]:
+        outcome += " (cached)"
+    if result["report"]:
+        outcome += "  profile: " + result["report"]
+    if result["engine"] != registry.REFERENCE_ENGINE:
+        outcome += f"  [{result['engine']}]"
+    line = (
+        f"{result['day']} {result['part']:<8} "
+        f"wall {result['wall_time']:9.3f}s  cpu {result['cpu_time']:9.3f}s  {outcome}"
+    )
+    usage = result["memory"]
+    if usage is not None:
+        line += (
+            f"\n    peak rss {usage['peak_rss'] / 1024 / 1024:.1f} MiB"
+            f"  peak traced {usage['peak_traced'] / 1024 / 1024:.1f} MiB"
+        )
+        line += "".join("\n    " + site for site in usage["top_allocations"])
+    if result["stats"] is not None:
+        line += "".join("\n    " + stats.format_stats(item) for item in result["stats"])
+    return line
+
+
+def report_import_times(days: list[str], import_budget: float) -> int:
+    """
+    Measure the import time of each day and print it, flagging the days over the budget.
+
+    Args:
+        days (list[str]): The module names of the days.
+        import_budget (float): The allowed import time of a day in seconds.
+
+    Returns:
+        int: The exit code, non-zero if any day is over the budget.
+    """
+    over_budget = False
+    for day in days:
+        seconds = registry.import_time(day)
+        flag = "  over budget" if seconds > import_budget else ""
+        over_budget = over_budget or bool(flag)
+        print(f"{day} import {seconds * 1000:7.1f}ms{flag}", flush=True)
+    return int(over_budget)
+
+
+# pylint: disable-next=too-many-locals
+def main(argv: list[str] | None = None) -> int:
+    """
+    Run the selected days and parts and print a report line for each of them.
+
+    Args:
+        argv (list[str] | None): The command line arguments, defaults to sys.argv.
+
+    Returns:
+        int: The exit code, non-zero if any part failed.
+    """
+    parser = argparse.ArgumentParser(prog="python -m src", description=__doc__)
+    parser.add_argument("days", nargs="*", help="days to run, e.g. 5 or day05 (default: all)")
+    parser.add_argument("--part", type=int, choices=(1, 2), help="run only the given part")
+    parser.add_argument("--workers", type=int, help="number of worker processes")
+    parser.add_argument("--cache", action="store_true", help="reuse results of unchanged runs")
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        default=profiling.enabled(),
+        help="write a cProfile/tracemalloc report per part (or set AOC_PROFILE=1)",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=DEFAULT_TIMEOUT,
+        help="time budget of each part in seconds, 0 for none (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--progress",
+        type=float,
+        metavar="SECONDS",
+        help="report the progress of long loops every SECONDS on stderr",
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="report the peak RSS, peak traced memory and top allocation sites of each part",
+    )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="report the calls, time and cache hits of the hot functions of each part",
+    )
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        metavar="PROCESSES",
+        help="split the input of days with independent lines over PROCESSES processes",
+    )
+    parser.add_argument(
+        "--engine",
+        default=AUTO_ENGINE,
+        help="solver engine of the parts, e.g. reference or fast (default: by input size)",
+    )
+    parser.add_argument(
+        "--cross-check",
+        metavar="ENGINE",
+        help="also run each part with ENGINE and fail if the answers differ",
+    )
+    parser.add_argument(
+        "--history",
+        default=schedule.HISTORY_PATH,
+        help="file keeping the wall time of every part, to run the slowest parts first",
+    )
+    parser.add_argument(
+        "--import-times",
+        action="store_true",
+        help="report the import time of each day in a fresh interpreter instead of running it",
+    )
+    parser.add_argument(
+        "--import-budget",
+        type=float,
+        default=registry.IMPORT_BUDGET,
+        metavar="SECONDS",
+        help="import time above which --import-times fails",
+    )
+    args = parser.parse_args(argv)
+
+    days = [registry.resolve_day(day) for day in args.days] or registry.discover_days()
+    if args.import_times:
+        return report_import_times(days, args.import_budget)
+    # The engines are read from the sources, so that the days are still only imported by the
+    # workers that run them.
+    declared = {AUTO_ENGINE}.union(*map(registry.declared_engines, days))
+    for engine in (args.engine, args.cross_check):
+        if engine is not None and engine not in declared:
+            parser.error(f"no selected day has the engine {engine!r}")
+    parts = registry.PARTS if args.part is None else (registry.PARTS[args.part - 1],)
+
+    failed = False
+    wall_start = time.perf_counter()
+    history = schedule.load_history(args.history)
+    tasks = schedule.order_tasks(collect_tasks(days, parts), history)
+    durations: list[float] = []
+    # Only uncached, successful and uninstrumented runs of the default engine on the whole input
+    # tell how long a part takes in a default run.
+    record = not (args.profile or args.memory or args.stats or args.parallel)
+    record = record and args.engine == AUTO_ENGINE
+    for result in run_tasks(
+        tasks,
+        args.workers,
+        args.cache,
+        args.profile,
+        args.timeout or None,
+        args.progress,
+        args.memory,
+        args.stats,
+        args.parallel,
+        args.engine,
+        args.cross_check,
+    ):
+        failed = failed or result["error"] is not None
+        print(format_result(result), flush=True)
+        durations.append(result["wall_time"])
+        if record and not (result["cached"] or result["error"]):
+            history[schedule.task_key(result["day"], result["part"])] = result["wall_time"]
+    wall_time = time.perf_counter() - wall_start
+    schedule.save_history(history, args.history)
+    workers = min(args.workers or os.cpu_count() or 1, max(len(tasks), 1))
+    print(f"total wall {wall_time:.3f}s  " + schedule.format_balance(durations, workers, wall_time))
+    return int(failed)
@@ -0,0 +1,112 @@
+"""Advent of Code 2023 - Longest processing time first scheduling of the runner's tasks
+
+The wall time of every part is kept in a small JSON history in the cache directory. The next
+run submits the parts that took longest first, so that a slow part does not start last and
+hold up the whole run, and reports how close the run came to an ideal balance of the load
+over its workers.
+"""
+
+import json
+import os
+
+from .cache import CACHE_DIR
+
+HISTORY_PATH = os.path.join(CACHE_DIR, "timings.json")
+
+
+def task_key(day: str, part: str) -> str:
+    """
+    Build the history key of a task.
+
+    Args:
+        day (str): The module name of the day.
+        part (str): The name of the part function.
+
+    Returns:
+        str: The key, e.g. "day12.part_two".
+    """
+    return f"{day}.{part}"
+
+
+def load_history(path: str = HISTORY_PATH) -> dict[str, float]:
+    """
+    Load the wall times of earlier runs.
+
+    Args:
+        path (str): The path of the history file.
+
+    Returns:
+        dict[str, float]: The last wall time in seconds of every task, or nothing if there is
+            no readable history yet.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            history: dict[str, float] = json.load(file)
+    except (OSError, ValueError):
+        return {}
+    return history
+
+
+def save_history(history: dict[str, float], path: str = HISTORY_PATH) -> None:
+    """
+    Store the wall times of the tasks, replacing the history file atomically.
+
+    Args:
+        history (dict[str, float]): The wall time in seconds of every task.
+        path (str): The path of the history file.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as file:
+        json.dump(history, file, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def order_tasks(tasks: list[tuple[str, str]], history: dict[str, float]) -> list[tuple[str, str]]:
+    """
+    Order the tasks longest first by their wall time in the history.
+
+    Tasks without a history come first, as nothing is known about how long they take.
+
+    Args:
+        tasks (list[tuple[str, str]]): The (day, part) tasks.
+        history (dict[str, float]): The wall time in seconds of earlier runs of the tasks.
+
+    Returns:
+        list[tuple[str, str]]: The tasks in the order to submit them.
+    """
+    return sorted(tasks, key=lambda task: -history.get(task_key(*task), float("inf")))
+
+
+def ideal_wall_time(durations: list[float], workers: int) -> float:
+    """
+    Calculate the lower bound of the wall time of running tasks on a number of workers: the
+    work spread evenly over the workers, but never less than the longest task.
+
+    Args:
+        durations (list[float]): The wall time in seconds of every task.
+        workers (int): The number of workers.
+
+    Returns:
+        float: The ideal wall time in seconds.
+    """
+    if not durations:
+        return 0.0
+    return max(sum(durations) / workers, *durations)
+
+
+def format_balance(durations: list[float], workers: int, wall_time: float) -> str:
+    """
+    Format how close a run came to the ideal balance of its load over its workers.
+
+    Args:
+        durations (list[float]): The wall time in seconds of every task.
+        workers (int): The number of workers.
+        wall_time (float): The wall time in seconds of the whole run.
+
+    Returns:
+        str: The report line, e.g. "balance 92% (ideal 11.000s on 4 workers)".
+    """
+    ideal = ideal_wall_time(durations, workers)
+    balance = ideal / wall_time if wall_time > 0 else 1.0
+    return f"balance {balance:.0%} (ideal {ideal:.3f}s on {workers} workers)"
@@ -0,0 +1,152 @@
+"""Advent of Code 2023 - Call counters and cache statistics of hot functions
+
+A day lists its hot functions in a HOT_FUNCTIONS tuple; functions wrapped in functools.cache are
+picked up on their own. Nothing is wrapped until enable() swaps the module attributes for
+counting wrappers, so the functions run untouched when statistics are off. Recursive calls go
+through the module attribute as well, so they are counted, while their time is only counted
+once at the outermost call.
+"""
+
+import functools
+import time
+from types import ModuleType
+from typing import Any, Callable, TypedDict
+
+CacheStats = TypedDict("CacheStats", {"hits": int, "misses": int, "size": int})
+
+FunctionStats = TypedDict(
+    "FunctionStats",
+    {"name": str, "calls": int, "time": float, "cache": CacheStats | None},
+)
+
+
+class _Counter:  # pylint: disable=too-few-public-methods
+    """The calls and the time counted for a single instrumented function."""
+
+    def __init__(self, func: Callable[..., Any]) -> None:
+        self.func = func
+        self.calls = 0
+        self.time = 0.0
+        self.depth = 0
+        self.cache_info: Callable[[], Any] | None = getattr(func, "cache_info", None)
+        self.cache_start = self.cache_info() if self.cache_info is not None else None
+
+
+_instrumented: dict[tuple[str, str], _Counter] = {}
+
+
+def hot_functions(module: ModuleType) -> list[str]:
+    """
+    List the functions of a day to instrument.
+
+    Args:
+        module (ModuleType): The day module.
+
+    Returns:
+        list[str]: The names of the functions listed in HOT_FUNCTIONS and of the cached ones.
+    """
+    names = list(getattr(module, "HOT_FUNCTIONS", ()))
+    for name, value in vars(module).items():
+        if hasattr(value, "cache_info") and name not in names:
+            names.append(name)
+    return names
+
+
+def enable(module: ModuleType) -> None:
+    """
+    Replace the hot functions of a day with counting wrappers.
+
+    Args:
+        module (ModuleType): The day module.
+    """
+    for name in hot_functions(module):
+        key = (module.__name__, name)
+        if key not in _instrumented:
+            counter = _Counter(getattr(module, name))
+            _instrumented[key] = counter
+            setattr(module, name, _wrap(counter))
+
+
+def disable(module: ModuleType) -> None:
+    """
+    Restore the original hot functions of a day.
+
+    Args:
+        module (ModuleType): The day module.
+    """
+    for module_name, name in list(_instrumented):
+        if module_name == module.__name__:
+            setattr(module, name, _instrumented.pop((module_name, name)).func)
+
+
+def collect(module: ModuleType) -> list[FunctionStats]:
+    """
+    Get the statistics counted for the hot functions of a day since they were enabled.
+
+    Args:
+        module (ModuleType): The day module.
+
+    Returns:
+        list[FunctionStats]: The calls, time and cache statistics of every instrumented function.
+    """
+    collected: list[FunctionStats] = []
+    for (module_name, name), counter in _instrumented.items():
+        if module_name != module.__name__:
+            continue
+        cache: CacheStats | None = None
+        if counter.cache_info is not None and counter.cache_start is not None:
+            info = counter.cache_info()
+            cache = {
+                "hits": info.hits - counter.cache_start.hits,
+                "misses": info.misses - counter.cache_start.misses,
+                "size": info.currsize,
+            }
+        short_name = module_name.rsplit(".", 1)[-1] + "." + name
+        collected.append(
+            {"name": short_name, "calls": counter.calls, "time": counter.time, "cache": cache}
+        )
+    return collected
+
+
+def format_stats(function_stats: FunctionStats) -> str:
+    """
+    Format the statistics of a function as a single report line.
+
+    Args:
+        function_stats (FunctionStats): The statistics to format.
+
+    Returns:
+        str: The report line.
+    """
+    line = (
+        f"{function_stats['name']:<28} calls {function_stats['calls']:>10}  "
+        f"time {function_stats['time']:9.3f}s"
+    )
+    cache = function_stats["cache"]
+    if cache is not None:
+        lookups = cache["hits"] + cache["misses"]
+        hit_rate = cache["hits"] / lookups if lookups else 0.0
+        line += (
+            f"  cache hits {cache['hits']} misses {cache['misses']} size {cache['size']}"
+            f" ({hit_rate:.0%} hits)"
+        )
+    return line
+
+
+def _wrap(counter: _Counter) -> Callable[..., Any]:
+    func = counter.func
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        counter.calls += 1
+        if counter.depth:
+            return func(*args, **kwargs)
+        counter.depth += 1
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            counter.time += time.perf_counter() - start
+            counter.depth -= 1
+
+    return wrapper
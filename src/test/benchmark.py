@@ -0,0 +1,388 @@
+"""Advent of Code 2023 - Benchmark suite for the day tasks
+
+Times every part on small, medium and large generated inputs, writes the timings to a JSON file
+and fails when a part got slower than a stored baseline by more than the given threshold. With
+--memory the peak traced memory of every part is recorded and checked the same way. With
+--complexity every part is instead timed on a geometric series of input sizes, and fails when
+the exponent fitted to its running time over the input size exceeds its budget.
+
+Usage: python -m src.test.benchmark [days...] [--threshold 1.5] [--memory] [--update-baseline]
+       python -m src.test.benchmark [days...] --complexity [--steps 5]
+"""
+
+import argparse
+import json
+import math
+import os
+import statistics
+import time
+import tracemalloc
+from typing import Callable, Iterator
+
+from .. import generators, registry, runner
+
+SCALES = ("small", "medium", "large")
+
+SEED = 2023
+
+# Suffix of the result keys holding the peak traced memory of a part in bytes.
+MEMORY_SUFFIX = ".peak_memory"
+
+MIN_BYTES = 1024 * 1024
+
+# Parts whose running time explodes on generated inputs of any useful size.
+SKIPPED_PARTS = (("day05", "part_two"), ("day06", "part_two"), ("day14", "part_two"))
+
+# The allowed exponent of the running time over the input size in bytes.
+COMPLEXITY_BUDGET = 1.4
+
+# Parts whose work grows faster than their input by nature, with their own budget.
+COMPLEXITY_BUDGETS = {
+    ("day05", "part_one"): 2.0,  # every seed is looked up in every range
+    ("day11", "part_one"): 2.0,  # every pair of galaxies
+    ("day11", "part_two"): 2.0,
+    ("day12", "part_one"): 2.0,  # the arrangements of ever longer rows
+    ("day15", "part_two"): 2.0,  # lenses are looked up in the list of their box
+    ("day16", "part_two"): 1.5,  # a beam from every edge tile
+    ("day18", "part_one"): 2.0,  # the lagoon area grows with the square of the dig plan
+    ("day04", "part_two", "chain"): 1.2,  # the copies grow with the square of the cards
+}
+
+# Generator variants that parts are also timed on, by (day, part, variant), with the engine
+# timed. The block-wise day 4 cards keep the copies linear, so work done per copy only shows
+# on cards that chain their wins.
+COMPLEXITY_VARIANTS = {("day04", "part_two", "chain"): "fast"}
+
+
+def build_input(day: str, scale: str) -> list[str]:
+    """
+    Generate the input of a day at the given scale.
+
+    Args:
+        day (str): The module name of the day.
+        scale (str): One of the SCALES names.
+
+    Returns:
+        list[str]: The input lines.
+    """
+    return generators.generate(day, SEED, generators.sizes(day)[scale])
+
+
+def time_part(func: Callable[[list[str]], int], lines: list[str], repeat: int) -> float:
+    """
+    Time a part function, returning the best of several runs.
+
+    Every run gets its own copy of the lines, as some parts consume their input.
+
+    Args:
+        func (Callable[[list[str]], int]): The part function.
+        lines (list[str]): The input lines.
+        repeat (int): The number of runs.
+
+    Returns:
+        float: The shortest wall time in seconds.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        copy = list(lines)
+        start = time.perf_counter()
+        func(copy)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure_memory(func: Callable[[list[str]], int], lines: list[str]) -> int:
+    """
+    Measure the peak traced memory of a single run of a part function.
+
+    Args:
+        func (Callable[[list[str]], int]): The part function.
+        lines (list[str]): The input lines.
+
+    Returns:
+        int: The peak traced memory in bytes.
+    """
+    copy = list(lines)
+    tracemalloc.start()
+    try:
+        func(copy)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def run_benchmarks(
+    days: list[str], scales: list[str], repeat: int, memory: bool = False
+) -> dict[str, float]:
+    """
+    Time every part of the given days at the given scales.
+
+    Args:
+        days (list[str]): The module names of the days.
+        scales (list[str]): The scale names.
+        repeat (int): The number of runs per measurement.
+        memory (bool): Whether to also measure the peak traced memory of every part.
+
+    Returns:
+        dict[str, float]: The timings keyed by "day.part.scale", and the peak memory keyed by
+            "day.part.scale.peak_memory".
+    """
+    results: dict[str, float] = {}
+    for day, part in runner.collect_tasks(days, registry.PARTS):
+        if (day, part) in SKIPPED_PARTS:
+            continue
+        func = registry.get_part(day, part)
+        for scale in scales:
+            lines = build_input(day, scale)
+            results[f"{day}.{part}.{scale}"] = time_part(func, lines, repeat)
+            if memory:
+                results[f"{day}.{part}.{scale}{MEMORY_SUFFIX}"] = measure_memory(func, lines)
+    return results
+
+
+def find_regressions(
+    results: dict[str, float],
+    baseline: dict[str, float],
+    threshold: float,
+    min_time: float,
+    min_bytes: float = MIN_BYTES,
+) -> list[str]:
+    """
+    Compare timings and peak memory against a baseline.
+
+    Measurements where both runs are below min_time or min_bytes are ignored, as they are
+    dominated by noise.
+
+    Args:
+        results (dict[str, float]): The current measurements.
+        baseline (dict[str, float]): The baseline measurements.
+        threshold (float): The allowed slowdown or growth factor.
+        min_time (float): The noise floor in seconds.
+        min_bytes (float): The noise floor of the peak memory in bytes.
+
+    Returns:
+        list[str]: A description of every regression found.
+    """
+    regressions: list[str] = []
+    for key, value in sorted(results.items()):
+        base = baseline.get(key)
+        floor = min_bytes if key.endswith(MEMORY_SUFFIX) else min_time
+        if base is None or max(base, value) < floor:
+            continue
+        if value > base * threshold:
+            regressions.append(
+                f"{key}: {format_value(key, base)} -> {format_value(key, value)} "
+                f"({value / base:.2f}x)"
+            )
+    return regressions
+
+
+def format_value(key: str, value: float) -> str:
+    """
+    Format a measurement in the unit of its key.
+
+    Args:
+        key (str): The result key.
+        value (float): The measurement.
+
+    Returns:
+        str: The seconds, or the MiB of a peak memory measurement.
+    """
+    if key.endswith(MEMORY_SUFFIX):
+        return f"{value / 1024 / 1024:.2f} MiB"
+    return f"{value:.4f}s"
+
+
+def input_bytes(lines: list[str]) -> int:
+    """
+    Measure the size of an input as it would be stored in a file.
+
+    Args:
+        lines (list[str]): The input lines.
+
+    Returns:
+        int: The size in bytes, counting a newline per line.
+    """
+    return sum(len(line) + 1 for line in lines)
+
+
+def fit_exponent(sizes: list[int], times: list[float]) -> float:
+    """
+    Fit the exponent k of a running time growing as size ** k, as the least squares slope of
+    the logarithm of the times over the logarithm of the sizes.
+
+    Args:
+        sizes (list[int]): The input sizes.
+        times (list[float]): The running times at those sizes.
+
+    Returns:
+        float: The fitted exponent.
+    """
+    slope, _ = statistics.linear_regression(list(map(math.log, sizes)), list(map(math.log, times)))
+    return slope
+
+
+def complexity_sizes(day: str, steps: int) -> list[int]:
+    """
+    Spread generator sizes geometrically from the small to the large scale of a day.
+
+    Args:
+        day (str): The module name of the day.
+        steps (int): The number of sizes.
+
+    Returns:
+        list[int]: The distinct generator sizes, smallest first.
+    """
+    small, large = generators.sizes(day)["small"], generators.sizes(day)["large"]
+    ratio = (large / small) ** (1 / max(steps - 1, 1))
+    return sorted({round(small * ratio**step) for step in range(steps)})
+
+
+def measure_complexity(
+    days: list[str], steps: int, repeat: int, min_time: float
+) -> Iterator[tuple[str, float]]:
+    """
+    Fit the scaling exponent of every part of the given days over a geometric series of
+    generated input sizes between the small and the large scale, and of the parts with
+    generator variants over the same sizes of their variants.
+
+    Timings below min_time are dropped as noise, and parts with fewer than two timings left
+    are not reported.
+
+    Args:
+        days (list[str]): The module names of the days.
+        steps (int): The number of input sizes.
+        repeat (int): The number of runs per measurement.
+        min_time (float): The noise floor in seconds.
+
+    Yields:
+        tuple[str, float]: The key "day.part", or "day.part.variant" for a variant, and the
+            fitted exponent of each part, as soon as it is measured.
+    """
+    for day, part in runner.collect_tasks(days, registry.PARTS):
+        measurements: list[tuple[str | None, str]] = []
+        if (day, part) not in SKIPPED_PARTS:
+            measurements.append((None, registry.REFERENCE_ENGINE))
+        for (variant_day, variant_part, name), engine in COMPLEXITY_VARIANTS.items():
+            if (variant_day, variant_part) == (day, part):
+                measurements.append((name, engine))
+        for variant, engine in measurements:
+            func = registry.get_part(day, part, engine)
+            exponent = fit_part(func, day, variant, steps, repeat, min_time)
+            if exponent is not None:
+                yield ".".join(filter(None, (day, part, variant))), exponent
+
+
+# pylint: disable-next=too-many-arguments,too-many-positional-arguments
+def fit_part(
+    func: Callable[[list[str]], int],
+    day: str,
+    variant: str | None,
+    steps: int,
+    repeat: int,
+    min_time: float,
+) -> float | None:
+    """
+    Fit the scaling exponent of a part over a geometric series of generated input sizes.
+
+    Args:
+        func (Callable[[list[str]], int]): The part function.
+        day (str): The module name of the day.
+        variant (str | None): The generator variant of the day, or None for the default one.
+        steps (int): The number of input sizes.
+        repeat (int): The number of runs per measurement.
+        min_time (float): The noise floor in seconds.
+
+    Returns:
+        float | None: The fitted exponent, or None with fewer than two timings above the floor.
+    """
+    sizes: list[int] = []
+    times: list[float] = []
+    for size in complexity_sizes(day, steps):
+        lines = generators.generate(day, SEED, size, variant)
+        seconds = time_part(func, lines, repeat)
+        if seconds >= min_time:
+            sizes.append(input_bytes(lines))
+            times.append(seconds)
+    return fit_exponent(sizes, times) if len(sizes) >= 2 else None
+
+
+def find_complexity_violations(exponents: dict[str, float]) -> list[str]:
+    """
+    Compare fitted exponents against the complexity budget of their parts.
+
+    Args:
+        exponents (dict[str, float]): The fitted exponents keyed by "day.part" or
+            "day.part.variant".
+
+    Returns:
+        list[str]: A description of every part that scales worse than its budget.
+    """
+    violations: list[str] = []
+    for key, exponent in sorted(exponents.items()):
+        budget = COMPLEXITY_BUDGETS.get(tuple(key.split(".")), COMPLEXITY_BUDGET)
+        if exponent > budget:
+            violations.append(f"{key}: n^{exponent:.2f} exceeds the budget of n^{budget:.2f}")
+    return violations
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Run the benchmarks, write the results and check them against the baseline.
+
+    Args:
+        argv (list[str] | None): The command line arguments, defaults to sys.argv.
+
+    Returns:
+        int: The exit code, non-zero if a regression was found.
+    """
+    parser = argparse.ArgumentParser(prog="python -m src.test.benchmark", description=__doc__)
+    parser.add_argument("days", nargs="*", help="days to benchmark (default: all)")
+    parser.add_argument("--scales", nargs="+", choices=SCALES, default=list(SCALES))
+    parser.add_argument("--repeat", type=int, default=3, help="runs per measurement")
+    parser.add_argument("--output", default="bench_results.json", help="results file")
+    parser.add_argument("--baseline", default="bench_baseline.json", help="baseline file")
+    parser.add_argument("--threshold", type=float, default=1.5, help="allowed slowdown factor")
+    parser.add_argument("--min-time", type=float, default=0.005, help="noise floor in seconds")
+    parser.add_argument("--memory", action="store_true", help="also measure peak memory")
+    parser.add_argument("--min-bytes", type=float, default=MIN_BYTES, help="memory noise floor")
+    parser.add_argument("--update-baseline", action="store_true", help="store as baseline")
+    parser.add_argument(
+        "--complexity", action="store_true", help="fit and check the scaling of every part"
+    )
+    parser.add_argument("--steps", type=int, default=5, help="input sizes of --complexity")
+    args = parser.parse_args(argv)
+
+    days = [registry.resolve_day(day) for day in args.days] or registry.discover_days()
+    if args.complexity:
+        exponents: dict[str, float] = {}
+        for key, exponent in measure_complexity(days, args.steps, args.repeat, args.min_time):
+            exponents[key] = exponent
+            print(f"{key:<36} n^{exponent:.2f}", flush=True)
+        violations = find_complexity_violations(exponents)
+        for violation in violations:
+            print("COMPLEXITY " + violation)
+        return int(bool(violations))
+
+    results = run_benchmarks(days, args.scales, args.repeat, args.memory)
+    for key, value in results.items():
+        print(f"{key:<36} {format_value(key, value):>12}")
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(results, file, indent=2, sort_keys=True)
+
+    if args.update_baseline or not os.path.exists(args.baseline):
+        with open(args.baseline, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2, sort_keys=True)
+        return 0
+
+    with open(args.baseline, "r", encoding="utf-8") as file:
+        baseline = json.load(file)
+    regressions = find_regressions(results, baseline, args.threshold, args.min_time, args.min_bytes)
+    for regression in regressions:
+        print("REGRESSION " + regression)
+    return int(bool(regressions))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
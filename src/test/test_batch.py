@@ -0,0 +1,66 @@
+"""Advent of Code 2023 - Unit tests for the batch mode"""
+from pathlib import Path
+
+import pytest
+
+from .. import batch, generators
+
+
+def test_run_batch(tmp_path: Path) -> None:
+    """
+    Test function for run_batch.
+
+    This function tests that every input of a directory is solved, and that an input that
+    makes the day raise is reported with its error.
+
+    Returns:
+        None
+    """
+    for seed in range(3):
+        lines = generators.generate("day02", seed, 20)
+        (tmp_path / f"{seed}.txt").write_text("\n".join(lines), encoding="utf-8")
+    (tmp_path / "broken.txt").write_text("Game x\n", encoding="utf-8")
+
+    file_paths = batch.list_inputs(str(tmp_path))
+    results = {
+        Path(result["file"]).name: result
+        for result in batch.run_batch("day02", file_paths, ("part_one", "part_two"), 2)
+    }
+    assert sorted(results) == ["0.txt", "1.txt", "2.txt", "broken.txt"]
+    assert results["broken.txt"]["error"] is not None
+    for seed in range(3):
+        expected = batch.solve_file("day02", str(tmp_path / f"{seed}.txt"), ("part_two",))
+        assert results[f"{seed}.txt"]["results"]["part_two"] == expected["results"]["part_two"]
+
+
+def test_main(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    """
+    Test function for main.
+
+    This function tests that the batch reports a line per input and the total throughput.
+
+    Returns:
+        None
+    """
+    (tmp_path / "a.txt").write_text("1abc2\n", encoding="utf-8")
+    (tmp_path / "b.txt").write_text("pqr3stu8vwx\n", encoding="utf-8")
+    assert not batch.main(["1", str(tmp_path), "--part", "1", "--workers", "2"])
+    output = capsys.readouterr().out
+    assert "a.txt" in output and "part_one 12" in output
+    assert "b.txt" in output and "part_one 38" in output
+    assert "2 files" in output and "files/s" in output
+
+
+def test_solve_file(tmp_path: Path) -> None:
+    """
+    Test function for solve_file.
+
+    This function tests that a day with a solve step answers both parts from one pass.
+
+    Returns:
+        None
+    """
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("two1nine\n4nineeightseven2\n", encoding="utf-8")
+    result = batch.solve_file("day01", str(input_file), ("part_one", "part_two"))
+    assert result["results"] == {"part_one": 11 + 42, "part_two": 29 + 42}
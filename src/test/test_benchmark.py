@@ -0,0 +1,100 @@
+"""Advent of Code 2023 - Unit tests for the benchmark suite"""
+import json
+from pathlib import Path
+
+from . import benchmark
+
+
+def test_build_input() -> None:
+    """
+    Test function for build_input.
+
+    This function tests that inputs grow with the scale.
+
+    Returns:
+        None
+    """
+    assert len(benchmark.build_input("day01", "small")) == 1000
+    assert len(benchmark.build_input("day01", "medium")) == 10000
+    assert len(benchmark.build_input("day03", "large")[0]) == 500
+
+
+def test_find_regressions() -> None:
+    """
+    Test function for find_regressions.
+
+    This function tests that only slowdowns above the threshold and the noise floor are
+    reported.
+
+    Returns:
+        None
+    """
+    baseline = {"a": 1.0, "b": 1.0, "c": 0.001, "d": 1.0}
+    results = {"a": 1.4, "b": 2.0, "c": 0.004, "e": 5.0}
+    regressions = benchmark.find_regressions(results, baseline, 1.5, 0.005)
+    assert len(regressions) == 1
+    assert regressions[0].startswith("b:")
+
+
+def test_find_memory_regressions() -> None:
+    """
+    Test function for find_regressions with peak memory measurements.
+
+    This function tests that memory growth is checked against its own noise floor and
+    reported in MiB.
+
+    Returns:
+        None
+    """
+    baseline = {"a.peak_memory": 4 * 2**20, "b.peak_memory": 2**10, "c": 1.0}
+    results = {"a.peak_memory": 8 * 2**20, "b.peak_memory": 2**15, "c": 1.0}
+    assert benchmark.find_regressions(results, baseline, 1.5, 0.005) == [
+        "a.peak_memory: 4.00 MiB -> 8.00 MiB (2.00x)"
+    ]
+    assert benchmark.measure_memory(lambda lines: len(list(range(10**5))), []) > 10**5
+
+
+def test_complexity() -> None:
+    """
+    Test function for fit_exponent, complexity_sizes and find_complexity_violations.
+
+    This function tests that the scaling exponent is fitted from the timings and that parts
+    are checked against their own budget or the default one.
+
+    Returns:
+        None
+    """
+    sizes = [100, 200, 400, 800]
+    assert abs(benchmark.fit_exponent(sizes, [size * 1e-6 for size in sizes]) - 1) < 1e-9
+    assert abs(benchmark.fit_exponent(sizes, [size**2 * 1e-9 for size in sizes]) - 2) < 1e-9
+    assert benchmark.complexity_sizes("day11", 4) == [20, 32, 50, 80]
+    assert benchmark.find_complexity_violations(
+        {"day01.part_one": 1.1, "day01.part_two": 2.0, "day11.part_two": 1.9}
+    ) == ["day01.part_two: n^2.00 exceeds the budget of n^1.40"]
+    assert benchmark.find_complexity_violations({"day04.part_two.chain": 1.3}) == [
+        "day04.part_two.chain: n^1.30 exceeds the budget of n^1.20"
+    ]
+
+
+def test_main(tmp_path: Path) -> None:
+    """
+    Test function for main.
+
+    This function tests that the first run stores a baseline and that a later run fails
+    against a baseline it cannot meet.
+
+    Returns:
+        None
+    """
+    output = tmp_path / "results.json"
+    baseline = tmp_path / "baseline.json"
+    args = ["1", "--scales", "small", "--repeat", "1", "--output", str(output)]
+    args += ["--baseline", str(baseline), "--min-time", "0"]
+    assert not benchmark.main(args)
+    assert set(json.loads(baseline.read_text())) == {
+        "day01.part_one.small",
+        "day01.part_two.small",
+    }
+
+    baseline.write_text(json.dumps({"day01.part_one.small": 1e-9}))
+    assert benchmark.main(args) == 1
@@ -0,0 +1,76 @@
+"""Advent of Code 2023 - Unit tests for time budgets and progress reports"""
+import itertools
+
+import pytest
+
+from .. import budget
+
+
+def test_checkpoint(capsys: pytest.CaptureFixture[str]) -> None:
+    """
+    Test function for checkpoint.
+
+    This function tests that a checkpointed loop reports its progress and is stopped with its
+    last progress once its budget is spent.
+
+    Returns:
+        None
+    """
+    budget.checkpoint("steps", 1, 10)
+
+    budget.configure(0.0)
+    try:
+        with pytest.raises(budget.BudgetExceeded) as exceeded:
+            with budget.limit(0.2, "test"):
+                for i in itertools.count():
+                    budget.checkpoint("steps", i, 10**12)
+    finally:
+        budget.configure(None)
+    assert exceeded.value.progress is not None
+    assert exceeded.value.progress["label"] == "steps"
+    assert exceeded.value.progress["done"] > 0
+    assert "test steps" in capsys.readouterr().err
+
+
+def test_limit_without_checkpoints() -> None:
+    """
+    Test function for limit.
+
+    This function tests that a loop without checkpoints is stopped by the alarm, and that a
+    part within its budget is left alone.
+
+    Returns:
+        None
+    """
+    with pytest.raises(budget.BudgetExceeded) as exceeded:
+        with budget.limit(0.2):
+            while True:
+                pass
+    assert exceeded.value.progress is None
+
+    with budget.limit(5):
+        total = sum(range(1000))
+    assert total == 499500
+
+
+def test_format_progress() -> None:
+    """
+    Test function for format_progress.
+
+    This function tests the rate and the estimated time left of a progress report.
+
+    Returns:
+        None
+    """
+    progress: budget.Progress = {
+        "title": "day14 part_two",
+        "label": "cycles",
+        "done": 200,
+        "total": 2000000,
+        "elapsed": 2.0,
+    }
+    assert budget.format_progress(progress) == "day14 part_two cycles 200/2000000 (100/s, eta 5h)"
+    progress["total"] = None
+    assert budget.format_progress(progress) == "day14 part_two cycles 200 (100/s)"
+    assert budget.format_duration(float("inf")) == "never"
+    assert budget.format_duration(42) == "42s"
@@ -0,0 +1,115 @@
+"""Advent of Code 2023 - Unit tests for the result cache"""
+
+import inspect
+import os
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+from .. import cache, day01, day02, day11, util
+
+
+def test_cached_call(tmp_path: Path) -> None:
+    """
+    Test function for cached_call.
+
+    This function tests that a result is computed once, reused for the same input and
+    arguments, and recomputed when the input or the arguments change.
+
+    Returns:
+        None
+    """
+    cache_dir = str(tmp_path / "cache")
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("1abc2\npqr3stu8vwx\n")
+
+    assert cache.cached_call(day01.part_one, str(input_file), (), cache_dir) == (50, False)
+    assert cache.cached_call(day01.part_one, str(input_file), (), cache_dir) == (50, True)
+    assert cache.cached_call(day01.part_two, str(input_file), (), cache_dir) == (50, False)
+
+    input_file.write_text("1abc2\n")
+    assert cache.cached_call(day01.part_one, str(input_file), (), cache_dir) == (12, False)
+
+    input_file.write_text("#.\n..\n.#\n")
+    assert cache.cached_call(day11.part_two, str(input_file), (2,), cache_dir) == (4, False)
+    assert cache.cached_call(day11.part_two, str(input_file), (10,), cache_dir) == (12, False)
+    assert cache.cached_call(day11.part_two, str(input_file), (2,), cache_dir) == (4, True)
+
+
+def test_cached_parse(tmp_path: Path) -> None:
+    """
+    Test function for cached_parse.
+
+    This function tests that both parts of a day are answered from a single cached parse of
+    the input, and that the parse is redone when the input changes.
+
+    Returns:
+        None
+    """
+    cache_dir = str(tmp_path / "cache")
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("Game 1: 3 blue, 4 red; 2 green\n", encoding="utf-8")
+
+    assert cache.cached_parse(day02, str(input_file), cache_dir) == day02.parse(
+        ["Game 1: 4 red, 2 green, 3 blue"]
+    )
+    assert cache.cached_call(day02.part_one, str(input_file), (), cache_dir) == (1, False)
+
+    key = cache.parse_key(str(input_file), day02)
+    cache.store_parsed(key, day02.parse(["Game 7: 1 red, 1 green, 1 blue"]), cache_dir)
+    assert cache.cached_call(day02.part_two, str(input_file), (), cache_dir) == (1, False)
+
+    input_file.write_text("Game 2: 1 blue, 1 red, 1 green\n", encoding="utf-8")
+    assert cache.cached_parse(day02, str(input_file), cache_dir) == day02.parse(
+        ["Game 2: 1 red, 1 green, 1 blue"]
+    )
+
+
+def test_cache_keys_cover_util(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test function for cache_key and parse_key.
+
+    This function tests that the keys change when the utilities that the days parse with
+    change.
+
+    Returns:
+        None
+    """
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("Game 1: 3 blue, 4 red\n", encoding="utf-8")
+    keys = (
+        cache.cache_key(str(input_file), day02.part_one, ()),
+        cache.parse_key(str(input_file), day02),
+    )
+    getsource = inspect.getsource
+
+    def changed_util_source(module: ModuleType) -> str:
+        return getsource(module) + ("# changed\n" if module is util else "")
+
+    monkeypatch.setattr(inspect, "getsource", changed_util_source)
+    assert cache.cache_key(str(input_file), day02.part_one, ()) != keys[0]
+    assert cache.parse_key(str(input_file), day02) != keys[1]
+
+
+def test_evict(tmp_path: Path) -> None:
+    """
+    Test function for evict.
+
+    This function tests that the least recently used results are removed first.
+
+    Returns:
+        None
+    """
+    cache_dir = str(tmp_path)
+    for i, key in enumerate(("old", "used", "new")):
+        cache.store(key, 1, cache_dir)
+        os.utime(cache.result_path(key, cache_dir), (i, i))
+    assert cache.load("used", cache_dir) == 1
+
+    size = os.path.getsize(cache.result_path("new", cache_dir))
+    cache.store("newest", 1, cache_dir, max_bytes=2 * size)
+    assert cache.load("old", cache_dir) is None
+    assert cache.load("new", cache_dir) is None
+    assert cache.load("used", cache_dir) == 1
+    assert cache.load("newest", cache_dir) == 1
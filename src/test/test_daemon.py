@@ -0,0 +1,48 @@
+"""Advent of Code 2023 - Unit tests for the warm solver daemon"""
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from .. import daemon
+
+
+def test_daemon(tmp_path: Path) -> None:
+    """
+    Test function for serve and request.
+
+    This function tests that the daemon answers solve requests, reuses the parsed input of an
+    unchanged file, reports errors and stops on request.
+
+    Returns:
+        None
+    """
+    # Unix socket paths are limited to about a hundred characters.
+    socket_dir = tempfile.mkdtemp(prefix="aoc")
+    socket_path = os.path.join(socket_dir, "daemon.sock")
+    server = threading.Thread(target=daemon.serve, args=(socket_path,))
+    server.start()
+    try:
+        while not os.path.exists(socket_path):
+            time.sleep(0.01)
+        input_file = tmp_path / "input.txt"
+        input_file.write_text("Game 1: 3 blue, 4 red; 2 green\n", encoding="utf-8")
+
+        for part, expected in (("part_one", 1), ("part_two", 24)):
+            message = {"day": "2", "part": part, "path": str(input_file)}
+            response = daemon.request(message, socket_path)
+            assert response["error"] is None
+            assert response["result"] == expected
+        assert daemon.request({"day": "1", "part": "part_one"}, socket_path)["result"] == 55029
+        status = daemon.request({"command": "status"}, socket_path)["result"]
+        assert status["parsed"] == 1
+        assert "day02" in status["days"]
+
+        message = {"day": "2", "part": "part_one", "path": str(tmp_path / "missing.txt")}
+        assert "FileNotFoundError" in str(daemon.request(message, socket_path)["error"])
+    finally:
+        daemon.request({"command": "stop"}, socket_path)
+        server.join()
+    assert not os.path.exists(socket_path)
+    os.rmdir(socket_dir)
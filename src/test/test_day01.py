@@ -1,6 +1,18 @@
 """Advent of Code 2023 - Unit tests for day 1 tasks"""
-from .. import util
-from ..day01 import part_one, part_two
+
+import pytest
+
+from .. import day01, util
+from ..day01 import (
+    DIGITS_BACKWARD,
+    DIGITS_FORWARD,
+    first_match,
+    part_one,
+    part_one_bytes,
+    part_two,
+    part_two_fast,
+    solve,
+)
 
 
 def test_part_one() -> None:
@@ -16,6 +28,26 @@ def test_part_one() -> None:
     example_data = ["1abc2", "pqr3stu8vwx", "a1b2c3d4e5f", "treb7uchet"]
     assert part_one(example_data) == 142
     assert part_one(util.get_lines("day01")) == 55029
+    assert part_one_bytes(example_data) == 142
+    assert part_one_bytes(util.get_lines("day01")) == 55029
+
+
+def test_part_one_bytes_buffer(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test function for part_one_bytes_buffer.
+
+    This function tests that lines spanning two chunks and a missing final newline are
+    counted, and that a memory-mapped input can be read directly.
+
+    Returns:
+        None
+    """
+    monkeypatch.setattr(day01, "CHUNK_SIZE", 3)
+    assert day01.part_one_bytes_buffer(b"1abc2\npqr3stu8vwx\na1b2c3d4e5f\ntreb7uchet") == 142
+    assert day01.part_one_bytes_buffer(b"x9\n") == 99
+    monkeypatch.undo()
+    with util.map_file(util.get_path("day01")) as view:
+        assert day01.part_one_bytes_buffer(view) == 55029
 
 
 def test_part_two() -> None:
@@ -39,3 +71,36 @@ def test_part_two() -> None:
     ]
     assert part_two(example_data) == 281
     assert part_two(util.get_lines("day01")) == 55686
+    assert part_two_fast(example_data) == 281
+    assert part_two_fast(util.get_lines("day01")) == 55686
+
+
+def test_first_match() -> None:
+    """
+    Test function for first_match.
+
+    This function tests that the digit automatons find overlapping spelled-out digits from
+    both ends of a line.
+
+    Returns:
+        None
+    """
+    assert first_match(DIGITS_FORWARD, "xeightwo") == 8
+    assert first_match(DIGITS_BACKWARD, reversed("xeightwo")) == 2
+    assert first_match(DIGITS_BACKWARD, reversed("twone")) == 1
+    assert first_match(DIGITS_BACKWARD, reversed("twone02")) == 2
+    assert first_match(DIGITS_FORWARD, "sevenine") == 7
+
+
+def test_solve() -> None:
+    """
+    Test function for solve.
+
+    This function tests that both parts are answered from a single pass, with lines without
+    any numeric digit adding nothing to part one.
+
+    Returns:
+        None
+    """
+    assert solve(util.iter_lines(util.get_path("day01"))) == (55029, 55686)
+    assert solve(["1abc2", "eightwothree", "zoneight234"]) == (12 + 24, 12 + 83 + 14)
@@ -1,6 +1,7 @@
 """Advent of Code 2023 - Unit tests for day 2 tasks"""
+
 from .. import util
-from ..day02 import part_one, part_two
+from ..day02 import build_bag_index, feasible_id_sum, feasible_id_sums, parse, part_one, part_two
 
 
 def test_part_one() -> None:
@@ -43,3 +44,57 @@ def test_part_two() -> None:
     ]
     assert part_two(example_data) == 2286
     assert part_two(util.get_lines("day02")) == 84538
+
+
+def test_parse() -> None:
+    """
+    Test function for the parse function.
+
+    This function tests that the games are parsed into columns of ids and colour maxima.
+
+    Returns:
+        None
+    """
+    ids, max_reds, max_greens, max_blues = parse(
+        [
+            "Game 1: 3 blue, 4 red; 1 red, 2 green, 6 blue; 2 green",
+            "Game 12: 8 green, 6 blue, 20 red; 5 blue, 4 red, 13 green; 5 green, 1 red",
+        ]
+    )
+    assert ids.typecode == "q"
+    assert list(ids) == [1, 12]
+    assert list(max_reds) == [4, 20]
+    assert list(max_greens) == [2, 13]
+    assert list(max_blues) == [6, 6]
+    assert all(not column for column in parse([]))
+
+
+def test_feasible_id_sums() -> None:
+    """
+    Test function for the bag-feasibility queries.
+
+    This function tests the indexed queries against a direct scan of the games for every bag
+    around the colour maxima of the actual input data.
+
+    Returns:
+        None
+    """
+    games = parse(util.get_lines("day02"))
+    bags = [(red, green, blue) for red in range(22) for green in range(22) for blue in range(22)]
+    expected = [
+        sum(
+            game_id
+            for game_id, max_red, max_green, max_blue in zip(*games)
+            if max_red <= red and max_green <= green and max_blue <= blue
+        )
+        for red, green, blue in bags
+    ]
+    assert feasible_id_sums(games, bags) == expected
+    assert feasible_id_sums(games, [(12, 13, 14)]) == [1867]
+    assert feasible_id_sums(parse([]), [(12, 13, 14)]) == [0]
+
+    index = build_bag_index(parse(["Game 3: 2 red, 5 blue", "Game 4: 1 green"]))
+    assert feasible_id_sum(index, (2, 0, 5)) == 3
+    assert feasible_id_sum(index, (0, 1, 0)) == 4
+    assert feasible_id_sum(index, (1, 1, 5)) == 4
+    assert not feasible_id_sum(index, (-1, 9, 9))
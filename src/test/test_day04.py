@@ -1,6 +1,6 @@
 """Advent of Code 2023 - Unit tests for day 4 tasks"""
 from .. import util
-from ..day04 import part_one, part_two
+from ..day04 import part_one, part_two, part_two_fast
 
 
 def test_part_one() -> None:
@@ -45,3 +45,5 @@ def test_part_two() -> None:
     ]
     assert part_two(example_data) == 30
     assert part_two(util.get_lines("day04")) == 6874754
+    assert part_two_fast(example_data) == 30
+    assert part_two_fast(util.get_lines("day04")) == 6874754
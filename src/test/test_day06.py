@@ -1,6 +1,7 @@
 """Advent of Code 2023 - Unit tests for day 6 tasks"""
-from .. import util
-from ..day06 import part_one, part_two
+
+from .. import day06, util
+from ..day06 import parse, parse_buffer, part_one, part_two
 
 
 def test_part_one() -> None:
@@ -31,3 +32,18 @@ def test_part_two() -> None:
     example_data = ["Time:      7  15   30", "Distance:  9  40  200"]
     assert part_two(example_data) == 71503
     assert part_two(util.get_lines("day06")) == 38017587
+
+
+def test_parse_buffer() -> None:
+    """
+    Test function for the parse_buffer function.
+
+    This function tests that parsing the bytes of an input gives the same result as parsing
+    its lines, using example data and the actual input data.
+
+    Returns:
+        None
+    """
+    example_data = b"Time:      7  15   30\nDistance:  9  40  200\n"
+    assert parse_buffer(example_data) == parse(example_data.decode("utf-8").splitlines())
+    assert util.parse_file(day06, util.get_path("day06")) == parse(util.get_lines("day06"))
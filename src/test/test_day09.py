@@ -1,6 +1,7 @@
 """Advent of Code 2023 - Unit tests for day 9 tasks"""
-from .. import util
-from ..day09 import part_one, part_two
+
+from .. import day09, util
+from ..day09 import parse, parse_buffer, part_one, part_two
 
 
 def test_part_one() -> None:
@@ -31,3 +32,18 @@ def test_part_two() -> None:
     example_data = ["0 3 6 9 12 15", "1 3 6 10 15 21", "10 13 16 21 30 45"]
     assert part_two(example_data) == 2
     assert part_two(util.get_lines("day09")) == 1100
+
+
+def test_parse_buffer() -> None:
+    """
+    Test function for the parse_buffer function.
+
+    This function tests that parsing the bytes of an input gives the same result as parsing
+    its lines, using example data and the actual input data.
+
+    Returns:
+        None
+    """
+    example_data = b"0 3 6 9 12 15\n1 3 6 10 15 21\n10 13 16 21 30 45\n"
+    assert parse_buffer(example_data) == parse(example_data.decode("utf-8").splitlines())
+    assert util.parse_file(day09, util.get_path("day09")) == parse(util.get_lines("day09"))
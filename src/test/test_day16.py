@@ -1,6 +1,13 @@
 """Advent of Code 2023 - Unit tests for day 16 tasks"""
 from .. import util
-from ..day16 import part_one, part_two
+from ..day16 import (
+    parse,
+    part_one,
+    part_one_fast,
+    part_two,
+    part_two_fast,
+    part_two_parsed,
+)
 
 example_data: list[
     str
@@ -30,6 +37,8 @@ def test_part_one() -> None:
     """
     assert part_one(example_data) == 46
     assert part_one(util.get_lines("day16")) == 6605
+    assert part_one_fast(example_data) == 46
+    assert part_one_fast(util.get_lines("day16")) == 6605
 
 
 def test_part_two() -> None:
@@ -43,4 +52,7 @@ def test_part_two() -> None:
         None
     """
     assert part_two(example_data) == 51
+    assert part_two_parsed(parse(example_data), workers=2) == 51
     # assert part_two(util.get_lines("day16")) == 6766 # takes a couple of minutes :-/
+    assert part_two_fast(example_data) == 51
+    assert part_two_fast(util.get_lines("day16")) == 6766
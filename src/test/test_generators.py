@@ -0,0 +1,55 @@
+"""Advent of Code 2023 - Unit tests for the synthetic input generators"""
+import importlib
+
+from .. import day04, day10, day18, generators, registry, runner
+from .benchmark import SKIPPED_PARTS
+
+
+def test_generate() -> None:
+    """
+    Test function for generate.
+
+    This function tests that every day has a deterministic generator whose output the day's
+    solvers accept.
+
+    Returns:
+        None
+    """
+    for day in registry.discover_days():
+        size = generators.sizes(day)["small"]
+        lines = generators.generate(day, 1, size)
+        assert lines == generators.generate(day, 1, size)
+        assert lines != generators.generate(day, 2, size)
+        module = importlib.import_module(".." + day, __package__)
+        for _, part in runner.collect_tasks([day], registry.PARTS):
+            if (day, part) not in SKIPPED_PARTS:
+                assert isinstance(getattr(module, part)(list(lines)), int)
+
+
+def test_generated_answers() -> None:
+    """
+    Test function for generated inputs with known answers.
+
+    This function tests the day 10 loop against its rectangle shape, the chained day 4 cards
+    against the triangle numbers and the day 18 lagoon against the shoelace formula.
+
+    Returns:
+        None
+    """
+    assert day10.part_one(generators.generate("day10", 0, 20)) == 34
+    assert day10.part_two(generators.generate("day10", 0, 20)) == 16 * 16
+
+    lines = generators.generate("day04", 0, 50, "chain")
+    assert day04.part_two(lines) == day04.part_two_fast(lines) == 50 * 51 // 2
+
+    lines = generators.generate("day18", 0, 30)
+    steps = {"R": (0, 1), "L": (0, -1), "U": (-1, 0), "D": (1, 0)}
+    row, col, area, perimeter = 0, 0, 0, 0
+    for line in lines:
+        direction, meters, _ = line.split()
+        next_row = row + steps[direction][0] * int(meters)
+        next_col = col + steps[direction][1] * int(meters)
+        area += col * next_row - next_col * row
+        perimeter += int(meters)
+        row, col = next_row, next_col
+    assert day18.part_one(lines) == abs(area) // 2 + perimeter // 2 + 1
@@ -0,0 +1,77 @@
+"""Advent of Code 2023 - Unit tests for the profiling hooks"""
+
+import re
+import time
+from pathlib import Path
+
+import pytest
+
+from .. import day10, profiling, util
+
+
+def test_profile_call(tmp_path: Path) -> None:
+    """
+    Test function for profile_call.
+
+    This function tests that profiling returns the result of the part and writes a report
+    with the peak memory and the hot functions of the part.
+
+    Returns:
+        None
+    """
+    lines = util.get_lines("day10")
+    assert (
+        profiling.profile_call(lambda: day10.part_one(lines), "day10 part_one", str(tmp_path))
+        == 6613
+    )
+
+    report_path = Path(profiling.report_path("day10 part_one", str(tmp_path)))
+    report = report_path.read_text(encoding="utf-8")
+    assert report.startswith("day10 part_one\npeak memory: ")
+    assert "(next_direction)" in report
+
+
+def test_trace_memory() -> None:
+    """
+    Test function for trace_memory.
+
+    This function tests that the peak memory and its allocation sites are reported, both for
+    memory kept by a function and for memory it frees before returning.
+
+    Returns:
+        None
+    """
+    result, usage = profiling.trace_memory(lambda: [bytearray(2**20) for _ in range(4)])
+    assert len(result) == 4
+    assert usage["peak_traced"] >= 4 * 2**20
+    assert usage["peak_rss"] >= usage["peak_traced"]
+    assert "test_profiling.py" in usage["top_allocations"][0]
+
+    def transient() -> int:
+        buffers = [bytearray(2**20) for _ in range(8)]
+        time.sleep(0.1)
+        return len(buffers)
+
+    count, usage = profiling.trace_memory(transient)
+    assert count == 8
+    assert usage["peak_traced"] >= 8 * 2**20
+    assert "test_profiling.py" in usage["top_allocations"][0]
+    size = re.search(r" size=(\d+) KiB", usage["top_allocations"][0])
+    assert size is not None and int(size.group(1)) >= 8 * 1024
+
+
+def test_enabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test function for enabled.
+
+    This function tests that profiling is switched on through the AOC_PROFILE variable.
+
+    Returns:
+        None
+    """
+    monkeypatch.delenv("AOC_PROFILE", raising=False)
+    assert not profiling.enabled()
+    monkeypatch.setenv("AOC_PROFILE", "0")
+    assert not profiling.enabled()
+    monkeypatch.setenv("AOC_PROFILE", "1")
+    assert profiling.enabled()
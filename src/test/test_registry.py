@@ -0,0 +1,80 @@
+"""Advent of Code 2023 - Unit tests for the lazy day registry"""
+
+import sys
+
+import pytest
+
+from .. import registry
+
+
+def test_discover_days() -> None:
+    """
+    Test function for discover_days.
+
+    This function tests that every day module is found and that other modules are not.
+
+    Returns:
+        None
+    """
+    days = registry.discover_days()
+    assert days[0] == "day01"
+    assert "day19" in days
+    assert "util" not in days
+    assert registry.resolve_day("5") == registry.resolve_day("day05") == "day05"
+
+
+def test_parts() -> None:
+    """
+    Test function for parts and load.
+
+    This function tests that the parts of a day are listed from its source and that the day is
+    imported on first use only.
+
+    Returns:
+        None
+    """
+    sys.modules.pop("src.day19", None)
+    assert registry.parts("day19") == ("part_one",)
+    assert registry.parts("day01") == registry.PARTS
+    assert "src.day19" not in sys.modules
+    assert registry.get_part("day19", "part_one").__name__ == "part_one"
+    assert "src.day19" in sys.modules
+
+
+def test_engines(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test function for declared_engines, engines, select_engine and get_part with an engine.
+
+    This function tests that the declared engines are read without importing the day, that
+    only the engines a part implements are listed and that the engine is picked by the input
+    size.
+
+    Returns:
+        None
+    """
+    assert registry.declared_engines("day04") == {"reference", "fast"}
+    assert registry.declared_engines("day03") == {"reference"}
+    monkeypatch.delitem(sys.modules, "src.day01", raising=False)
+    assert registry.declared_engines("day01") == {"reference", "fast", "bytes"}
+    assert "src.day01" not in sys.modules
+    assert registry.engines("day04", "part_one") == {"reference": 0}
+    assert registry.engines("day04", "part_two") == {"reference": 0, "fast": 1024}
+    assert registry.engines("day03", "part_one") == {"reference": 0}
+    assert registry.select_engine("day04", "part_two", 100) == "reference"
+    assert registry.select_engine("day04", "part_two", 1024) == "fast"
+    assert registry.select_engine("day04", "part_one", 10**6) == "reference"
+    assert registry.get_part("day04", "part_two", "fast").__name__ == "part_two_fast"
+    with pytest.raises(ValueError):
+        registry.get_part("day04", "part_one", "fast")
+
+
+def test_import_time() -> None:
+    """
+    Test function for import_time.
+
+    This function tests that the import time of a day is measured in a fresh interpreter.
+
+    Returns:
+        None
+    """
+    assert 0 < registry.import_time("day01") < 5
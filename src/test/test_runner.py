@@ -0,0 +1,186 @@
+"""Advent of Code 2023 - Unit tests for the day runner"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from .. import registry, runner, schedule
+from ..runner import run_part
+
+
+def test_collect_tasks() -> None:
+    """
+    Test function for collect_tasks.
+
+    This function tests that parts missing from a day module are skipped, without importing
+    the days.
+
+    Returns:
+        None
+    """
+    sys.modules.pop("src.day19", None)
+    assert runner.collect_tasks(["day01", "day19"], registry.PARTS) == [
+        ("day01", "part_one"),
+        ("day01", "part_two"),
+        ("day19", "part_one"),
+    ]
+    assert "src.day19" not in sys.modules
+
+
+def test_main(capsys: pytest.CaptureFixture[str], tmp_path: Path) -> None:
+    """
+    Test function for main.
+
+    This function tests that the runner reports the result and timings of each selected part,
+    and keeps the wall times of default runs in its history.
+
+    Returns:
+        None
+    """
+    history = str(tmp_path / "timings.json")
+    args = ["1", "day02", "--part", "1", "--workers", "2", "--history", history]
+    assert not runner.main(args)
+    assert set(schedule.load_history(history)) == {"day01.part_one", "day02.part_one"}
+    output = capsys.readouterr().out
+    assert "balance" in output
+    assert "day01 part_one" in output
+    assert "55029" in output
+    assert "day02 part_one" in output
+    assert "1867" in output
+    assert "day01 part_two" not in output
+    assert not runner.main(["3", "--engine", "reference", "--history", history])
+    assert not runner.main(["4", "--parallel", "2", "--history", history])
+    assert set(schedule.load_history(history)) == {"day01.part_one", "day02.part_one"}
+    with pytest.raises(SystemExit):
+        runner.main(["1", "--engine", "fats", "--history", history])
+    with pytest.raises(SystemExit):
+        runner.main(["3", "--cross-check", "fast", "--history", history])
+
+
+def test_run_part_timeout() -> None:
+    """
+    Test function for run_part with a time budget.
+
+    This function tests that a part that spends its budget is stopped and reported with its
+    last progress instead of a result.
+
+    Returns:
+        None
+    """
+    result = runner.run_part("day14", "part_two", timeout=0.5)
+    assert result["result"] is None
+    assert result["error"] is not None
+    assert "time budget of 0.5s exceeded" in result["error"]
+    assert "day14 part_two cycles" in result["error"]
+    assert result["wall_time"] < 5
+
+
+def test_run_part_memory() -> None:
+    """
+    Test function for run_part with memory measurement.
+
+    This function tests that the memory usage of a part is recorded and reported.
+
+    Returns:
+        None
+    """
+    result = runner.run_part("day18", "part_one", memory=True)
+    assert result["result"] == 61661
+    assert result["memory"] is not None
+    assert result["memory"]["peak_traced"] > 0
+    assert any("day18.py" in line for line in result["memory"]["top_allocations"])
+    assert "peak rss" in runner.format_result(result)
+
+
+def test_run_part_stats() -> None:
+    """
+    Test function for run_part with call counters.
+
+    This function tests that the calls of the hot functions of a part are counted and reported.
+
+    Returns:
+        None
+    """
+    result = runner.run_part("day10", "part_one", count_calls=True)
+    assert result["result"] == 6613
+    assert result["stats"] is not None
+    assert {item["name"] for item in result["stats"]} == {"day10.move", "day10.next_direction"}
+    assert "day10.move" in runner.format_result(result)
+
+
+def test_run_part_parallel() -> None:
+    """
+    Test function for run_part in parallel mode.
+
+    This function tests that a day with independent lines is split over processes and gives
+    the same result, while other days still run on the whole input.
+
+    Returns:
+        None
+    """
+    assert runner.run_part("day09", "part_one", parallel=2)["result"] == 1898776583
+    assert runner.run_part("day04", "part_one", parallel=2)["result"] == 21088
+    assert runner.run_part("day06", "part_one", parallel=2)["result"] == 4403592
+    result = runner.run_part("day01", "part_two", parallel=2)
+    assert result["engine"] == "reference"
+    assert result["result"] == 55686
+
+
+def test_run_part_engine() -> None:
+    """
+    Test function for run_part with solver engines.
+
+    This function tests that the engine is selected from the input size, that parts without
+    the requested engine fall back to the reference one and that the answer can be cross-checked.
+
+    Returns:
+        None
+    """
+    result = runner.run_part("day16", "part_one", cross_check="reference")
+    assert result["engine"] == "fast"
+    assert result["result"] == 6605
+    assert result["error"] is None
+    assert "[fast]" in runner.format_result(result)
+    result = runner.run_part("day04", "part_one", engine="fast", cross_check="fast")
+    assert result["engine"] == "reference"
+    assert result["result"] == 21088
+
+
+def crash_on_day03(day: str, part: str, *args: object) -> runner.PartResult:
+    """
+    Run a part like run_part, but crash the worker process on day 3.
+
+    Args:
+        day (str): The module name of the day.
+        part (str): The name of the part function.
+        *args (object): The other arguments of run_part.
+
+    Returns:
+        runner.PartResult: The result of the part.
+    """
+    if day == "day03":
+        os._exit(1)
+    return run_part(day, part, *args)  # type: ignore[arg-type]
+
+
+def test_run_tasks_crash(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test function for run_tasks with a crashing worker.
+
+    This function tests that only the part whose worker crashed is reported as crashed and
+    that the parts interrupted by the crash are run again.
+
+    Returns:
+        None
+    """
+    monkeypatch.setattr(runner, "run_part", crash_on_day03)
+    tasks = [("day01", "part_one"), ("day03", "part_one"), ("day02", "part_one")]
+    tasks += [("day06", "part_one"), ("day09", "part_one")]
+    results = {result["day"]: result for result in runner.run_tasks(tasks, 2)}
+    assert results["day03"]["error"] == "worker process crashed"
+    assert results["day01"]["result"] == 55029
+    assert results["day02"]["result"] == 1867
+    assert results["day06"]["result"] == 4403592
+    assert results["day09"]["result"] == 1898776583
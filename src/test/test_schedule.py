@@ -0,0 +1,59 @@
+"""Advent of Code 2023 - Unit tests for the longest processing time first scheduling"""
+from pathlib import Path
+
+from .. import schedule
+
+
+def test_history(tmp_path: Path) -> None:
+    """
+    Test function for load_history and save_history.
+
+    This function tests that the wall times are stored and loaded back, and that a missing or
+    broken history is treated as empty.
+
+    Returns:
+        None
+    """
+    path = str(tmp_path / "timings.json")
+    assert not schedule.load_history(path)
+    schedule.save_history({"day12.part_two": 5.0}, path)
+    assert schedule.load_history(path) == {"day12.part_two": 5.0}
+    (tmp_path / "timings.json").write_text("{")
+    assert not schedule.load_history(path)
+
+
+def test_order_tasks() -> None:
+    """
+    Test function for order_tasks.
+
+    This function tests that unknown tasks come first, followed by the known ones longest
+    first.
+
+    Returns:
+        None
+    """
+    tasks = [("day01", "part_one"), ("day12", "part_two"), ("day16", "part_two")]
+    history = {"day01.part_one": 0.01, "day12.part_two": 5.0}
+    assert schedule.order_tasks(tasks, history) == [
+        ("day16", "part_two"),
+        ("day12", "part_two"),
+        ("day01", "part_one"),
+    ]
+
+
+def test_format_balance() -> None:
+    """
+    Test function for ideal_wall_time and format_balance.
+
+    This function tests that the ideal wall time is bounded by both the evenly spread work and
+    the longest task.
+
+    Returns:
+        None
+    """
+    assert schedule.ideal_wall_time([1.0, 1.0, 1.0, 1.0], 2) == 2.0
+    assert schedule.ideal_wall_time([3.0, 1.0], 2) == 3.0
+    assert not schedule.ideal_wall_time([], 2)
+    assert schedule.format_balance([1.0, 1.0, 1.0, 1.0], 2, 2.5) == (
+        "balance 80% (ideal 2.000s on 2 workers)"
+    )
@@ -0,0 +1,58 @@
+"""Advent of Code 2023 - Unit tests for the hot function statistics"""
+from .. import day10, day12, stats, util
+
+
+def test_collect() -> None:
+    """
+    Test function for collect.
+
+    This function tests that the calls of the hot functions and the cache hits of the cached
+    functions of a day are counted while they are enabled.
+
+    Returns:
+        None
+    """
+    stats.enable(day10)
+    try:
+        assert day10.part_one_parsed(day10.parse(util.read_lines(util.get_path("day10")))) == 6613
+        counted = {item["name"]: item for item in stats.collect(day10)}
+    finally:
+        stats.disable(day10)
+    assert counted["day10.move"]["calls"] == 13225
+    assert counted["day10.next_direction"]["calls"] == 13226
+    assert counted["day10.move"]["cache"] is None
+
+    day12.count_possibilities.cache_clear()
+    stats.enable(day12)
+    try:
+        assert day12.part_one(["???.### 1,1,3", "???.### 1,1,3"]) == 2
+        counted = {item["name"]: item for item in stats.collect(day12)}
+    finally:
+        stats.disable(day12)
+    cache = counted["day12.count_possibilities"]["cache"]
+    assert cache is not None
+    assert cache["hits"] > 0
+    assert cache["hits"] + cache["misses"] == counted["day12.count_possibilities"]["calls"]
+    assert "hits" in stats.format_stats(counted["day12.count_possibilities"])
+
+
+def test_disable() -> None:
+    """
+    Test function for disable.
+
+    This function tests that disabling the statistics restores the original functions.
+
+    Returns:
+        None
+    """
+    move = day10.move
+    count_possibilities = day12.count_possibilities
+    stats.enable(day10)
+    stats.enable(day12)
+    assert day10.move is not move
+    assert day12.count_possibilities is not count_possibilities
+    stats.disable(day10)
+    stats.disable(day12)
+    assert day10.move is move
+    assert day12.count_possibilities is count_possibilities
+    assert not stats.collect(day10)
@@ -0,0 +1,194 @@
+"""Advent of Code 2023 - Unit tests for utility functions"""
+
+import time
+from pathlib import Path
+
+import pytest
+
+from .. import day01, day06, util
+
+
+def test_iter_lines(tmp_path: Path) -> None:
+    """
+    Test function for iter_lines.
+
+    This function tests that the lazy loader yields the same lines as get_lines and that
+    empty files produce no lines.
+
+    Returns:
+        None
+    """
+    assert list(util.iter_lines(util.get_path("day01"))) == util.get_lines("day01")
+
+    empty_file = tmp_path / "empty.txt"
+    empty_file.write_bytes(b"")
+    assert not list(util.iter_lines(str(empty_file)))
+
+
+def test_map_file(tmp_path: Path) -> None:
+    """
+    Test function for map_file.
+
+    This function tests that the memory-mapped view exposes the raw bytes of the file.
+
+    Returns:
+        None
+    """
+    input_file = tmp_path / "input.txt"
+    input_file.write_bytes(b"1abc2\ntreb7uchet\n")
+    with util.map_file(str(input_file)) as view:
+        assert view.tobytes() == b"1abc2\ntreb7uchet\n"
+
+    input_file.write_bytes(b"")
+    with util.map_file(str(input_file)) as view:
+        assert not view
+
+
+def test_call_on_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test function for call_on_file.
+
+    This function tests that a part with a buffer function is handed the memory-mapped file
+    and that other parts are handed its lines.
+
+    Returns:
+        None
+    """
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("1abc2\npqr3stu8vwx\n", encoding="utf-8")
+    assert util.call_on_file(day01.part_one_bytes, str(input_file)) == 50
+    assert util.call_on_file(day01.part_one, str(input_file)) == 50
+    monkeypatch.setattr(day01, "part_one_bytes_buffer", lambda view: view.nbytes)
+    assert util.call_on_file(day01.part_one_bytes, str(input_file)) == 18
+
+
+def test_streamed_solvers() -> None:
+    """
+    Test function for solvers consuming lazy line iterators.
+
+    This function tests that the line-independent solvers give the same answers for a lazy
+    iterator as for a list of lines.
+
+    Returns:
+        None
+    """
+    day01_path = util.get_path("day01")
+    assert day01.part_one(util.iter_lines(day01_path)) == 55029
+    assert day01.part_two(util.iter_lines(day01_path)) == 55686
+    assert day06.part_one(util.iter_lines(util.get_path("day06"))) == day06.part_one(
+        util.get_lines("day06")
+    )
+
+
+def test_grid() -> None:
+    """
+    Test function for Grid.
+
+    This function tests indexing, mutation, row and column views, transposing and neighbour
+    iteration of the flat grid.
+
+    Returns:
+        None
+    """
+    grid = util.Grid.from_lines(["abc", "def", ""])
+    assert (grid.width, grid.height) == (3, 2)
+    assert grid[1, 2] == "f"
+    assert grid.row(1) == b"def"
+    assert grid.column(1) == b"be"
+    assert grid.transpose().to_lines() == ["ad", "be", "cf"]
+    assert grid.find("e") == (1, 1)
+    assert grid.find("x") == (-1, -1)
+    assert not grid.in_bounds(2, 0)
+    assert list(grid.neighbours(0, 0)) == [(0, 1), (1, 0), (1, 1)]
+    assert list(grid.neighbours(1, 1, diagonal=False)) == [(0, 1), (1, 0), (1, 2)]
+
+    copy = grid.copy()
+    copy[0, 0] = "x"
+    assert copy.to_lines() == ["xbc", "def"]
+    assert grid.to_lines() == ["abc", "def"]
+
+
+def test_share_grid() -> None:
+    """
+    Test function for share_grid and attach_grid.
+
+    This function tests that an attached grid reads the shared cells without being able to
+    change them, and that the shared memory is released afterwards.
+
+    Returns:
+        None
+    """
+    grid = util.Grid.from_lines(["#..", ".#.", "..#"])
+    with util.share_grid(grid) as handle:
+        with util.attach_grid(handle) as shared:
+            assert shared.to_lines() == grid.to_lines()
+            assert list(shared.find_all("#")) == [(0, 0), (1, 1), (2, 2)]
+            with pytest.raises(TypeError):
+                shared[0, 1] = "#"
+    with pytest.raises(FileNotFoundError):
+        with util.attach_grid(handle):
+            pass
+
+
+def test_process_pool() -> None:
+    """
+    Test function for process_pool.
+
+    This function tests that a block that raises does not wait for the work queued on the
+    pool, and that its workers are terminated.
+
+    Returns:
+        None
+    """
+    start = time.perf_counter()
+    with pytest.raises(KeyboardInterrupt):
+        with util.process_pool(2) as executor:
+            executor.submit(time.sleep, 60)
+            processes = list(executor._processes.values())  # pylint: disable=protected-access
+            raise KeyboardInterrupt
+    assert time.perf_counter() - start < 30
+    assert not any(process.is_alive() for process in processes)
+    with util.process_pool(2) as executor:
+        assert executor.submit(str.upper, "pool").result() == "POOL"
+
+
+def test_map_reduce(tmp_path: Path) -> None:
+    """
+    Test function for chunk_bounds and map_reduce.
+
+    This function tests that the chunks split a file at line boundaries and that summing a
+    per-line function over them in parallel matches summing it over the lines one by one.
+
+    Returns:
+        None
+    """
+    input_file = tmp_path / "input.txt"
+    input_file.write_bytes(b"1abc2\npqr3stu8vwx\na1b2c3d4e5f\ntreb7uchet\n")
+    bounds = util.chunk_bounds(str(input_file), 3)
+    assert [bounds[0][0], bounds[-1][1]] == [0, input_file.stat().st_size]
+    assert all(input_file.read_bytes()[end - 1 : end] == b"\n" for _, end in bounds)
+    assert util.map_reduce(str(input_file), day01.part_one_line, workers=2) == 142
+
+    path = util.get_path("day01")
+    assert util.map_reduce(path, day01.part_two_line, workers=3) == 55686
+    assert util.map_reduce(path, day01.part_two_line, workers=1) == 55686
+
+    input_file.write_bytes(b"")
+    assert not util.map_reduce(str(input_file), day01.part_one_line, workers=2)
+
+
+def test_ints() -> None:
+    """
+    Test function for ints and ints_array.
+
+    This function tests that signed integers are extracted from lines and from whole buffers.
+
+    Returns:
+        None
+    """
+    assert util.ints("Card   3: 1 21 | -4 x=57") == [3, 1, 21, -4, 57]
+    assert not util.ints("seed-to-soil map:")
+    with util.map_file(util.get_path("day09")) as view:
+        numbers = util.ints_array(view)
+    assert numbers.typecode == "q"
+    assert list(numbers) == [num for line in util.get_lines("day09") for num in util.ints(line)]
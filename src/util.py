@@ -1,6 +1,40 @@
-""" Utility functions for the project """
+"""Utility functions for the project"""
 
+import contextlib
+import itertools
+import mmap
 import os
+import re
+import sys
+from array import array
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator
+
+if TYPE_CHECKING:
+    import concurrent.futures
+
+# Integers with an optional minus sign, for text and for raw bytes.
+INT_PATTERN = re.compile(r"-?\d+")
+INT_BYTES_PATTERN = re.compile(rb"-?\d+")
+
+# The cells of a grid: its own bytearray, or a view of cells shared with other processes.
+Cells = bytearray | memoryview
+
+# A shared grid as handed to worker processes: the shared memory name, the width and the height.
+SharedGrid = tuple[str, int, int]
+
+
+def get_path(file_name: str) -> str:
+    """
+    Resolve the path of an input file in the inputs directory.
+
+    Args:
+        file_name (str): The name of the input file without the extension.
+
+    Returns:
+        str: The absolute path of the input file.
+    """
+    return os.path.dirname(os.path.abspath(__file__)) + "/inputs/" + file_name + ".txt"
 
 
 def get_lines(file_name: str) -> list[str]:
@@ -10,6 +44,456 @@ def get_lines(file_name: str) -> list[str]:
     Returns:
         list: A list of strings representing the lines from the input file.
     """
-    file_path = os.path.dirname(os.path.abspath(__file__)) + "/inputs/" + file_name + ".txt"
+    return read_lines(get_path(file_name))
+
+
+def read_lines(file_path: str) -> list[str]:
+    """
+    Read the stripped lines of a file at any path.
+
+    Args:
+        file_path (str): The path of the file to read.
+
+    Returns:
+        list[str]: The lines of the file with surrounding whitespace removed.
+    """
     with open(file_path, "r", encoding="utf-8") as file:
         return list(map(str.strip, file.readlines()))
+
+
+def ints(text: str) -> list[int]:
+    """
+    Extract the integers of a line, in order, with a leading minus sign making them negative.
+
+    Args:
+        text (str): The text to scan, e.g. "Card 3: 1 -21".
+
+    Returns:
+        list[int]: The integers, e.g. [3, 1, -21].
+    """
+    return list(map(int, INT_PATTERN.findall(text)))
+
+
+def ints_array(data: bytes | bytearray | memoryview | mmap.mmap) -> "array[int]":
+    """
+    Extract all integers of a whole buffer, such as a memory-mapped input, straight from its
+    bytes into a compact array of signed 64-bit integers.
+
+    Args:
+        data (bytes | bytearray | memoryview | mmap.mmap): The buffer to scan.
+
+    Returns:
+        array[int]: The integers, in order.
+    """
+    return array("q", map(int, INT_BYTES_PATTERN.findall(data)))
+
+
+@contextlib.contextmanager
+def map_file(file_path: str) -> Iterator[memoryview]:
+    """
+    Memory-map a file and yield a read-only, zero-copy view of its contents.
+
+    The view is only valid inside the with block. Empty files yield an empty view, as they
+    cannot be memory-mapped.
+
+    Args:
+        file_path (str): The path of the file to map.
+
+    Yields:
+        memoryview: A view of the file contents.
+    """
+    with open(file_path, "rb") as file:
+        if not os.fstat(file.fileno()).st_size:
+            yield memoryview(b"")
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                yield view
+            finally:
+                view.release()
+
+
+def parse_file(module: ModuleType, file_path: str) -> Any:
+    """
+    Parse an input file with the parse step of a day: with its parse_buffer step straight from
+    the memory-mapped bytes if it has one, otherwise from the lines.
+
+    Args:
+        module (ModuleType): The day module, which must define parse.
+        file_path (str): The path of the input file.
+
+    Returns:
+        Any: The parsed input.
+    """
+    if not hasattr(module, "parse_buffer"):
+        return module.parse(read_lines(file_path))
+    with map_file(file_path) as view:
+        return module.parse_buffer(view)
+
+
+def call_on_file(func: Callable[..., int], file_path: str, args: tuple[Any, ...] = ()) -> int:
+    """
+    Run a part on an input file. A part with a <name>_buffer function is handed the
+    memory-mapped file, a part of a day with a parse_buffer step is answered from the parsed
+    bytes and any other part is handed the lines of the file.
+
+    Args:
+        func (Callable[..., int]): The part function.
+        file_path (str): The path of the input file.
+        args (tuple[Any, ...]): The extra arguments passed to the part after the input.
+
+    Returns:
+        int: The result of the part.
+    """
+    module = sys.modules[func.__module__]
+    buffer_func = getattr(module, func.__name__ + "_buffer", None)
+    parsed_func = getattr(module, func.__name__ + "_parsed", None)
+    if buffer_func is not None:
+        with map_file(file_path) as view:
+            result: int = buffer_func(view, *args)
+    elif parsed_func is not None and hasattr(module, "parse_buffer"):
+        result = parsed_func(parse_file(module, file_path), *args)
+    else:
+        result = func(read_lines(file_path), *args)
+    return result
+
+
+def iter_lines(file_path: str) -> Iterator[str]:
+    """
+    Lazily iterate over the stripped lines of a file through a memory map.
+
+    Only one line at a time is held in memory, so solvers that consume the lines in a single
+    pass keep a flat memory profile regardless of the input size.
+
+    Args:
+        file_path (str): The path of the file to read.
+
+    Yields:
+        str: The lines of the file with surrounding whitespace removed.
+    """
+    with open(file_path, "rb") as file:
+        if not os.fstat(file.fileno()).st_size:
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for line in iter(mapped.readline, b""):
+                yield line.decode("utf-8").strip()
+
+
+def chunk_bounds(file_path: str, count: int) -> list[tuple[int, int]]:
+    """
+    Split a file into chunks of about equal size that start and end at line boundaries.
+
+    Args:
+        file_path (str): The path of the file to split.
+        count (int): The number of chunks to aim for; fewer are returned for short files.
+
+    Returns:
+        list[tuple[int, int]]: The start and end offset of each chunk.
+    """
+    with open(file_path, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        if not size:
+            return []
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            bounds = [0]
+            for i in range(1, count):
+                newline = mapped.find(b"\n", max(size * i // count, bounds[-1]))
+                if newline == -1 or newline + 1 == size:
+                    break
+                bounds.append(newline + 1)
+    bounds.append(size)
+    return list(itertools.pairwise(bounds))
+
+
+def sum_lines(file_path: str, start: int, end: int, func: Callable[[str], int]) -> int:
+    """
+    Sum a function over the stripped lines of a chunk of a file, read through a memory map.
+
+    Args:
+        file_path (str): The path of the file.
+        start (int): The offset of the first line of the chunk.
+        end (int): The offset just past the last line of the chunk.
+        func (Callable[[str], int]): The value of a single line.
+
+    Returns:
+        int: The sum of the values of the lines of the chunk.
+    """
+    total = 0
+    with open(file_path, "rb") as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            mapped.seek(start)
+            while mapped.tell() < end:
+                total += func(mapped.readline().decode("utf-8").strip())
+    return total
+
+
+@contextlib.contextmanager
+def process_pool(workers: int) -> Iterator["concurrent.futures.ProcessPoolExecutor"]:
+    """
+    Run a process pool for a block. If the block raises, e.g. when a time budget runs out, the
+    pending work is cancelled and the workers are terminated instead of waited for.
+
+    Args:
+        workers (int): The number of worker processes.
+
+    Yields:
+        concurrent.futures.ProcessPoolExecutor: The pool.
+    """
+    # Imported here, as concurrent.futures would add to the import time of every day.
+    import concurrent.futures  # pylint: disable=import-outside-toplevel,redefined-outer-name
+
+    executor = concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+    try:
+        yield executor
+    except BaseException:
+        # The executor forgets its processes on shutdown, and cannot terminate them before 3.14.
+        processes = list(executor._processes.values())  # pylint: disable=protected-access
+        executor.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            process.terminate()
+            process.join()
+        raise
+    executor.shutdown()
+
+
+def map_reduce(
+    file_path: str,
+    func: Callable[[str], int],
+    workers: int | None = None,
+    chunks_per_worker: int = 4,
+) -> int:
+    """
+    Sum a function over the lines of a file, with the file split into chunks at line
+    boundaries that worker processes map and read themselves, so no lines are pickled.
+
+    The function must be defined at module level, so that the workers can unpickle it. If
+    waiting for the chunks raises, e.g. when a time budget runs out, the remaining chunks are
+    cancelled.
+
+    Args:
+        file_path (str): The path of the file.
+        func (Callable[[str], int]): The value of a single line, independent of the other lines.
+        workers (int | None): The number of worker processes, or None for one per core.
+        chunks_per_worker (int): The number of chunks per worker, to even out slow chunks.
+
+    Returns:
+        int: The sum of the values of all lines.
+    """
+    workers = workers or os.cpu_count() or 1
+    bounds = chunk_bounds(file_path, workers * chunks_per_worker if workers > 1 else 1)
+    if len(bounds) <= 1:
+        return sum(sum_lines(file_path, start, end, func) for start, end in bounds)
+    with process_pool(workers) as executor:
+        futures = [executor.submit(sum_lines, file_path, start, end, func) for start, end in bounds]
+        return sum(future.result() for future in futures)
+
+
+class Grid:
+    """
+    A rectangular grid of single-byte cells, stored row by row in one flat bytearray.
+
+    Cells are addressed with (row, col) tuples and read as one-character strings. Rows are
+    exposed as zero-copy memoryviews, and cells can be changed in place without rebuilding any
+    strings. A grid attached to shared memory is backed by a read-only memoryview instead.
+    """
+
+    def __init__(self, cells: Cells, width: int) -> None:
+        """
+        Create a grid from its flat cells.
+
+        Args:
+            cells (Cells): The cells, row by row.
+            width (int): The number of cells per row.
+        """
+        self.cells = cells
+        self.width = width
+        self.height = len(cells) // width if width else 0
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str]) -> "Grid":
+        """
+        Create a grid from lines of equal length. Empty lines, such as the one a trailing
+        newline leaves, are skipped.
+
+        Args:
+            lines (Iterable[str]): The rows of the grid.
+
+        Returns:
+            Grid: The grid.
+        """
+        cells = bytearray()
+        width = 0
+        for line in lines:
+            if line:
+                width = len(line)
+                cells += line.encode("ascii")
+        return cls(cells, width)
+
+    def to_lines(self) -> list[str]:
+        """
+        Convert the grid back to lines.
+
+        Returns:
+            list[str]: The rows of the grid.
+        """
+        return [self.row(i).tobytes().decode("ascii") for i in range(self.height)]
+
+    def copy(self) -> "Grid":
+        """
+        Copy the grid.
+
+        Returns:
+            Grid: A grid with its own copy of the cells.
+        """
+        return Grid(bytearray(self.cells), self.width)
+
+    def in_bounds(self, row: int, col: int) -> bool:
+        """
+        Check whether a position lies inside the grid.
+
+        Args:
+            row (int): The row of the position.
+            col (int): The column of the position.
+
+        Returns:
+            bool: True if the position is inside the grid.
+        """
+        return 0 <= row < self.height and 0 <= col < self.width
+
+    def __getitem__(self, pos: tuple[int, int]) -> str:
+        return chr(self.cells[pos[0] * self.width + pos[1]])
+
+    def __setitem__(self, pos: tuple[int, int], char: str) -> None:
+        self.cells[pos[0] * self.width + pos[1]] = ord(char)
+
+    def row(self, row: int) -> memoryview:
+        """
+        Get a zero-copy view of a row.
+
+        Args:
+            row (int): The index of the row.
+
+        Returns:
+            memoryview: The cells of the row.
+        """
+        start = row * self.width
+        return memoryview(self.cells)[start : start + self.width]
+
+    def column(self, col: int) -> bytes:
+        """
+        Get the cells of a column.
+
+        Args:
+            col (int): The index of the column.
+
+        Returns:
+            bytes: The cells of the column, top to bottom.
+        """
+        return bytes(self.cells[col :: self.width])
+
+    def transpose(self) -> "Grid":
+        """
+        Mirror the grid along its main diagonal, turning rows into columns.
+
+        Returns:
+            Grid: The transposed grid.
+        """
+        cells = bytearray()
+        for col in range(self.width):
+            cells += self.cells[col :: self.width]
+        return Grid(cells, self.height)
+
+    def neighbours(self, row: int, col: int, diagonal: bool = True) -> Iterator[tuple[int, int]]:
+        """
+        Iterate over the positions next to a cell that lie inside the grid.
+
+        Args:
+            row (int): The row of the cell.
+            col (int): The column of the cell.
+            diagonal (bool): Whether to include diagonal neighbours.
+
+        Yields:
+            tuple[int, int]: The positions of the neighbours.
+        """
+        for d_row in (-1, 0, 1):
+            for d_col in (-1, 0, 1):
+                if (d_row or d_col) and (diagonal or not d_row or not d_col):
+                    if self.in_bounds(row + d_row, col + d_col):
+                        yield row + d_row, col + d_col
+
+    def find(self, char: str) -> tuple[int, int]:
+        """
+        Find the first cell holding a character.
+
+        Args:
+            char (str): The character to look for.
+
+        Returns:
+            tuple[int, int]: The position of the cell, or (-1, -1) if there is none.
+        """
+        return next(self.find_all(char), (-1, -1))
+
+    def find_all(self, char: str) -> Iterator[tuple[int, int]]:
+        """
+        Iterate over the cells holding a character, row by row.
+
+        Args:
+            char (str): The character to look for.
+
+        Yields:
+            tuple[int, int]: The positions of the cells.
+        """
+        for match in re.finditer(re.escape(char.encode("ascii")), self.cells):
+            yield divmod(match.start(), self.width)
+
+
+@contextlib.contextmanager
+def share_grid(grid: Grid) -> Iterator[SharedGrid]:
+    """
+    Copy a grid once into shared memory, so that worker processes can attach to it instead of
+    receiving a pickled copy with every task.
+
+    The shared memory is released when the with block exits, even if it raises.
+
+    Args:
+        grid (Grid): The grid to share.
+
+    Yields:
+        SharedGrid: The handle that workers pass to attach_grid.
+    """
+    # Imported here, as multiprocessing would add to the import time of every day.
+    from multiprocessing import shared_memory  # pylint: disable=import-outside-toplevel
+
+    shared = shared_memory.SharedMemory(create=True, size=max(len(grid.cells), 1))
+    try:
+        shared.buf[: len(grid.cells)] = grid.cells
+        yield shared.name, grid.width, grid.height
+    finally:
+        shared.close()
+        shared.unlink()
+
+
+@contextlib.contextmanager
+def attach_grid(handle: SharedGrid) -> Iterator[Grid]:
+    """
+    Attach to a grid shared by share_grid and yield a zero-copy, read-only view of it.
+
+    The grid is only valid inside the with block.
+
+    Args:
+        handle (SharedGrid): The handle of the shared grid.
+
+    Yields:
+        Grid: The shared grid.
+    """
+    from multiprocessing import shared_memory  # pylint: disable=import-outside-toplevel
+
+    name, width, height = handle
+    shared = shared_memory.SharedMemory(name=name)
+    view = shared.buf[: width * height].toreadonly()
+    try:
+        yield Grid(view, width)
+    finally:
+        view.release()
+        shared.close()